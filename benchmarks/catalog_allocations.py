@@ -0,0 +1,85 @@
+# benchmarks/catalog_allocations.py
+"""
+Allocation benchmark for the shared job catalog in utils/recommender.py
+
+Compares advanced_recommender with the catalog rebuilt on every call (the old
+behaviour) against the module-level read-only JOB_CATALOG.
+
+Usage:
+    python benchmarks/catalog_allocations.py [--calls 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import recommender
+from utils.catalog import get_section, thaw
+
+SAMPLE_SKILLS = ["Python", "SQL", "statistics", "security", "engineering"]
+SAMPLE_FIELDS = list(recommender.JOB_CATALOG.keys())
+
+def rebuild_job_mapping() -> dict:
+    """The old behaviour: a fresh mutable copy of the job mapping on every call"""
+    return thaw(get_section("job_mapping"))
+
+def measure(calls: int) -> dict:
+    """Time `calls` recommendations and record the peak traced memory of one call"""
+    recommender.advanced_recommender(SAMPLE_SKILLS, SAMPLE_FIELDS, 3)  # warm-up
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        recommender.advanced_recommender(SAMPLE_SKILLS, SAMPLE_FIELDS, 3)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    recommender.advanced_recommender(SAMPLE_SKILLS, SAMPLE_FIELDS, 3)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"per_call_us": elapsed / calls * 1e6, "peak_bytes": peak}
+
+def count_catalog_allocations(calls: int, builder) -> int:
+    """Allocated blocks from building the catalog alone, per call"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [builder() for _ in range(calls)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del kept
+    return sum(stat.count_diff for stat in after.compare_to(before, "filename")) // calls
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"advanced_recommender x {args.calls} over {len(SAMPLE_FIELDS)} fields")
+
+    shared = measure(args.calls)
+
+    # Rebuild only the catalog; keep the shared skill index so the comparison isolates it
+    original_mapping, original_index = recommender.get_enhanced_job_mapping, recommender.get_skill_index
+    shared_index = original_index()
+    recommender.get_enhanced_job_mapping = rebuild_job_mapping
+    recommender.get_skill_index = lambda job_mapping=None: shared_index
+    try:
+        rebuilt = measure(args.calls)
+    finally:
+        recommender.get_enhanced_job_mapping = original_mapping
+        recommender.get_skill_index = original_index
+
+    rebuilt_blocks = count_catalog_allocations(args.calls, rebuild_job_mapping)
+    shared_blocks = count_catalog_allocations(args.calls, recommender.get_enhanced_job_mapping)
+
+    print(f"{'':24}{'rebuilt':>12}{'shared':>12}")
+    print(f"{'catalog blocks / call':24}{rebuilt_blocks:>12}{shared_blocks:>12}")
+    print(f"{'peak bytes / call':24}{rebuilt['peak_bytes']:>12}{shared['peak_bytes']:>12}")
+    print(f"{'time / call (us)':24}{rebuilt['per_call_us']:>12.1f}{shared['per_call_us']:>12.1f}")
+
+if __name__ == "__main__":
+    main()
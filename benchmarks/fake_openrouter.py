@@ -0,0 +1,182 @@
+# benchmarks/fake_openrouter.py
+"""
+Local stand-in for the OpenRouter chat completions endpoint
+
+Serves OpenAI-compatible responses with configurable latency. It streams
+chat.completion.chunk events over SSE when the request has "stream": true, and
+returns one JSON body after the full generation delay otherwise.
+
+Usage:
+    # serve, then point the chat page at it
+    python benchmarks/fake_openrouter.py --port 8765
+    OPENROUTER_API_URL=http://127.0.0.1:8765/api/v1/chat/completions OPENROUTER_API_KEY=dev streamlit run main.py
+
+    # measure time-to-first-token, streaming vs blocking
+    python benchmarks/fake_openrouter.py --measure
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ANSWER = (
+    "Great question! To move into {topic}, start with the fundamentals, build two or three "
+    "portfolio projects, and earn one recognised certification. Most people make the switch "
+    "in 6-12 months with 10-15 hours of study per week. Network in local communities and "
+    "tailor your CV to highlight transferable skills."
+)
+
+def make_handler(config: dict):
+    class FakeOpenRouterHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            if config.get("verbose"):
+                super().log_message(format, *args)
+
+        def _tokens(self, body: dict):
+            messages = body.get("messages") or [{}]
+            topic = (messages[-1].get("content") or "tech")[:60]
+            words = ANSWER.format(topic=topic).split(" ")
+            return [word if i == 0 else " " + word for i, word in enumerate(words)][:config["tokens"]]
+
+        def _send_json(self, status: int, payload: dict):
+            data = json.dumps(payload).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+
+            if random.random() < config["error_rate"]:
+                self._send_json(config["error_status"], {"error": {"message": "simulated upstream error",
+                                                                   "code": config["error_status"]}})
+                return
+
+            tokens = self._tokens(body)
+            if not body.get("stream"):
+                time.sleep(config["first_token_delay"] + config["token_delay"] * len(tokens))
+                self._send_json(200, {
+                    "id": "gen-fake", "object": "chat.completion", "model": body.get("model"),
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(tokens)},
+                                 "finish_reason": "stop"}]
+                })
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+
+            def send(text: str):
+                self.wfile.write(text.encode("utf-8"))
+                self.wfile.flush()
+
+            send(": OPENROUTER PROCESSING\n\n")
+            time.sleep(config["first_token_delay"])
+            for token in tokens:
+                chunk = {"id": "gen-fake", "object": "chat.completion.chunk", "model": body.get("model"),
+                         "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                send(f"data: {json.dumps(chunk)}\n\n")
+                time.sleep(config["token_delay"])
+            send("data: [DONE]\n\n")
+
+    return FakeOpenRouterHandler
+
+def start_server(port: int = 0, **config) -> ThreadingHTTPServer:
+    """Start the fake server on a background thread; port 0 picks a free port"""
+    defaults = {"token_delay": 0.03, "first_token_delay": 0.2, "tokens": 60,
+                "error_rate": 0.0, "error_status": 503, "verbose": False}
+    defaults.update(config)
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(defaults))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def server_url(server: ThreadingHTTPServer) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/api/v1/chat/completions"
+
+def measure(runs: int, **config):
+    """Compare time-to-first-token for streaming and blocking requests"""
+    import httpx
+
+    from utils.chat_client import build_headers, build_payload
+    from utils.chat_gateway import ChatGateway
+
+    server = start_server(**config)
+    url = server_url(server)
+    messages = [{"role": "user", "content": "How do I move into data science?"}]
+
+    gateway = ChatGateway()
+
+    blocking, first_token, streamed_total = [], [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        httpx.post(url, headers=build_headers("dev"), json=build_payload(messages, stream=False),
+                   timeout=30.0).raise_for_status()
+        blocking.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        first = None
+        for _token in gateway.stream(messages, "dev", url):
+            if first is None:
+                first = time.perf_counter() - start
+        first_token.append(first)
+        streamed_total.append(time.perf_counter() - start)
+    gateway.close()
+    server.shutdown()
+
+    avg = lambda values: sum(values) / len(values)
+    print(f"{'':28}{'seconds':>10}")
+    print(f"{'blocking: first paint':28}{avg(blocking):>10.3f}")
+    print(f"{'streaming: first token':28}{avg(first_token):>10.3f}")
+    print(f"{'streaming: full answer':28}{avg(streamed_total):>10.3f}")
+
+    stats = gateway.stats()
+    print("\ngateway latency (p50 / p95 seconds)")
+    for series in ("response_headers", "first_token", "stream"):
+        if series in stats:
+            print(f"  {series:26}{stats[series]['p50']:>8.3f}{stats[series]['p95']:>8.3f}")
+    print(f"  counters: {stats['counters']}, circuit {stats['circuit']}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--token-delay", type=float, default=0.03, help="Seconds between tokens")
+    parser.add_argument("--first-token-delay", type=float, default=0.2, help="Seconds before the first token")
+    parser.add_argument("--tokens", type=int, default=60, help="Tokens per answer")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503, help="Status code for simulated errors")
+    parser.add_argument("--measure", action="store_true", help="Run a TTFT comparison and exit")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    config = {"token_delay": args.token_delay, "first_token_delay": args.first_token_delay,
+              "tokens": args.tokens, "error_rate": args.error_rate, "error_status": args.error_status,
+              "verbose": args.verbose}
+    if args.measure:
+        measure(args.runs, **config)
+        return
+
+    server = start_server(args.port, **config)
+    print(f"Fake OpenRouter listening on {server_url(server)} (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
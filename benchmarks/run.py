@@ -0,0 +1,346 @@
+# benchmarks/run.py
+"""
+Benchmark suite for the recommender, readiness, simulation and Indonesia utilities
+
+Each benchmark is timed at 1, 1k and 100k synthetic inputs and the results are
+written to benchmarks/results/<label>.json. Pass --compare with an earlier
+results file to print the change per benchmark and flag regressions.
+
+Usage:
+    python benchmarks/run.py [--sizes 1,1000,100000] [--label v1.2] [--compare benchmarks/results/v1.1.json]
+
+Benchmarks whose dependencies are missing (e.g. streamlit/plotly for the
+Indonesia helpers) are reported as skipped. Chart rendering is capped at 1k
+inputs unless --full is given.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.catalog import get_section
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+DEFAULT_SIZES = [1, 1000, 100000]
+
+SKILL_POOL = [
+    "Python", "SQL", "Machine Learning", "Statistics", "Excel", "Leadership", "Communication",
+    "Docker", "AWS", "Network Security", "Solidity", "JavaScript", "TensorFlow", "Tableau",
+    "Project Management", "Risk Assessment", "Linux", "Git", "Problem Solving", "Pandas"
+]
+CERT_POOL = ["AWS Certified", "CISSP", "PMP", "Google Data Analytics", "CompTIA Security+"]
+ROLES = ["", "Data Analyst", "Software Engineer", "Accountant", "Teacher", "IT Support"]
+# Taken from the catalog and the app's option lists so every input hits a real key
+FIELDS = list(get_section("job_mapping"))
+INDONESIA_FIELDS = list(get_section("indonesia")["salary_data"])
+INDONESIA_CITIES = list(get_section("indonesia")["tech_cities"])
+
+# Synthetic input generators
+def make_profiles(n: int, seed: int = 42) -> List[Dict]:
+    """Random profiles shaped like utils/pipeline.normalize_profile output"""
+    # The Skill Gap page offers exactly the urgencies the readiness engine weighs
+    from utils.future_readiness import URGENCY_FACTORS
+
+    urgencies = list(URGENCY_FACTORS)
+    rng = random.Random(seed)
+    profiles = []
+    for i in range(n):
+        core = rng.sample(SKILL_POOL, rng.randint(2, 8))
+        profiles.append({
+            "id": i,
+            "skills": core,
+            "core_skills": core,
+            "tools": rng.sample(SKILL_POOL, rng.randint(0, 3)),
+            "soft_skills": rng.sample(SKILL_POOL, rng.randint(0, 3)),
+            "certifications": rng.sample(CERT_POOL, rng.randint(0, 2)),
+            "interest_fields": rng.sample(FIELDS, rng.randint(1, 3)),
+            "years_experience": rng.randint(0, 20),
+            "weekly_learning_hours": rng.choice([5, 10, 15, 20, 30]),
+            "career_urgency": rng.choice(urgencies),
+            "current_role": rng.choice(ROLES),
+        })
+    return profiles
+
+def make_salaries(n: int, seed: int = 42) -> List[int]:
+    """Annual IDR salaries spanning every PPh 21 bracket"""
+    rng = random.Random(seed)
+    return [rng.randint(30_000_000, 1_500_000_000) for _ in range(n)]
+
+def make_simulation_params(n: int, seed: int = 42) -> List[Dict]:
+    """User parameters as built by the Career Simulation page"""
+    rng = random.Random(seed)
+    return [{
+        "experience_level": rng.choice([0, 1, 2]),
+        "time_commitment": rng.choice([0.4, 1.0, 1.6]),
+        "budget_factor": rng.uniform(0.3, 3.0),
+        "current_salary": rng.randint(30000, 120000),
+    } for _ in range(n)]
+
+# Benchmarks: each returns (setup(n) -> inputs, run(inputs)) or raises ImportError
+def bench_advanced_recommender():
+    from utils.recommender import advanced_recommender
+
+    def run(profiles):
+        for p in profiles:
+            advanced_recommender(p["skills"], p["interest_fields"], p["years_experience"])
+    return make_profiles, run
+
+def bench_advanced_recommender_batch():
+    from utils.recommender import advanced_recommender_batch
+    return make_profiles, advanced_recommender_batch
+
+def bench_calculate_advanced_readiness_score():
+    from utils.future_readiness import SKILL_CATEGORIES, calculate_advanced_readiness_score
+
+    def run(profiles):
+        for p in profiles:
+            calculate_advanced_readiness_score(
+                {cat: p[cat] for cat in SKILL_CATEGORIES}, p["interest_fields"], p["years_experience"],
+                p["weekly_learning_hours"], p["career_urgency"], p["current_role"]
+            )
+    return make_profiles, run
+
+def bench_readiness_engine():
+    from utils.future_readiness import ReadinessEngine
+    engine = ReadinessEngine()
+    return make_profiles, engine.score_profiles
+
+def bench_calculate_skill_category_score():
+    from utils.future_readiness import calculate_skill_category_score, get_enhanced_skill_weights
+    required = get_enhanced_skill_weights()["Artificial Intelligence"]["core_skills"]
+
+    def run(profiles):
+        for p in profiles:
+            calculate_skill_category_score(p["core_skills"], required, 0.4)
+    return make_profiles, run
+
+def bench_simulate_career_path():
+    from utils.simulation import get_scenarios, simulate_career_path
+    scenarios = list(get_scenarios().values())
+
+    def run(params):
+        for i, user_params in enumerate(params):
+            simulate_career_path(scenarios[i % len(scenarios)], user_params)
+    return make_simulation_params, run
+
+def bench_monte_carlo_simulation():
+    from utils.simulation import get_scenarios, monte_carlo_simulation
+    scenarios = list(get_scenarios().values())
+
+    def setup(n):
+        return make_simulation_params(1)[0], n
+
+    def run(inputs):
+        user_params, n = inputs
+        for i, scenario in enumerate(scenarios):
+            monte_carlo_simulation(scenario, user_params, n_trajectories=n, seed=i)
+    return setup, run
+
+def bench_indonesia_pph21_calculator():
+    from indonesia_career_data import indonesia_pph21_calculator
+
+    def run(salaries):
+        for salary in salaries:
+            indonesia_pph21_calculator(salary)
+    return make_salaries, run
+
+def bench_indonesia_pph21_batch():
+    from indonesia_career_data import indonesia_pph21_batch
+    return make_salaries, indonesia_pph21_batch
+
+def bench_create_indonesia_salary_chart():
+    from indonesia_career_data import create_indonesia_salary_chart
+
+    def setup(n):
+        rng = random.Random(42)
+        return [(rng.choice(INDONESIA_FIELDS), rng.choice(INDONESIA_CITIES)) for _ in range(n)]
+
+    def run(pairs):
+        for field, city in pairs:
+            create_indonesia_salary_chart(field, city)
+    return setup, run
+
+def bench_cached_indonesia_salary_chart():
+    from indonesia_career_data import create_indonesia_salary_chart
+    from utils.figure_cache import cached_figure
+
+    def setup(n):
+        rng = random.Random(42)
+        return [(rng.choice(INDONESIA_FIELDS), rng.choice(INDONESIA_CITIES)) for _ in range(n)]
+
+    def run(pairs):
+        for field, city in pairs:
+            cached_figure(create_indonesia_salary_chart, field, city).to_dict()
+    return setup, run
+
+def make_bundle_names(n: int, seed: int = 42) -> List[str]:
+    """Page stylesheet bundles in the order a user might visit them"""
+    from utils.fragments import STYLE_BUNDLES
+    rng = random.Random(seed)
+    return [rng.choice(sorted(STYLE_BUNDLES)) for _ in range(n)]
+
+def bench_minify_style_bundle():
+    from utils.fragments import STYLE_BUNDLES, STYLES_DIR, hoist_imports, minify_css
+
+    def run(names):
+        # Cost of a bundle without the registry: read and minify every sheet
+        for name in names:
+            css = ""
+            for sheet in STYLE_BUNDLES[name]:
+                with open(os.path.join(STYLES_DIR, f"{sheet}.css"), encoding="utf-8") as f:
+                    css += minify_css(f.read())
+            hoist_imports(css)
+    return make_bundle_names, run
+
+def bench_style_html():
+    from utils.fragments import style_html
+
+    def run(names):
+        for name in names:
+            style_html(name)
+    return make_bundle_names, run
+
+# name -> (factory, max size without --full)
+BENCHMARKS: Dict[str, tuple] = {
+    "advanced_recommender": (bench_advanced_recommender, None),
+    "advanced_recommender_batch": (bench_advanced_recommender_batch, None),
+    "calculate_advanced_readiness_score": (bench_calculate_advanced_readiness_score, None),
+    "ReadinessEngine.score_profiles": (bench_readiness_engine, None),
+    "calculate_skill_category_score": (bench_calculate_skill_category_score, None),
+    "simulate_career_path": (bench_simulate_career_path, None),
+    "monte_carlo_simulation": (bench_monte_carlo_simulation, None),
+    "indonesia_pph21_calculator": (bench_indonesia_pph21_calculator, None),
+    "indonesia_pph21_batch": (bench_indonesia_pph21_batch, None),
+    "create_indonesia_salary_chart": (bench_create_indonesia_salary_chart, 1000),
+    "cached_indonesia_salary_chart": (bench_cached_indonesia_salary_chart, None),
+    "minify_style_bundle": (bench_minify_style_bundle, 1000),
+    "style_html": (bench_style_html, None),
+}
+
+def time_call(run: Callable, inputs, repeat: int) -> List[float]:
+    """Wall-clock seconds for `repeat` runs over the same inputs"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(inputs)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def run_suite(sizes: List[int], selected: List[str], repeat: int, full: bool) -> Dict:
+    results = {}
+    for name in selected:
+        factory, max_size = BENCHMARKS[name]
+        try:
+            setup, run = factory()
+        except ImportError as e:
+            print(f"{name:38} skipped ({e})")
+            results[name] = {"skipped": str(e)}
+            continue
+
+        results[name] = {}
+        for size in sizes:
+            if max_size is not None and size > max_size and not full:
+                print(f"{name:38}{size:>8}  skipped (over {max_size}, use --full)")
+                continue
+            inputs = setup(size)
+            run(setup(1))  # warm caches and lazy imports outside the timing
+            # Large inputs are timed once; small ones take the best of `repeat`
+            timings = time_call(run, inputs, 1 if size >= 100000 else repeat)
+            best = min(timings)
+            results[name][str(size)] = {
+                "seconds": best,
+                "per_item_us": best / size * 1e6,
+                "runs": len(timings),
+            }
+            print(f"{name:38}{size:>8}{best:>12.4f}s{best / size * 1e6:>12.2f} us/item")
+    return results
+
+def environment() -> Dict:
+    """Interpreter, library versions and commit the results were produced with"""
+    info = {"python": platform.python_version(), "platform": platform.platform()}
+    for module in ("numpy", "pandas", "scipy", "plotly"):
+        try:
+            info[module] = __import__(module).__version__
+        except ImportError:
+            info[module] = None
+    try:
+        info["commit"] = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        info["commit"] = None
+    return info
+
+def compare(current: Dict, baseline_path: str, threshold: float) -> List[str]:
+    """Print per-benchmark change against a previous results file; returns regressions"""
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = json.load(handle)["results"]
+
+    regressions = []
+    print(f"\nCompared with {baseline_path} (regression threshold {threshold:.0%})")
+    for name, sizes in current.items():
+        for size, stats in sizes.items():
+            if not isinstance(stats, dict) or "seconds" not in stats:
+                continue
+            before = baseline.get(name, {}).get(size, {})
+            if "seconds" not in before:
+                continue
+            change = stats["seconds"] / before["seconds"] - 1
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions.append(f"{name}[{size}]")
+            print(f"{name:38}{size:>8}{change:>+10.1%}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated input sizes")
+    parser.add_argument("--only", default=None, help="Comma-separated benchmark names to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size below 100k (best is kept)")
+    parser.add_argument("--full", action="store_true", help="Ignore per-benchmark size caps")
+    parser.add_argument("--label", default=None, help="Results file name (default: timestamp)")
+    parser.add_argument("--compare", default=None, help="Previous results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Slowdown flagged as a regression")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+    selected = [s.strip() for s in args.only.split(",")] if args.only else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+
+    results = run_suite(sizes, selected, args.repeat, args.full)
+
+    label = args.label or datetime.now().strftime("%Y%m%d-%H%M%S")
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    output_path = os.path.join(RESULTS_DIR, f"{label}.json")
+    with open(output_path, "w", encoding="utf-8") as handle:
+        json.dump({
+            "label": label,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "environment": environment(),
+            "sizes": sizes,
+            "results": results,
+        }, handle, indent=2)
+    print(f"\nSaved {output_path}")
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
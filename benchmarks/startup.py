@@ -0,0 +1,101 @@
+# benchmarks/startup.py
+"""
+Cold-start import report for main.py and the pages
+
+Runs each script in a fresh interpreter under `python -X importtime` and
+summarizes the output: total import time and the heaviest top-level packages.
+Whether the chart/data libraries were loaded is read from sys.modules once the
+script has run, so imports made through lazy_import/importlib count as well.
+
+Usage:
+    python benchmarks/startup.py [main.py pages/2_Skill_Gap_Analysis.py ...] [--top 10] [--render]
+
+By default only the module body runs (imports, page config, CSS). --render also
+calls main(), which draws the page in Streamlit's bare mode.
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_TARGETS = ["main.py"] + sorted(
+    os.path.join("pages", name) for name in os.listdir(os.path.join(ROOT, "pages")) if name.endswith(".py")
+)
+WATCHED = ["streamlit", "pandas", "numpy", "plotly.express", "scipy", "sklearn", "httpx"]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+LOADED_MARKER = "startup-loaded: "
+
+RUNNER = """
+import json, runpy, sys
+sys.path.insert(0, {root!r})
+try:
+    runpy.run_path({path!r}, run_name={run_name!r})
+finally:
+    print({marker!r} + json.dumps(sorted(m for m in {watched!r} if m in sys.modules)), flush=True)
+"""
+
+def profile_script(path: str, render: bool) -> Dict:
+    """Run one script under -X importtime and parse the report"""
+    code = RUNNER.format(root=ROOT, path=os.path.join(ROOT, path), run_name="__main__" if render else "__startup__",
+                         marker=LOADED_MARKER, watched=WATCHED)
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    wall = time.perf_counter() - start
+
+    by_package = defaultdict(int)
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, name = int(match.group(1)), match.group(4)
+        root_package = name.split(".")[0]
+        by_package[root_package] += self_us
+        total_us += self_us
+
+    loaded = set()
+    for line in proc.stdout.splitlines():
+        if line.startswith(LOADED_MARKER):
+            loaded = set(json.loads(line[len(LOADED_MARKER):]))
+
+    return {
+        "returncode": proc.returncode,
+        "wall_s": wall,
+        "import_s": total_us / 1e6,
+        "by_package": dict(by_package),
+        "loaded": loaded,
+    }
+
+def print_report(path: str, report: Dict, top: int):
+    status = "" if report["returncode"] == 0 else f"  (exit {report['returncode']})"
+    print(f"\n{path}{status}")
+    print(f"  wall {report['wall_s']:.2f}s, imports {report['import_s']:.2f}s")
+    print("  loaded: " + ", ".join(
+        f"{name}{'' if name in report['loaded'] else ' (no)'}" for name in WATCHED
+    ))
+    heaviest = sorted(report["by_package"].items(), key=lambda item: item[1], reverse=True)[:top]
+    for name, self_us in heaviest:
+        print(f"  {name:28}{self_us / 1000:>10.1f} ms")
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("targets", nargs="*", default=DEFAULT_TARGETS, help="Scripts relative to the repo root")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest packages to list per script")
+    parser.add_argument("--render", action="store_true", help="Also run main() to draw the page")
+    args = parser.parse_args(argv)
+
+    for path in args.targets:
+        print_report(path, profile_script(path, args.render), args.top)
+
+if __name__ == "__main__":
+    main()
@@ -6,201 +6,70 @@ For production use, integrate with real market research data from sources like:
 - Michael Page Salary Guide, Hays Salary Survey, JobStreet reports, etc.
 """
 
+from __future__ import annotations
+
+import argparse
 import streamlit as st
-import pandas as pd
+from bisect import bisect_left
 from datetime import datetime
-import plotly.express as px
-import plotly.graph_objects as go
-
-# Indonesian Salary Data (2024-2025) - From your roadmap
-INDONESIA_SALARY_DATA = {
-    "Artificial Intelligence": {
-        "entry_level": {"min": 8000000, "max": 15000000},
-        "mid_level": {"min": 15000000, "max": 35000000}, 
-        "senior_level": {"min": 35000000, "max": 80000000},
-        "expert_level": {"min": 80000000, "max": 150000000}
-    },
-    "Data Science": {
-        "entry_level": {"min": 7000000, "max": 12000000},
-        "mid_level": {"min": 12000000, "max": 25000000},
-        "senior_level": {"min": 25000000, "max": 60000000},
-        "expert_level": {"min": 60000000, "max": 120000000}
-    },
-    "Cybersecurity": {
-        "entry_level": {"min": 6000000, "max": 10000000},
-        "mid_level": {"min": 10000000, "max": 20000000},
-        "senior_level": {"min": 20000000, "max": 50000000},
-        "expert_level": {"min": 50000000, "max": 100000000}
-    },
-    "Software Engineering": {
-        "entry_level": {"min": 6000000, "max": 12000000},
-        "mid_level": {"min": 12000000, "max": 25000000},
-        "senior_level": {"min": 25000000, "max": 55000000},
-        "expert_level": {"min": 55000000, "max": 120000000}
-    },
-    "Product Management": {
-        "entry_level": {"min": 8000000, "max": 15000000},
-        "mid_level": {"min": 15000000, "max": 30000000},
-        "senior_level": {"min": 30000000, "max": 65000000},
-        "expert_level": {"min": 65000000, "max": 130000000}
-    },
-    "UI/UX Design": {
-        "entry_level": {"min": 5000000, "max": 10000000},
-        "mid_level": {"min": 10000000, "max": 20000000},
-        "senior_level": {"min": 20000000, "max": 45000000},
-        "expert_level": {"min": 45000000, "max": 85000000}
-    }
-}
+from functools import lru_cache
+from itertools import accumulate
 
-# Indonesian Tech Cities Data
-INDONESIA_TECH_CITIES = {
-    "Jakarta": {
-        "companies": 150,
-        "avg_salary_multiplier": 1.0,
-        "remote_culture": "85%",
-        "description": "Pusat ekonomi digital Indonesia",
-        "cost_of_living_index": 1.0
-    },
-    "Bandung": {
-        "companies": 80,
-        "avg_salary_multiplier": 0.8,
-        "remote_culture": "90%", 
-        "description": "Silicon Valley Indonesia",
-        "cost_of_living_index": 0.7
-    },
-    "Surabaya": {
-        "companies": 45,
-        "avg_salary_multiplier": 0.75,
-        "remote_culture": "70%",
-        "description": "Hub industri Jawa Timur",
-        "cost_of_living_index": 0.65
-    },
-    "Yogyakarta": {
-        "companies": 35,
-        "avg_salary_multiplier": 0.7,
-        "remote_culture": "80%",
-        "description": "Pusat startup kreatif",
-        "cost_of_living_index": 0.6
-    },
-    "Bali": {
-        "companies": 30,
-        "avg_salary_multiplier": 0.9,
-        "remote_culture": "95%",
-        "description": "Digital nomad paradise",
-        "cost_of_living_index": 0.8
-    }
-}
+from utils.catalog import current_snapshot, register_index
+from utils.lazy_imports import lazy_import
 
-# Indonesian Tech Companies
-INDONESIA_COMPANIES = {
-    "Unicorn": ["Gojek", "Tokopedia", "Bukalapak", "Traveloka", "OVO"],
-    "Decacorn": ["Shopee Indonesia", "Grab Indonesia"],
-    "Scale-up": ["Ajaib", "Xendit", "Midtrans", "Koinworks", "Stockbit", "Flip", "DANA"],
-    "Multinational": ["Google Indonesia", "Microsoft Indonesia", "Amazon Web Services", "Meta Indonesia"],
-    "Banks Digital": ["Jenius", "Digibank", "Blu BCA", "Jago", "Seabank"],
-    "E-commerce": ["Blibli", "Zalora", "Bhinneka", "JD.ID", "Lazada Indonesia"]
-}
+# Plotly is only needed once a chart is drawn; NumPy once an array function runs
+go = lazy_import("plotly.graph_objects")
+pd = lazy_import("pandas")
+np = lazy_import("numpy")
 
-# Learning Resources Indonesia
-INDONESIA_LEARNING = {
-    "Bootcamp": {
-        "Hacktiv8": {"focus": "Full-stack development, Data Science", "duration": "3-6 bulan", "price": "Rp 15-35 juta"},
-        "Purwadhika": {"focus": "Digital Technology School", "duration": "3-4 bulan", "price": "Rp 12-25 juta"},
-        "Algoritma": {"focus": "Data Science & AI", "duration": "2-4 bulan", "price": "Rp 8-20 juta"},
-        "Binar Academy": {"focus": "Software development", "duration": "4-6 bulan", "price": "Rp 10-30 juta"},
-        "Dicoding": {"focus": "Mobile & Web development", "duration": "1-3 bulan", "price": "Rp 2-8 juta"}
-    },
-    "Universities": [
-        "Institut Teknologi Bandung (ITB)",
-        "Universitas Indonesia (UI)", 
-        "Institut Teknologi Sepuluh Nopember (ITS)",
-        "Universitas Gadjah Mada (UGM)",
-        "Binus University",
-        "Telkom University"
-    ],
-    "Communities": [
-        "Indonesia Android Kejar (IAK)",
-        "JakartaJS",
-        "Python Indonesia", 
-        "React Indonesia",
-        "AI/ML Indonesia",
-        "Women in Tech Indonesia"
-    ]
+# Market data lives in data/catalog.json and follows catalog hot reloads:
+# the module-level names below resolve against the live snapshot on each access
+_CATALOG_KEYS = {
+    "INDONESIA_SALARY_DATA": "salary_data",              # Indonesian Salary Data (2024-2025)
+    "INDONESIA_TECH_CITIES": "tech_cities",              # Indonesian Tech Cities Data
+    "INDONESIA_COMPANIES": "companies",                  # Indonesian Tech Companies
+    "INDONESIA_LEARNING": "learning",                    # Learning Resources Indonesia
+    "INDONESIA_SUCCESS_STORIES": "success_stories",      # Success Stories
+    "GOVERNMENT_PROGRAMS": "government_programs",        # Government Programs
+    "TRANSLATIONS": "translations"                       # Bahasa Indonesia Translations
 }
 
-# Success Stories
-INDONESIA_SUCCESS_STORIES = [
-    {
-        "name": "Andi Pratama",
-        "from": "Bank Teller",
-        "to": "Data Scientist at GoPang", 
-        "duration": "10 bulan",
-        "training": "Algoritma Data Science + Coursera",
-        "salary_increase": "300%",
-        "story": "Dari teller bank dengan gaji Rp 4 juta menjadi Data Scientist dengan gaji Rp 15 juta di GoPang"
-    },
-    {
-        "name": "Sari Dewi", 
-        "from": "Marketing Executive",
-        "to": "Product Manager at Sotoypedia",
-        "duration": "8 bulan",
-        "training": "Google PM Certificate + Hacktiv8",
-        "salary_increase": "250%",
-        "story": "Transisi dari marketing tradisional ke Product Manager tech dengan bantuan bootcamp lokal"
-    },
-    {
-        "name": "Budi Santoso",
-        "from": "Guru SMA",
-        "to": "Cybersecurity Analyst at ABC Digital",
-        "duration": "12 bulan",
-        "training": "Self-learning + Dicoding + CISSP",
-        "salary_increase": "200%", 
-        "story": "Dari mengajar di sekolah menjadi cybersecurity professional di bank digital"
-    }
-]
+def get_indonesia_data(key):
+    """Indonesia market data (e.g. 'tech_cities') as plain dicts from the live catalog"""
+    return current_snapshot().plain("indonesia")[key]
 
-# Government Programs
-GOVERNMENT_PROGRAMS = {
-    "Kartu Prakerja": {
-        "description": "Program pelatihan dan sertifikasi gratis",
-        "budget": "Rp 3.5 juta per peserta",
-        "focus": "Digital skills, programming, data analysis"
-    },
-    "Digital Talent Scholarship": {
-        "description": "Beasiswa dari Kemkominfo",
-        "categories": ["Fresh Graduate", "Professional Development"],
-        "focus": "AI, Cybersecurity, Big Data, Cloud Computing"
-    },
-    "Beasiswa LPDP": {
-        "description": "Beasiswa pendidikan tinggi",
-        "coverage": "S2/S3 dalam dan luar negeri",
-        "focus": "Technology and Engineering"
-    }
-}
+def get_indonesia_salary_data():
+    """Salary bands per career field and level from the live catalog"""
+    return get_indonesia_data("salary_data")
 
-# Bahasa Indonesia Translations
-TRANSLATIONS = {
-    "id": {
-        "career_simulation": "Simulasi Karir",
-        "skill_analysis": "Analisis Keahlian", 
-        "ai_assistant": "Asisten AI",
-        "salary_range": "Kisaran Gaji",
-        "job_growth": "Pertumbuhan Pekerjaan",
-        "start_analysis": "Mulai Analisis",
-        "your_profile": "Profil Anda",
-        "recommendations": "Rekomendasi",
-        "current_role": "Peran Saat Ini",
-        "target_role": "Target Karir",
-        "experience_level": "Level Pengalaman",
-        "preferred_city": "Kota Pilihan",
-        "learning_budget": "Budget Pembelajaran",
-        "timeline": "Timeline Transisi",
-        "companies": "Perusahaan",
-        "salary_projection": "Proyeksi Gaji",
-        "learning_path": "Jalur Pembelajaran",
-        "success_stories": "Kisah Sukses"
-    }
-}
+def __getattr__(name):
+    if name in _CATALOG_KEYS:
+        return get_indonesia_data(_CATALOG_KEYS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+SALARY_LEVELS = ["entry_level", "mid_level", "senior_level", "expert_level"]
+
+# Simplified PPh 21 (2024 rates): tax-free allowance, then (lower bound of taxable income, rate) per bracket
+PPH21_PTKP = 54000000
+PPH21_BRACKETS = (
+    (0, 0.05),
+    (60000000, 0.15),
+    (250000000, 0.25),
+    (500000000, 0.30),
+)
+_BRACKET_LOWER_LIST = [float(lower) for lower, _ in PPH21_BRACKETS]
+# Tax owed on everything below each bracket's lower bound
+_BRACKET_BASE_LIST = list(accumulate(
+    ((upper - lower) * rate for (lower, rate), (upper, _) in zip(PPH21_BRACKETS, PPH21_BRACKETS[1:])),
+    initial=0.0
+))
+
+@lru_cache(maxsize=None)
+def _bracket_arrays():
+    """(lower bounds, cumulative base, rates) as arrays, built on the first batch call"""
+    return (np.array(_BRACKET_LOWER_LIST), np.array(_BRACKET_BASE_LIST),
+            np.array([rate for _, rate in PPH21_BRACKETS]))
 
 def format_idr_currency(amount):
     """Format currency in Indonesian Rupiah"""
@@ -213,7 +82,7 @@ def format_idr_currency(amount):
 
 def get_adjusted_salary(base_salary, city):
     """Get salary adjusted for Indonesian city"""
-    multiplier = INDONESIA_TECH_CITIES.get(city, {}).get("avg_salary_multiplier", 1.0)
+    multiplier = get_indonesia_data("tech_cities").get(city, {}).get("avg_salary_multiplier", 1.0)
     return {
         "min": int(base_salary["min"] * multiplier),
         "max": int(base_salary["max"] * multiplier)
@@ -221,29 +90,23 @@ def get_adjusted_salary(base_salary, city):
 
 def calculate_cost_of_living_ratio(salary, city):
     """Calculate salary to cost of living ratio"""
-    col_index = INDONESIA_TECH_CITIES.get(city, {}).get("cost_of_living_index", 1.0)
+    col_index = get_indonesia_data("tech_cities").get(city, {}).get("cost_of_living_index", 1.0)
     return salary / col_index
 
 def create_indonesia_salary_chart(career_field, city="Jakarta"):
     """Create salary progression chart for Indonesian market"""
-    levels = ["entry_level", "mid_level", "senior_level", "expert_level"]
     level_names = ["Entry Level", "Mid Level", "Senior Level", "Expert Level"]
     
-    salary_data = INDONESIA_SALARY_DATA.get(career_field, {})
-    min_salaries = []
-    max_salaries = []
-    avg_salaries = []
-    
-    for level in levels:
-        if level in salary_data:
-            adjusted = get_adjusted_salary(salary_data[level], city)
-            min_salaries.append(adjusted["min"])
-            max_salaries.append(adjusted["max"])
-            avg_salaries.append((adjusted["min"] + adjusted["max"]) / 2)
-        else:
-            min_salaries.append(0)
-            max_salaries.append(0)
-            avg_salaries.append(0)
+    cube = get_salary_cube()
+    if career_field in cube.fields and city in cube.cities:
+        min_salaries = cube.slice("min", career_field, city=city)
+        max_salaries = cube.slice("max", career_field, city=city)
+        avg_salaries = cube.slice("avg", career_field, city=city)
+    else:
+        matrix = indonesia_salary_matrix([career_field], [city])
+        min_salaries = matrix["min"][0, :, 0]
+        max_salaries = matrix["max"][0, :, 0]
+        avg_salaries = matrix["avg"][0, :, 0]
     
     fig = go.Figure()
     
@@ -287,11 +150,89 @@ def create_indonesia_salary_chart(career_field, city="Jakarta"):
     
     return fig
 
+class SalaryCube:
+    """
+    Field × level × city salary table materialized once per catalog snapshot
+
+    `values` is a read-only array indexed (metric, field, level, city) with
+    the metrics in METRICS. All values are IDR: monthly gross min/max/avg,
+    annual gross, PPh 21 tax and net, net monthly, and the average divided by
+    the city's cost-of-living index. Labels map to positions through dicts,
+    so a lookup is a constant-time index instead of a recomputation.
+    """
+
+    METRICS = ("min", "max", "avg", "annual_gross", "annual_tax", "net_annual", "net_monthly", "col_adjusted_avg")
+
+    def __init__(self, salary_data, tech_cities):
+        matrix = _salary_matrix(salary_data, tech_cities)
+        self.fields = tuple(matrix["fields"])
+        self.levels = tuple(matrix["levels"])
+        self.cities = tuple(matrix["cities"])
+        self._positions = tuple({label: i for i, label in enumerate(axis)}
+                                for axis in (self.fields, self.levels, self.cities))
+        self.available = matrix["available"]
+
+        cost_of_living = np.array([tech_cities[city].get("cost_of_living_index", 1.0) for city in self.cities])
+        annual_gross = matrix["avg"] * 12
+        self.values = np.stack([
+            matrix["min"], matrix["max"], matrix["avg"], annual_gross, matrix["annual_tax"],
+            annual_gross - matrix["annual_tax"], matrix["net_monthly"], matrix["avg"] / cost_of_living
+        ])
+        self.values.flags.writeable = False
+        self.available.flags.writeable = False
+
+    def __contains__(self, key) -> bool:
+        field, level, city = key
+        return (field in self._positions[0] and level in self._positions[1] and city in self._positions[2]
+                and bool(self.available[self._positions[0][field], self._positions[1][level]]))
+
+    def get(self, field, level, city):
+        """{metric: value} for one combination, or None when the field has no such level or the city is unknown"""
+        if (field, level, city) not in self:
+            return None
+        i, j, k = (positions[label] for positions, label in zip(self._positions, (field, level, city)))
+        return dict(zip(self.METRICS, self.values[:, i, j, k].tolist()))
+
+    def slice(self, metric, field=None, level=None, city=None):
+        """View of one metric with any given labels fixed, e.g. slice("avg", field, city=city) -> per level"""
+        index = tuple(slice(None) if label is None else positions[label]
+                      for positions, label in zip(self._positions, (field, level, city)))
+        return self.values[(self.METRICS.index(metric),) + index]
+
+    def to_frame(self):
+        """Long-format DataFrame: one row per available field/level/city with a column per metric"""
+        fields, levels, cities = np.meshgrid(np.arange(len(self.fields)), np.arange(len(self.levels)),
+                                             np.arange(len(self.cities)), indexing="ij")
+        mask = np.broadcast_to(self.available[:, :, None], fields.shape)
+        frame = pd.DataFrame({
+            "field": np.array(self.fields, dtype=object)[fields[mask]],
+            "level": np.array(self.levels, dtype=object)[levels[mask]],
+            "city": np.array(self.cities, dtype=object)[cities[mask]],
+        })
+        for metric, values in zip(self.METRICS, self.values):
+            frame[metric] = values[mask]
+        return frame
+
+    def to_parquet(self, path):
+        """Write to_frame() as Parquet (needs pyarrow or fastparquet); returns the path"""
+        self.to_frame().to_parquet(path, index=False)
+        return path
+
+def _build_salary_cube(catalog):
+    indonesia = catalog["indonesia"]
+    return SalaryCube(indonesia["salary_data"], indonesia["tech_cities"])
+
+register_index("indonesia_salary_cube", _build_salary_cube, lazy=True)
+
+def get_salary_cube():
+    """Salary cube for the live catalog snapshot (built on first use, shared by every session)"""
+    return current_snapshot().index("indonesia_salary_cube")
+
 def display_indonesia_companies():
     """Display Indonesian tech companies by category"""
     st.subheader("🏢 Ekosistem Perusahaan Tech Indonesia")
     
-    for category, companies in INDONESIA_COMPANIES.items():
+    for category, companies in get_indonesia_data("companies").items():
         with st.expander(f"{category} ({len(companies)} perusahaan)"):
             cols = st.columns(3)
             for i, company in enumerate(companies):
@@ -302,28 +243,29 @@ def display_learning_resources():
     """Display Indonesian learning resources"""
     st.subheader("🎓 Sumber Belajar Indonesia")
     
+    learning = get_indonesia_data("learning")
     tab1, tab2, tab3 = st.tabs(["Bootcamp", "Universitas", "Komunitas"])
     
     with tab1:
-        for bootcamp, details in INDONESIA_LEARNING["Bootcamp"].items():
+        for bootcamp, details in learning["Bootcamp"].items():
             with st.expander(bootcamp):
                 st.write(f"**Focus:** {details['focus']}")
                 st.write(f"**Durasi:** {details['duration']}")
                 st.write(f"**Biaya:** {details['price']}")
     
     with tab2:
-        for uni in INDONESIA_LEARNING["Universities"]:
+        for uni in learning["Universities"]:
             st.write(f"• {uni}")
     
     with tab3:
-        for community in INDONESIA_LEARNING["Communities"]:
+        for community in learning["Communities"]:
             st.write(f"• {community}")
 
 def display_success_stories():
     """Display Indonesian success stories"""
     st.subheader("🌟 Kisah Sukses Indonesia")
     
-    for story in INDONESIA_SUCCESS_STORIES:
+    for story in get_indonesia_data("success_stories"):
         with st.expander(f"{story['name']}: {story['from']} → {story['to']}"):
             col1, col2 = st.columns(2)
             with col1:
@@ -335,9 +277,10 @@ def display_success_stories():
 
 def create_city_comparison_chart():
     """Create comparison chart of Indonesian tech cities"""
-    cities = list(INDONESIA_TECH_CITIES.keys())
-    companies = [INDONESIA_TECH_CITIES[city]["companies"] for city in cities]
-    salary_mult = [INDONESIA_TECH_CITIES[city]["avg_salary_multiplier"] for city in cities]
+    tech_cities = get_indonesia_data("tech_cities")
+    cities = list(tech_cities.keys())
+    companies = [tech_cities[city]["companies"] for city in cities]
+    salary_mult = [tech_cities[city]["avg_salary_multiplier"] for city in cities]
     
     fig = go.Figure()
     
@@ -368,21 +311,36 @@ def create_city_comparison_chart():
     
     return fig
 
+def pph21_tax(annual_salaries):
+    """
+    Annual PPh 21 tax for an array of annual salaries
+
+    Each taxable income is placed in its bracket with np.searchsorted; the tax
+    is the bracket's cumulative base plus its rate on the remainder.
+    """
+    lower, base, rates = _bracket_arrays()
+    taxable = np.maximum(np.asarray(annual_salaries, dtype=float) - PPH21_PTKP, 0)
+    # side="left" keeps a bracket's upper bound in the lower bracket, as the scalar rules did
+    bracket = np.maximum(np.searchsorted(lower, taxable, side="left") - 1, 0)
+    return base[bracket] + (taxable - lower[bracket]) * rates[bracket]
+
+def indonesia_pph21_batch(annual_salaries):
+    """PPh 21 breakdown for many annual salaries at once (arrays keyed like indonesia_pph21_calculator)"""
+    salaries = np.asarray(annual_salaries, dtype=float)
+    tax = pph21_tax(salaries)
+    return {
+        "annual_tax": tax,
+        "monthly_tax": tax / 12,
+        "net_annual": salaries - tax,
+        "net_monthly": (salaries - tax) / 12
+    }
+
 def indonesia_pph21_calculator(annual_salary):
     """Calculate Indonesian PPh 21 tax"""
-    # Simplified PPh 21 calculation (2024 rates)
-    ptkp = 54000000  # Basic tax-free income
-    taxable_income = max(0, annual_salary - ptkp)
-    
-    # Progressive tax rates
-    if taxable_income <= 60000000:
-        tax = taxable_income * 0.05
-    elif taxable_income <= 250000000:
-        tax = 60000000 * 0.05 + (taxable_income - 60000000) * 0.15
-    elif taxable_income <= 500000000:
-        tax = 60000000 * 0.05 + 190000000 * 0.15 + (taxable_income - 250000000) * 0.25
-    else:
-        tax = 60000000 * 0.05 + 190000000 * 0.15 + 250000000 * 0.25 + (taxable_income - 500000000) * 0.30
+    # Scalar twin of pph21_tax over the same bracket table; bisect avoids NumPy overhead for one value
+    taxable_income = max(0, annual_salary - PPH21_PTKP)
+    bracket = max(bisect_left(_BRACKET_LOWER_LIST, taxable_income) - 1, 0)
+    tax = _BRACKET_BASE_LIST[bracket] + (taxable_income - _BRACKET_LOWER_LIST[bracket]) * PPH21_BRACKETS[bracket][1]
     
     return {
         "annual_tax": tax,
@@ -391,14 +349,95 @@ def indonesia_pph21_calculator(annual_salary):
         "net_monthly": (annual_salary - tax) / 12
     }
 
+def indonesia_salary_matrix(fields=None, cities=None):
+    """
+    City-adjusted salaries, PPh 21 tax and net income for every field × level × city
+
+    Args:
+        fields: Career fields (default: all in the salary data)
+        cities: Cities (default: all tech cities); unknown cities use a 1.0 multiplier
+
+    Returns:
+        {"fields", "levels", "cities"} axis labels plus arrays of shape
+        (fields, levels, cities): min, max and avg monthly gross, annual_tax,
+        monthly_tax and net_monthly (tax on avg × 12), plus an `available`
+        (fields, levels) mask. Levels missing from a field are 0.
+    """
+    return _salary_matrix(get_indonesia_salary_data(), get_indonesia_data("tech_cities"), fields, cities)
+
+def _salary_matrix(salary_data, tech_cities, fields=None, cities=None):
+    fields = list(salary_data) if fields is None else list(fields)
+    cities = list(tech_cities) if cities is None else list(cities)
+
+    base = np.zeros((len(fields), len(SALARY_LEVELS), 2))
+    for i, field in enumerate(fields):
+        for j, level in enumerate(SALARY_LEVELS):
+            band = salary_data.get(field, {}).get(level)
+            if band:
+                base[i, j] = band["min"], band["max"]
+    multipliers = np.array([tech_cities.get(city, {}).get("avg_salary_multiplier", 1.0) for city in cities])
+
+    # Truncate like get_adjusted_salary
+    adjusted = np.trunc(base[:, :, None, :] * multipliers[None, None, :, None])
+    minimum, maximum = adjusted[..., 0], adjusted[..., 1]
+    average = (minimum + maximum) / 2
+    tax = indonesia_pph21_batch(average * 12)
+    return {
+        "fields": fields,
+        "levels": list(SALARY_LEVELS),
+        "cities": cities,
+        "available": base[:, :, 1] > 0,
+        "min": minimum,
+        "max": maximum,
+        "avg": average,
+        "annual_tax": tax["annual_tax"],
+        "monthly_tax": tax["monthly_tax"],
+        "net_monthly": tax["net_monthly"]
+    }
+
 # Language support functions
 def get_translation(key, lang="id"):
     """Get translation for given key"""
-    return TRANSLATIONS.get(lang, {}).get(key, key)
+    return get_indonesia_data("translations").get(lang, {}).get(key, key)
 
 def format_indonesian_date():
     """Format date in Indonesian"""
     months = ["Januari", "Februari", "Maret", "April", "Mei", "Juni",
               "Juli", "Agustus", "September", "Oktober", "November", "Desember"]
     now = datetime.now()
-    return f"{now.day} {months[now.month-1]} {now.year}"
\ No newline at end of file
+    return f"{now.day} {months[now.month-1]} {now.year}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the Indonesia salary cube for analysts")
+    parser.add_argument("output", help="Parquet file to write, e.g. salary_cube.parquet")
+    args = parser.parse_args()
+    cube = get_salary_cube()
+    print(f"{len(cube.to_frame())} rows -> {cube.to_parquet(args.output)}")
+
+# Export functions (the catalog-backed names resolve through __getattr__; import them by name)
+__all__ = [
+    'get_indonesia_data',
+    'get_indonesia_salary_data',
+    'format_idr_currency',
+    'get_adjusted_salary',
+    'calculate_cost_of_living_ratio',
+    'create_indonesia_salary_chart',
+    'display_indonesia_companies',
+    'display_learning_resources',
+    'display_success_stories',
+    'create_city_comparison_chart',
+    'indonesia_pph21_calculator',
+    'indonesia_pph21_batch',
+    'indonesia_salary_matrix',
+    'SalaryCube',
+    'get_salary_cube',
+    'pph21_tax',
+    'SALARY_LEVELS',
+    'PPH21_PTKP',
+    'PPH21_BRACKETS',
+    'get_translation',
+    'format_indonesian_date'
+]
+
+if __name__ == "__main__":
+    main()
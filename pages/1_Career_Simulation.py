@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import numpy as np
 from datetime import datetime, timedelta
 import random
 
+from utils.catalog import start_catalog_watcher
+from utils.figure_cache import cached_figure
+from utils.fragments import render_styles
+from utils.lazy_imports import lazy_import
+from utils.simulation import get_scenarios, get_sweep_grid, monte_carlo_simulation, simulate_career_path
+
+go = lazy_import("plotly.graph_objects")
+
 # Page config
 st.set_page_config(
     page_title="Career Simulation",
@@ -14,420 +19,21 @@ st.set_page_config(
     layout="wide"
 )
 
-# Dark Purple Neon Sci-Fi Theme CSS (consistent with main.py)
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Exo+2:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Dark Theme */
-    .stApp {
-        background: linear-gradient(135deg, #0a0a0a 0%, #1a0e2e 25%, #2d1b3d 50%, #1a0e2e 75%, #0a0a0a 100%);
-        color: #e0e0ff;
-    }
-    
-    /* Animated Background */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: 
-            radial-gradient(circle at 20% 50%, rgba(139, 69, 255, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 69, 255, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 40% 80%, rgba(69, 139, 255, 0.1) 0%, transparent 50%);
-        animation: nebula 10s ease-in-out infinite;
-        pointer-events: none;
-        z-index: -1;
-    }
-    
-    @keyframes nebula {
-        0%, 100% { opacity: 0.7; }
-        50% { opacity: 1; }
-    }
-    
-    .simulation-header {
-        text-align: center;
-        padding: 4rem 2rem;
-        background: linear-gradient(135deg, rgba(139, 69, 255, 0.2), rgba(255, 69, 255, 0.2));
-        border: 2px solid #8b45ff;
-        border-radius: 20px;
-        margin-bottom: 3rem;
-        box-shadow: 
-            0 0 30px rgba(139, 69, 255, 0.5),
-            inset 0 0 30px rgba(139, 69, 255, 0.1);
-        position: relative;
-        overflow: hidden;
-        backdrop-filter: blur(10px);
-    }
-    
-    .simulation-header::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: linear-gradient(45deg, transparent, rgba(139, 69, 255, 0.1), transparent);
-        animation: scan 4s linear infinite;
-    }
-    
-    @keyframes scan {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-    
-    .simulation-header h1 {
-        font-family: 'Orbitron', monospace;
-        font-weight: 900;
-        text-shadow: 
-            0 0 10px #8b45ff,
-            0 0 20px #8b45ff,
-            0 0 30px #8b45ff;
-        animation: glow 2s ease-in-out infinite alternate;
-    }
-    
-    @keyframes glow {
-        from { text-shadow: 0 0 10px #8b45ff, 0 0 20px #8b45ff, 0 0 30px #8b45ff; }
-        to { text-shadow: 0 0 20px #8b45ff, 0 0 30px #8b45ff, 0 0 40px #8b45ff; }
-    }
-    
-    .simulation-card {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.9), rgba(26, 14, 46, 0.9));
-        border: 1px solid #8b45ff;
-        border-radius: 15px;
-        padding: 2rem;
-        margin: 1rem 0;
-        box-shadow: 
-            0 0 20px rgba(139, 69, 255, 0.3),
-            inset 0 0 20px rgba(139, 69, 255, 0.05);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-        backdrop-filter: blur(10px);
-    }
-    
-    .simulation-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(139, 69, 255, 0.2), transparent);
-        transition: left 0.5s;
-    }
-    
-    .simulation-card:hover::before {
-        left: 100%;
-    }
-    
-    .simulation-card:hover {
-        transform: translateY(-5px);
-        border-color: #ff45ff;
-        box-shadow: 
-            0 10px 30px rgba(255, 69, 255, 0.4),
-            inset 0 0 30px rgba(255, 69, 255, 0.1);
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, rgba(139, 69, 255, 0.2), rgba(255, 69, 255, 0.2));
-        border: 1px solid #8b45ff;
-        border-radius: 15px;
-        padding: 2rem 1.5rem;
-        text-align: center;
-        margin: 1rem 0.5rem;
-        box-shadow: 0 0 25px rgba(139, 69, 255, 0.4);
-        transition: all 0.3s ease;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .metric-card:hover {
-        transform: scale(1.05) rotateY(5deg);
-        border-color: #ff45ff;
-        box-shadow: 0 0 35px rgba(255, 69, 255, 0.6);
-    }
-    
-    .metric-card h3 {
-        font-family: 'Orbitron', monospace;
-        color: #ff45ff;
-        text-shadow: 0 0 10px #ff45ff;
-    }
-    
-    .path-step {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.8), rgba(26, 14, 46, 0.8));
-        border: 1px solid #8b45ff;
-        border-radius: 15px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border-left: 4px solid #8b45ff;
-        transition: all 0.3s ease;
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.2);
-    }
-    
-    .path-step:hover {
-        background: rgba(139, 69, 255, 0.15);
-        transform: translateX(10px);
-        border-color: #ff45ff;
-    }
-    
-    .progress-container {
-        background: rgba(13, 13, 13, 0.8);
-        border: 1px solid #8b45ff;
-        border-radius: 10px;
-        padding: 0.3rem;
-        margin: 0.5rem 0;
-    }
-    
-    .progress-bar {
-        background: linear-gradient(90deg, #8b45ff, #ff45ff);
-        height: 20px;
-        border-radius: 8px;
-        transition: width 0.8s ease-in-out;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        color: white;
-        font-weight: 600;
-        font-size: 0.8em;
-        text-shadow: 0 0 5px rgba(0,0,0,0.5);
-    }
-    
-    .scenario-option {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.8), rgba(26, 14, 46, 0.8));
-        border: 2px solid rgba(139, 69, 255, 0.3);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 0.5rem 0;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        color: #e0e0ff;
-    }
-    
-    .scenario-option:hover {
-        border-color: #8b45ff;
-        background: rgba(139, 69, 255, 0.1);
-        transform: scale(1.02);
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.3);
-    }
-    
-    .scenario-option.selected {
-        border-color: #ff45ff;
-        background: rgba(255, 69, 255, 0.1);
-        box-shadow: 0 0 20px rgba(255, 69, 255, 0.4);
-    }
-    
-    .timeline-item {
-        border-left: 3px solid #8b45ff;
-        padding-left: 1.5rem;
-        margin: 1rem 0;
-        position: relative;
-        color: #e0e0ff;
-    }
-    
-    .timeline-item::before {
-        content: '';
-        position: absolute;
-        left: -8px;
-        top: 0.5rem;
-        width: 12px;
-        height: 12px;
-        border-radius: 50%;
-        background: #8b45ff;
-        box-shadow: 0 0 10px #8b45ff;
-    }
-    
-    .warning-box {
-        background: rgba(255, 193, 7, 0.1);
-        border: 1px solid rgba(255, 193, 7, 0.3);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-        color: #ffcc00;
-        backdrop-filter: blur(10px);
-    }
-    
-    .success-box {
-        background: rgba(0, 255, 136, 0.1);
-        border: 1px solid rgba(0, 255, 136, 0.3);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-        color: #00ff88;
-        backdrop-filter: blur(10px);
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, #8b45ff, #ff45ff);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        padding: 0.75rem 2rem;
-        font-family: 'Exo 2', sans-serif;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        transition: all 0.3s ease;
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.4);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 10px 25px rgba(255, 69, 255, 0.5);
-    }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background: linear-gradient(180deg, rgba(13, 13, 13, 0.95), rgba(26, 14, 46, 0.95));
-        border-right: 1px solid #8b45ff;
-    }
-    
-    /* Text Elements */
-    h1, h2, h3, h4 {
-        font-family: 'Orbitron', monospace;
-        color: #e0e0ff;
-    }
-    
-    p, span, div {
-        font-family: 'Exo 2', sans-serif;
-        color: #c0c0ff;
-    }
-    
-    /* Chart Container */
-    .chart-container {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.9), rgba(26, 14, 46, 0.9));
-        border: 1px solid #8b45ff;
-        padding: 2rem;
-        border-radius: 15px;
-        box-shadow: 0 0 25px rgba(139, 69, 255, 0.2);
-        margin: 2rem 0;
-        backdrop-filter: blur(10px);
-    }
-    
-    /* Responsive */
-    @media (max-width: 768px) {
-        .simulation-header { padding: 2rem 1rem; }
-        .simulation-card, .metric-card { margin: 1rem 0; padding: 1.5rem; }
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Career simulation data (same as before)
-@st.cache_data
-def get_simulation_data():
-    """Get career simulation scenarios and data"""
-    return {
-        "scenarios": {
-            "AI Transition": {
-                "description": "Transition from traditional role to AI/ML Engineer",
-                "duration": "8-12 months",
-                "difficulty": "High",
-                "investment": "$2,000-$5,000",
-                "success_rate": 75,
-                "steps": [
-                    {"month": 1, "activity": "Python Fundamentals", "cost": 500, "time_hours": 80},
-                    {"month": 2, "activity": "Statistics & Math", "cost": 300, "time_hours": 60},
-                    {"month": 3, "activity": "Machine Learning Basics", "cost": 600, "time_hours": 100},
-                    {"month": 4, "activity": "Deep Learning Course", "cost": 800, "time_hours": 120},
-                    {"month": 5, "activity": "Portfolio Projects", "cost": 200, "time_hours": 80},
-                    {"month": 6, "activity": "Advanced Projects", "cost": 300, "time_hours": 100},
-                    {"month": 7, "activity": "Job Applications", "cost": 100, "time_hours": 40},
-                    {"month": 8, "activity": "Interview Preparation", "cost": 200, "time_hours": 60}
-                ],
-                "salary_progression": [50000, 52000, 55000, 60000, 70000, 85000, 95000, 110000],
-                "skills_gained": ["Python", "Machine Learning", "Data Science", "TensorFlow", "Statistics"]
-            },
-            "Blockchain Developer": {
-                "description": "Become a Blockchain/Web3 Developer",
-                "duration": "6-10 months",
-                "difficulty": "Very High",
-                "investment": "$3,000-$7,000",
-                "success_rate": 65,
-                "steps": [
-                    {"month": 1, "activity": "JavaScript/Node.js", "cost": 400, "time_hours": 80},
-                    {"month": 2, "activity": "Blockchain Fundamentals", "cost": 600, "time_hours": 100},
-                    {"month": 3, "activity": "Solidity Programming", "cost": 800, "time_hours": 120},
-                    {"month": 4, "activity": "Smart Contract Development", "cost": 1000, "time_hours": 140},
-                    {"month": 5, "activity": "DeFi Protocols", "cost": 700, "time_hours": 100},
-                    {"month": 6, "activity": "Portfolio & Projects", "cost": 500, "time_hours": 120},
-                    {"month": 7, "activity": "Network & Job Search", "cost": 200, "time_hours": 60}
-                ],
-                "salary_progression": [55000, 58000, 65000, 75000, 90000, 110000, 130000],
-                "skills_gained": ["Solidity", "Web3.js", "Smart Contracts", "DeFi", "Ethereum"]
-            },
-            "Cybersecurity Analyst": {
-                "description": "Enter Cybersecurity field",
-                "duration": "6-9 months",
-                "difficulty": "Medium-High",
-                "investment": "$1,500-$4,000",
-                "success_rate": 80,
-                "steps": [
-                    {"month": 1, "activity": "Security Fundamentals", "cost": 400, "time_hours": 60},
-                    {"month": 2, "activity": "Network Security", "cost": 500, "time_hours": 80},
-                    {"month": 3, "activity": "Ethical Hacking Course", "cost": 800, "time_hours": 100},
-                    {"month": 4, "activity": "Security Tools Training", "cost": 600, "time_hours": 80},
-                    {"month": 5, "activity": "Certification Prep", "cost": 400, "time_hours": 60},
-                    {"month": 6, "activity": "Hands-on Labs", "cost": 300, "time_hours": 80},
-                    {"month": 7, "activity": "Job Search & Applications", "cost": 100, "time_hours": 40}
-                ],
-                "salary_progression": [45000, 48000, 52000, 58000, 68000, 78000, 88000],
-                "skills_gained": ["Network Security", "Penetration Testing", "SIEM", "Risk Assessment", "Incident Response"]
-            },
-            "Data Scientist": {
-                "description": "Transition to Data Science role",
-                "duration": "7-10 months",
-                "difficulty": "Medium-High",
-                "investment": "$2,500-$6,000",
-                "success_rate": 70,
-                "steps": [
-                    {"month": 1, "activity": "Python & R Basics", "cost": 500, "time_hours": 80},
-                    {"month": 2, "activity": "Statistics & Probability", "cost": 400, "time_hours": 80},
-                    {"month": 3, "activity": "Data Analysis & Pandas", "cost": 600, "time_hours": 100},
-                    {"month": 4, "activity": "Machine Learning", "cost": 700, "time_hours": 120},
-                    {"month": 5, "activity": "Data Visualization", "cost": 500, "time_hours": 80},
-                    {"month": 6, "activity": "SQL & Databases", "cost": 300, "time_hours": 60},
-                    {"month": 7, "activity": "Portfolio Projects", "cost": 400, "time_hours": 100},
-                    {"month": 8, "activity": "Job Applications", "cost": 100, "time_hours": 40}
-                ],
-                "salary_progression": [48000, 50000, 55000, 62000, 72000, 85000, 95000, 105000],
-                "skills_gained": ["Python", "R", "SQL", "Machine Learning", "Data Visualization", "Statistics"]
-            }
-        }
-    }
+start_catalog_watcher()
 
-# Simulation functions (simplified for space)
-def simulate_career_path(scenario_data, user_params):
-    """Simulate career path with user parameters"""
-    time_multiplier = user_params.get('time_commitment', 1.0)
-    experience_bonus = user_params.get('experience_level', 0)
-    
-    adjusted_scenario = scenario_data.copy()
-    
-    if time_multiplier < 0.5:
-        for step in adjusted_scenario['steps']:
-            step['month'] = int(step['month'] * 1.5)
-    elif time_multiplier > 1.5:
-        for step in adjusted_scenario['steps']:
-            step['month'] = max(1, int(step['month'] * 0.7))
-    
-    base_success_rate = adjusted_scenario['success_rate']
-    adjusted_scenario['success_rate'] = min(95, base_success_rate + experience_bonus * 10)
-    
-    return adjusted_scenario
+# Dark Purple Neon Sci-Fi Theme CSS (consistent with main.py)
+render_styles("simulation")
 
 def create_timeline_chart(scenario_data):
     """Create interactive timeline chart with dark theme"""
-    steps = scenario_data['steps']
+    steps = scenario_data.steps
     
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
-        x=[step['month'] for step in steps],
-        y=[step['time_hours'] for step in steps],
-        text=[step['activity'] for step in steps],
+        x=steps.months,
+        y=steps.hours,
+        text=steps.activities,
         textposition='auto',
         name='Learning Hours',
         marker_color='rgba(139, 69, 255, 0.7)',
@@ -451,10 +57,10 @@ def create_timeline_chart(scenario_data):
 
 def create_cost_breakdown_chart(scenario_data):
     """Create cost breakdown chart with dark theme"""
-    steps = scenario_data['steps']
+    steps = scenario_data.steps
     
-    activities = [step['activity'] for step in steps]
-    costs = [step['cost'] for step in steps]
+    activities = steps.activities
+    costs = steps.costs
     
     colors = ['#8b45ff', '#ff45ff', '#00ff88', '#ffaa00', '#ff4455', '#00aaff', '#ff8800', '#aa00ff']
     
@@ -510,6 +116,88 @@ def create_salary_projection_chart(scenario_data):
     
     return fig
 
+def create_sweep_heatmap(grid, position):
+    """Risk-adjusted ROI over salary and experience"""
+    labels = ["Entry", "Mid", "Senior"]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Heatmap(
+        x=grid.salaries,
+        y=labels,
+        z=grid.risk_adjusted_roi.T,
+        customdata=grid.payback_months.T,
+        colorscale=[[0, '#ff4455'], [0.5, '#1a0e2e'], [1, '#00ff88']],
+        zmid=0,
+        colorbar=dict(title='ROI'),
+        hovertemplate='Salary: $%{x:,.0f}<br>Experience: %{y}<br>Risk-adjusted ROI: %{z:.1f}x<br>'
+                      'Payback: %{customdata:.1f} months<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Scatter(
+        x=[grid.salaries[position[0]]],
+        y=[labels[position[1]]],
+        mode='markers',
+        name='Your profile',
+        marker=dict(size=14, color='#ff45ff', symbol='x'),
+        hoverinfo='skip'
+    ))
+    
+    fig.update_layout(
+        title='🧭 Risk-Adjusted ROI by Salary & Experience',
+        xaxis_title='Current Annual Salary ($)',
+        yaxis_title='Experience',
+        height=400,
+        showlegend=False,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0ff', family="Exo 2"),
+        title_font=dict(color='#ff45ff', family="Orbitron")
+    )
+    
+    return fig
+
+def create_tornado_chart(swings, baseline):
+    """Swing in risk-adjusted ROI as each input moves across its full range"""
+    labels = {"salary": "Current Salary", "experience": "Experience Level"}
+    order = sorted(swings, key=lambda name: swings[name][1] - swings[name][0])
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        y=[labels[name] for name in order],
+        x=[swings[name][0] - baseline for name in order],
+        base=baseline,
+        orientation='h',
+        name='Low',
+        marker_color='#ff4455',
+        hovertemplate='%{y}<br>Low: %{x:.1f}x<extra></extra>'
+    ))
+    
+    fig.add_trace(go.Bar(
+        y=[labels[name] for name in order],
+        x=[swings[name][1] - baseline for name in order],
+        base=baseline,
+        orientation='h',
+        name='High',
+        marker_color='#00ff88',
+        hovertemplate='%{y}<br>High: %{x:.1f}x<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title='🌪️ Sensitivity of Risk-Adjusted ROI',
+        xaxis_title='Risk-adjusted ROI (x)',
+        barmode='overlay',
+        height=400,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0ff', family="Exo 2"),
+        title_font=dict(color='#ff45ff', family="Orbitron"),
+        xaxis=dict(gridcolor='rgba(139, 69, 255, 0.2)')
+    )
+    
+    return fig
+
 def main():
     """Main career simulation function"""
     
@@ -526,8 +214,8 @@ def main():
     </div>
     """, unsafe_allow_html=True)
     
-    # Load simulation data
-    sim_data = get_simulation_data()
+    # Shared, immutable scenarios for the current catalog version (no per-session copy)
+    scenarios = get_scenarios()
     
     # Sidebar for simulation parameters
     with st.sidebar:
@@ -570,10 +258,10 @@ def main():
     col1, col2 = st.columns([2, 1])
     
     with col1:
-        scenario_names = list(sim_data["scenarios"].keys())
+        scenario_names = list(scenarios.keys())
         selected_scenario = st.selectbox("Select Career Transition Scenario:", scenario_names)
         
-        scenario_data = sim_data["scenarios"][selected_scenario]
+        scenario_data = scenarios[selected_scenario]
         
         scenario_card_html = f"""
         <div class="simulation-card">
@@ -610,8 +298,8 @@ def main():
         # Simulate adjusted scenario
         adjusted_scenario = simulate_career_path(scenario_data, user_params)
         
-        total_cost = sum(step['cost'] for step in adjusted_scenario['steps'])
-        total_time = sum(step['time_hours'] for step in adjusted_scenario['steps'])
+        total_cost = adjusted_scenario.steps.total_cost()
+        total_time = adjusted_scenario.steps.total_hours()
         final_salary = adjusted_scenario['salary_progression'][-1]
         
         st.metric("Total Investment", f"${total_cost:,}")
@@ -619,6 +307,32 @@ def main():
         st.metric("Success Probability", f"{adjusted_scenario['success_rate']}%")
         st.metric("Expected Final Salary", f"${final_salary:,}")
     
+    # Sweep mode: every salary/experience combination is precomputed per scenario, so this is a lookup
+    if st.checkbox("🧭 Sweep mode: compare every salary and experience level"):
+        sweep = get_sweep_grid(selected_scenario)
+        sweep_inputs = (current_salary, user_params['experience_level'])
+        position = sweep.index(*sweep_inputs)
+        point = sweep.lookup(*sweep_inputs)
+        swings = sweep.sensitivity('risk_adjusted_roi', *sweep_inputs)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Risk-Adjusted ROI", f"{point['risk_adjusted_roi']:.1f}x")
+        with col2:
+            breakeven = point['breakeven_month']
+            st.metric("Break-even Month", f"{breakeven:.1f}" if breakeven != float('inf') else "never")
+        with col3:
+            st.metric("Within Budget", "Yes" if sweep.total_cost <= budget_limit else "No")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            heatmap_fig = cached_figure(create_sweep_heatmap, sweep, position, cache_key=(selected_scenario, position))
+            st.plotly_chart(heatmap_fig, use_container_width=True)
+        with col2:
+            tornado_fig = cached_figure(create_tornado_chart, swings, point['risk_adjusted_roi'],
+                                        cache_key=(selected_scenario, position))
+            st.plotly_chart(tornado_fig, use_container_width=True)
+    
     # Run simulation button
     if st.button("🎮 Run Career Simulation", type="primary", use_container_width=True):
         
@@ -676,6 +390,34 @@ def main():
             """
             st.markdown(metric_html, unsafe_allow_html=True)
         
+        # Outcome ranges across sampled trajectories (fixed seed keeps reruns stable)
+        outlook = monte_carlo_simulation(scenario_data, user_params, seed=42)
+        bands = outlook['bands']
+        st.header("🎲 Outcome Range")
+        st.caption(
+            f"{outlook['trajectories']:,} simulated trajectories • P10 / P50 / P90 • "
+            f"{outlook['success_probability'] * 100:.0f}% complete the transition"
+        )
+        
+        def format_months(value):
+            return f"{value:.1f}" if value != float('inf') else "never"
+        
+        outlook_rows = [
+            ("⏰ Payback (months)", bands['payback_months'], format_months),
+            ("📈 ROI Multiple", bands['roi'], lambda value: f"{value:.1f}x"),
+            ("💰 Final Salary", bands['final_salary'], lambda value: f"${value:,.0f}"),
+        ]
+        for column, (label, band, fmt) in zip(st.columns(3), outlook_rows):
+            with column:
+                metric_html = f"""
+                <div class="metric-card">
+                    <h3>{label}</h3>
+                    <p style="font-size: 1.5em; margin: 0.5rem 0; font-weight: bold; color: #00ff88;">{fmt(band['p50'])}</p>
+                    <p style="margin: 0; color: #e0e0ff;">P10 {fmt(band['p10'])} • P90 {fmt(band['p90'])}</p>
+                </div>
+                """
+                st.markdown(metric_html, unsafe_allow_html=True)
+        
         # Detailed timeline and costs
         st.header("📅 Detailed Learning Path")
         
@@ -683,19 +425,21 @@ def main():
         
         with col1:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-            timeline_fig = create_timeline_chart(adjusted_scenario)
+            # Figures depend only on the scenario and, for the schedule, the time commitment
+            timeline_fig = cached_figure(create_timeline_chart, adjusted_scenario,
+                                         cache_key=(selected_scenario, user_params['time_commitment']))
             st.plotly_chart(timeline_fig, use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
         
         with col2:
             st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-            cost_fig = create_cost_breakdown_chart(adjusted_scenario)
+            cost_fig = cached_figure(create_cost_breakdown_chart, adjusted_scenario, cache_key=selected_scenario)
             st.plotly_chart(cost_fig, use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
         
         # Salary projection
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
-        salary_fig = create_salary_projection_chart(adjusted_scenario)
+        salary_fig = cached_figure(create_salary_projection_chart, adjusted_scenario, cache_key=selected_scenario)
         st.plotly_chart(salary_fig, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
         
@@ -836,7 +580,7 @@ def main():
                 "roi_multiple": roi,
                 "payback_months": payback_months
             },
-            "timeline": adjusted_scenario['steps'],
+            "timeline": adjusted_scenario.steps.records(),
             "skills_gained": skills,
             "generated_on": datetime.now().isoformat()
         }
@@ -918,7 +662,7 @@ Skills to Gain: {', '.join(skills)}
         # Show sample scenarios overview
         st.header("🌟 Available Career Scenarios")
         
-        for scenario_name, scenario_data in sim_data["scenarios"].items():
+        for scenario_name, scenario_data in scenarios.items():
             with st.expander(f"{scenario_name} - {scenario_data['difficulty']} Difficulty", expanded=False):
                 col1, col2 = st.columns([2, 1])
                 
@@ -1,10 +1,14 @@
+from __future__ import annotations
+
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import numpy as np
 from datetime import datetime
 
+from utils.catalog import catalog_version, get_section, start_catalog_watcher, thaw
+from utils.fragments import render_styles
+from utils.lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+
 # Page config
 st.set_page_config(
     page_title="Skill Gap Analysis",
@@ -12,144 +16,15 @@ st.set_page_config(
     layout="wide"
 )
 
+start_catalog_watcher()
+
 # Simplified CSS for better performance
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&family=Exo+2:wght@300;400;600&display=swap');
-    
-    .stApp {
-        background: linear-gradient(135deg, #0a0a0a 0%, #1a0e2e 50%, #0a0a0a 100%);
-        color: #e0e0ff;
-    }
-    
-    .main-header {
-        text-align: center;
-        padding: 2rem;
-        background: linear-gradient(135deg, rgba(139, 69, 255, 0.2), rgba(255, 69, 255, 0.2));
-        border: 2px solid #8b45ff;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        box-shadow: 0 0 20px rgba(139, 69, 255, 0.3);
-    }
-    
-    .main-header h1 {
-        font-family: 'Orbitron', monospace;
-        color: #ff45ff;
-        text-shadow: 0 0 10px #8b45ff;
-        margin: 0;
-    }
-    
-    .skill-card {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.9), rgba(26, 14, 46, 0.9));
-        border: 1px solid #8b45ff;
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.2);
-    }
-    
-    .metric-card {
-        background: linear-gradient(135deg, rgba(139, 69, 255, 0.2), rgba(255, 69, 255, 0.2));
-        border: 1px solid #8b45ff;
-        border-radius: 10px;
-        padding: 1.5rem;
-        text-align: center;
-        margin: 0.5rem;
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.3);
-    }
-    
-    .skill-badge {
-        display: inline-block;
-        background: rgba(139, 69, 255, 0.2);
-        color: #8b45ff;
-        padding: 0.3rem 0.8rem;
-        border-radius: 15px;
-        margin: 0.2rem;
-        font-size: 0.9em;
-        border: 1px solid rgba(139, 69, 255, 0.3);
-    }
-    
-    .skill-badge.missing {
-        background: rgba(255, 69, 69, 0.2);
-        color: #ff4545;
-        border-color: rgba(255, 69, 69, 0.3);
-    }
-    
-    .recommendation-box {
-        background: linear-gradient(145deg, rgba(0, 255, 136, 0.1), rgba(0, 200, 100, 0.1));
-        border: 1px solid rgba(0, 255, 136, 0.3);
-        border-radius: 10px;
-        padding: 1.5rem;
-        margin: 1rem 0;
-        border-left: 4px solid #00ff88;
-    }
-    
-    h1, h2, h3, h4 {
-        font-family: 'Orbitron', monospace;
-        color: #e0e0ff;
-    }
-    
-    .stButton > button {
-        background: linear-gradient(135deg, #8b45ff, #ff45ff);
-        color: white;
-        border: none;
-        border-radius: 8px;
-        padding: 0.6rem 1.5rem;
-        font-weight: 600;
-    }
-</style>
-""", unsafe_allow_html=True)
+render_styles("skill_gap")
 
 # Skill database
 @st.cache_data
-def get_skill_database():
-    return {
-        "Artificial Intelligence": {
-            "core_skills": ["Python", "Machine Learning", "Deep Learning", "Statistics", "Data Science", "Neural Networks"],
-            "tools": ["TensorFlow", "PyTorch", "Scikit-learn", "Jupyter", "Git", "Docker"],
-            "soft_skills": ["Problem Solving", "Critical Thinking", "Communication", "Research"],
-            "certifications": ["Google AI", "AWS ML", "TensorFlow Developer", "Azure AI"],
-            "growth_rate": 22,
-            "difficulty": "High",
-            "salary_range": "$80K-$180K"
-        },
-        "Blockchain & Web3": {
-            "core_skills": ["Solidity", "Smart Contracts", "Ethereum", "Cryptography", "DeFi", "Web3"],
-            "tools": ["Remix", "Hardhat", "Web3.js", "MetaMask", "Git", "Truffle"],
-            "soft_skills": ["Security Mindset", "Innovation", "Risk Assessment", "Communication"],
-            "certifications": ["Certified Bitcoin Professional", "Ethereum Developer", "Blockchain Council"],
-            "growth_rate": 35,
-            "difficulty": "Very High",
-            "salary_range": "$90K-$200K"
-        },
-        "Cybersecurity": {
-            "core_skills": ["Network Security", "Penetration Testing", "Risk Assessment", "Incident Response", "SIEM"],
-            "tools": ["Wireshark", "Metasploit", "Nmap", "Kali Linux", "Burp Suite"],
-            "soft_skills": ["Attention to Detail", "Critical Thinking", "Communication", "Ethics"],
-            "certifications": ["CISSP", "CEH", "Security+", "CISM", "OSCP"],
-            "growth_rate": 35,
-            "difficulty": "High",
-            "salary_range": "$75K-$150K"
-        },
-        "Data Science": {
-            "core_skills": ["Python", "R", "SQL", "Statistics", "Machine Learning", "Data Analysis"],
-            "tools": ["Pandas", "NumPy", "Tableau", "Power BI", "Jupyter", "Apache Spark"],
-            "soft_skills": ["Analytical Thinking", "Communication", "Business Acumen", "Curiosity"],
-            "certifications": ["Google Data Analytics", "IBM Data Science", "Microsoft Azure Data"],
-            "growth_rate": 15,
-            "difficulty": "Medium-High",
-            "salary_range": "$70K-$140K"
-        },
-        "Cloud Computing": {
-            "core_skills": ["AWS", "Azure", "DevOps", "Kubernetes", "Docker", "Infrastructure as Code"],
-            "tools": ["Terraform", "Ansible", "Jenkins", "Git", "Linux", "Prometheus"],
-            "soft_skills": ["Problem Solving", "Collaboration", "Continuous Learning", "Innovation"],
-            "certifications": ["AWS Solutions Architect", "Azure Solutions Architect", "Google Cloud"],
-            "growth_rate": 20,
-            "difficulty": "Medium-High",
-            "salary_range": "$70K-$160K"
-        }
-    }
+def get_skill_database(version: str = None):
+    return thaw(get_section("skill_database"))
 
 def calculate_skill_match(user_skills, field_skills):
     if not field_skills:
@@ -252,7 +127,7 @@ def main():
     """, unsafe_allow_html=True)
     
     # Load data
-    skill_db = get_skill_database()
+    skill_db = get_skill_database(catalog_version())
     
     # Sidebar
     with st.sidebar:
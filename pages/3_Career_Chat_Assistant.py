@@ -1,10 +1,27 @@
 import streamlit as st
-import requests
-import json
+import os
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 import time
 
+from utils.chat_client import (
+    DEFAULT_API_URL,
+    DEFAULT_MODEL,
+    ChatClientError,
+    build_messages
+)
+from utils.chat_gateway import get_chat_gateway, peek_gateway
+from utils.chat_history import HistoryManager, count_message_tokens, history_token_budget
+from utils.chat_store import get_chat_store
+from utils.fragments import render_styles
+from utils.http_client import CircuitOpenError, HTTPClientError
+from utils.lazy_imports import lazy_import
+from utils.local_answers import FALLBACK_CONFIDENCE, FAST_PATH_CONFIDENCE, OFFLINE_NOTE, LocalAnswer, answer_locally
+from utils.response_cache import get_response_cache, make_namespace
+
+# httpx is only needed once a question reaches the LLM; the caches load scikit-learn on first lookup
+httpx = lazy_import("httpx")
+
 # Page config
 st.set_page_config(
     page_title="AI Career Assistant",
@@ -13,354 +30,26 @@ st.set_page_config(
 )
 
 # Dark Purple Neon Sci-Fi Theme CSS (consistent with main theme)
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700;900&family=Exo+2:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Dark Theme */
-    .stApp {
-        background: linear-gradient(135deg, #0a0a0a 0%, #1a0e2e 25%, #2d1b3d 50%, #1a0e2e 75%, #0a0a0a 100%);
-        color: #e0e0ff;
-    }
-    
-    /* Animated Background */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background: 
-            radial-gradient(circle at 20% 50%, rgba(139, 69, 255, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 69, 255, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 40% 80%, rgba(69, 139, 255, 0.1) 0%, transparent 50%);
-        animation: nebula 10s ease-in-out infinite;
-        pointer-events: none;
-        z-index: -1;
-    }
-    
-    @keyframes nebula {
-        0%, 100% { opacity: 0.7; }
-        50% { opacity: 1; }
-    }
-    
-    .chat-header {
-        text-align: center;
-        padding: 3rem 2rem;
-        background: linear-gradient(135deg, rgba(139, 69, 255, 0.2), rgba(255, 69, 255, 0.2));
-        border: 2px solid #8b45ff;
-        border-radius: 20px;
-        margin-bottom: 2rem;
-        box-shadow: 
-            0 0 30px rgba(139, 69, 255, 0.5),
-            inset 0 0 30px rgba(139, 69, 255, 0.1);
-        position: relative;
-        overflow: hidden;
-        backdrop-filter: blur(10px);
-    }
-    
-    .chat-header::before {
-        content: '';
-        position: absolute;
-        top: -50%;
-        left: -50%;
-        width: 200%;
-        height: 200%;
-        background: linear-gradient(45deg, transparent, rgba(139, 69, 255, 0.1), transparent);
-        animation: scan 4s linear infinite;
-    }
-    
-    @keyframes scan {
-        0% { transform: rotate(0deg); }
-        100% { transform: rotate(360deg); }
-    }
-    
-    .chat-header h1 {
-        font-family: 'Orbitron', monospace;
-        font-weight: 900;
-        text-shadow: 
-            0 0 10px #8b45ff,
-            0 0 20px #8b45ff,
-            0 0 30px #8b45ff;
-        animation: glow 2s ease-in-out infinite alternate;
-        margin: 0;
-        position: relative;
-        z-index: 1;
-    }
-    
-    @keyframes glow {
-        from { text-shadow: 0 0 10px #8b45ff, 0 0 20px #8b45ff, 0 0 30px #8b45ff; }
-        to { text-shadow: 0 0 20px #8b45ff, 0 0 30px #8b45ff, 0 0 40px #8b45ff; }
-    }
-    
-    .chat-container {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.9), rgba(26, 14, 46, 0.9));
-        border: 1px solid #8b45ff;
-        border-radius: 20px;
-        padding: 2rem;
-        box-shadow: 0 0 25px rgba(139, 69, 255, 0.3);
-        margin: 2rem 0;
-        min-height: 600px;
-        display: flex;
-        flex-direction: column;
-        backdrop-filter: blur(10px);
-    }
-    
-    .message-user {
-        background: linear-gradient(135deg, #8b45ff, #ff45ff);
-        color: white;
-        padding: 1rem 1.5rem;
-        border-radius: 20px 20px 5px 20px;
-        margin: 0.5rem 0 0.5rem 4rem;
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.4);
-        animation: slideInRight 0.3s ease;
-        font-family: 'Exo 2', sans-serif;
-    }
-    
-    .message-assistant {
-        background: linear-gradient(145deg, rgba(139, 69, 255, 0.1), rgba(255, 69, 255, 0.1));
-        color: #e0e0ff;
-        padding: 1rem 1.5rem;
-        border-radius: 20px 20px 20px 5px;
-        margin: 0.5rem 4rem 0.5rem 0;
-        border-left: 4px solid #00ff88;
-        box-shadow: 0 0 15px rgba(0, 255, 136, 0.2);
-        animation: slideInLeft 0.3s ease;
-        font-family: 'Exo 2', sans-serif;
-        border: 1px solid rgba(139, 69, 255, 0.2);
-    }
-    
-    @keyframes slideInRight {
-        from { transform: translateX(30px); opacity: 0; }
-        to { transform: translateX(0); opacity: 1; }
-    }
-    
-    @keyframes slideInLeft {
-        from { transform: translateX(-30px); opacity: 0; }
-        to { transform: translateX(0); opacity: 1; }
-    }
-    
-    .chat-input-container {
-        position: sticky;
-        bottom: 0;
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.95), rgba(26, 14, 46, 0.95));
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 -5px 20px rgba(139, 69, 255, 0.2);
-        margin-top: auto;
-        border: 1px solid rgba(139, 69, 255, 0.3);
-    }
-    
-    .suggested-prompts {
-        display: flex;
-        flex-wrap: wrap;
-        gap: 0.5rem;
-        margin: 1rem 0;
-    }
-    
-    .prompt-chip {
-        background: rgba(139, 69, 255, 0.2);
-        color: #8b45ff;
-        padding: 0.5rem 1rem;
-        border-radius: 20px;
-        border: 1px solid rgba(139, 69, 255, 0.3);
-        cursor: pointer;
-        transition: all 0.3s ease;
-        font-size: 0.9em;
-        font-family: 'Exo 2', sans-serif;
-    }
-    
-    .prompt-chip:hover {
-        background: rgba(139, 69, 255, 0.3);
-        transform: translateY(-2px);
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.4);
-        color: #ff45ff;
-    }
-    
-    .feature-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-        gap: 1.5rem;
-        margin: 2rem 0;
-    }
-    
-    .feature-card {
-        background: linear-gradient(145deg, rgba(13, 13, 13, 0.9), rgba(26, 14, 46, 0.9));
-        padding: 2rem;
-        border-radius: 15px;
-        box-shadow: 0 0 20px rgba(139, 69, 255, 0.3);
-        border: 1px solid #8b45ff;
-        transition: all 0.3s ease;
-        text-align: center;
-        position: relative;
-        overflow: hidden;
-        backdrop-filter: blur(10px);
-    }
-    
-    .feature-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(139, 69, 255, 0.2), transparent);
-        transition: left 0.5s;
-    }
-    
-    .feature-card:hover::before {
-        left: 100%;
-    }
-    
-    .feature-card:hover {
-        transform: translateY(-5px);
-        border-color: #ff45ff;
-        box-shadow: 0 10px 30px rgba(255, 69, 255, 0.4);
-    }
-    
-    .feature-card h4 {
-        color: #ff45ff;
-        font-family: 'Orbitron', monospace;
-        margin-bottom: 1rem;
-        position: relative;
-        z-index: 1;
-    }
-    
-    .typing-indicator {
-        display: inline-flex;
-        align-items: center;
-        padding: 1rem 1.5rem;
-        background: rgba(139, 69, 255, 0.1);
-        border-radius: 20px 20px 20px 5px;
-        margin: 0.5rem 4rem 0.5rem 0;
-        border: 1px solid rgba(139, 69, 255, 0.3);
-    }
-    
-    .typing-dot {
-        width: 8px;
-        height: 8px;
-        border-radius: 50%;
-        background: #8b45ff;
-        margin: 0 2px;
-        animation: typing 1.4s infinite ease-in-out;
-    }
-    
-    .typing-dot:nth-child(1) { animation-delay: -0.32s; }
-    .typing-dot:nth-child(2) { animation-delay: -0.16s; }
-    
-    @keyframes typing {
-        0%, 80%, 100% { transform: scale(0.8); opacity: 0.5; }
-        40% { transform: scale(1); opacity: 1; }
-    }
-    
-    .status-indicator {
-        display: inline-block;
-        width: 10px;
-        height: 10px;
-        background: #00ff88;
-        border-radius: 50%;
-        margin-right: 0.5rem;
-        animation: pulse 2s infinite;
-        box-shadow: 0 0 10px #00ff88;
-    }
-    
-    @keyframes pulse {
-        0% { opacity: 1; transform: scale(1); }
-        50% { opacity: 0.5; transform: scale(1.1); }
-        100% { opacity: 1; transform: scale(1); }
-    }
-    
-    .error-message {
-        background: rgba(255, 69, 69, 0.2);
-        color: #ff4545;
-        border: 1px solid rgba(255, 69, 69, 0.3);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    .success-message {
-        background: rgba(0, 255, 136, 0.2);
-        color: #00ff88;
-        border: 1px solid rgba(0, 255, 136, 0.3);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    /* Text Elements */
-    h1, h2, h3, h4 {
-        font-family: 'Orbitron', monospace;
-        color: #e0e0ff;
-    }
-    
-    p, span, div {
-        font-family: 'Exo 2', sans-serif;
-        color: #c0c0ff;
-    }
-    
-    /* Buttons */
-    .stButton > button {
-        background: linear-gradient(135deg, #8b45ff, #ff45ff);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        padding: 0.75rem 2rem;
-        font-family: 'Exo 2', sans-serif;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        transition: all 0.3s ease;
-        box-shadow: 0 0 15px rgba(139, 69, 255, 0.4);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 10px 25px rgba(255, 69, 255, 0.5);
-    }
-    
-    /* Sidebar */
-    .css-1d391kg {
-        background: linear-gradient(180deg, rgba(13, 13, 13, 0.95), rgba(26, 14, 46, 0.95));
-        border-right: 1px solid #8b45ff;
-    }
-    
-    /* Form elements */
-    .stTextArea > div > div > textarea {
-        background: rgba(13, 13, 13, 0.8);
-        color: #e0e0ff;
-        border: 1px solid #8b45ff;
-        border-radius: 10px;
-        font-family: 'Exo 2', sans-serif;
-    }
-    
-    .stTextArea > div > div > textarea:focus {
-        border-color: #ff45ff;
-        box-shadow: 0 0 10px rgba(255, 69, 255, 0.3);
-    }
-    
-    /* Responsive */
-    @media (max-width: 768px) {
-        .message-user, .message-assistant {
-            margin-left: 1rem;
-            margin-right: 1rem;
-        }
-        
-        .chat-header {
-            padding: 2rem 1rem;
-        }
-        
-        .feature-grid {
-            grid-template-columns: 1fr;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+render_styles("chat")
+
+def _get_setting(name: str, default: str = "") -> str:
+    """Read a setting from the environment first, then Streamlit secrets"""
+    value = os.getenv(name)
+    if value:
+        return value
+    try:
+        return st.secrets.get(name, default)
+    except Exception:
+        return default
 
 # Configuration for OpenRouter API (Llama 3.2)
-OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
-OPENROUTER_API_KEY = st.secrets.get("OPENROUTER_API_KEY", "")
+OPENROUTER_API_URL = _get_setting("OPENROUTER_API_URL", DEFAULT_API_URL)
+OPENROUTER_API_KEY = _get_setting("OPENROUTER_API_KEY")
+
+# Messages rendered per page of conversation history
+MESSAGES_PER_PAGE = 20
+
+MISSING_KEY_MESSAGE = "⚠️ **API Configuration Error**: OpenRouter API key not found. Please set up your API key in Streamlit secrets to enable the AI assistant."
 
 # Career-focused system prompt
 SYSTEM_PROMPT = """You are an expert AI Career Advisor specializing in emerging technology fields including AI, Blockchain, Cybersecurity, Data Science, and Cloud Computing. Your role is to provide:
@@ -383,67 +72,196 @@ SYSTEM_PROMPT = """You are an expert AI Career Advisor specializing in emerging
 
 Remember: You're helping people transform their careers and achieve their professional goals in rapidly evolving technology fields."""
 
+# Cached answers are only valid for this model and system prompt
+CACHE_NAMESPACE = make_namespace(DEFAULT_MODEL, SYSTEM_PROMPT)
+
+def get_cached_response(user_message: str, conversation_history: List[Dict]) -> Optional[str]:
+    """Cached answer for an opening question; follow-ups depend on the conversation and are never cached"""
+    if conversation_history:
+        return None
+    hit = get_response_cache().get(user_message, CACHE_NAMESPACE)
+    return hit[0] if hit else None
+
+def store_response(user_message: str, conversation_history: List[Dict], response: str):
+    if not conversation_history and response:
+        get_response_cache().set(user_message, response, CACHE_NAMESPACE)
+
+def answered_locally(local: Optional[LocalAnswer], conversation_history: List[Dict]) -> bool:
+    """Opening questions the knowledge base matches with high confidence skip the LLM"""
+    return local is not None and not conversation_history and local.confidence >= FAST_PATH_CONFIDENCE
+
+def local_fallback(local: Optional[LocalAnswer], failure_message: str) -> str:
+    """Local answer when the LLM is unavailable, if the knowledge base has a reasonable match"""
+    if local is not None and local.confidence >= FALLBACK_CONFIDENCE:
+        return local.text + OFFLINE_NOTE
+    return failure_message
+
+def build_prompt(user_message: str, conversation_history: List[Dict]) -> List[Dict]:
+    """Messages for this turn with history fitted to the token budget; records prompt sizes"""
+    if "history_manager" not in st.session_state:
+        st.session_state.history_manager = HistoryManager(history_token_budget())
+    
+    messages, report = st.session_state.history_manager.build(SYSTEM_PROMPT, conversation_history, user_message)
+    
+    # Compare with the previous fixed window of the last 10 messages. Short chats can send
+    # more than that window, so savings are only counted over the whole chat and never below 0
+    report["baseline_tokens"] = count_message_tokens(build_messages(SYSTEM_PROMPT, user_message, conversation_history))
+    st.session_state.last_prompt_report = report
+    totals = st.session_state.setdefault("prompt_token_totals", {"prompt": 0, "baseline": 0})
+    totals["prompt"] += report["prompt_tokens"]
+    totals["baseline"] += report["baseline_tokens"]
+    return messages
+
+def _error_message(error: Exception) -> str:
+    """User-facing text for a failed request"""
+    if isinstance(error, ChatClientError):
+        return f"⚠️ **Service Temporarily Unavailable**: {str(error)[:100]}... Please try again in a moment."
+    if isinstance(error, CircuitOpenError):
+        return f"⏳ **AI Service Busy**: The service is recovering from errors. Please try again in about {error.retry_in:.0f} seconds."
+    if isinstance(error, HTTPClientError):
+        return f"⏳ **AI Service Busy**: Too many requests in progress. Please try again in a moment."
+    if isinstance(error, httpx.HTTPError):
+        return f"🔗 **Connection Error**: Unable to reach AI service. Please check your internet connection and try again."
+    return f"🤖 **AI Service Error**: {str(error)[:100]}... Please try again or contact support."
+
 def get_ai_response(user_message: str, conversation_history: List[Dict]) -> str:
     """Get response from OpenRouter API using Llama 3.2"""
     
+    local = answer_locally(user_message)
     if not OPENROUTER_API_KEY:
-        return "⚠️ **API Configuration Error**: OpenRouter API key not found. Please set up your API key in Streamlit secrets to enable the AI assistant."
+        return local_fallback(local, MISSING_KEY_MESSAGE)
     
     try:
-        # Prepare messages for API
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-        
-        # Add conversation history (last 10 messages to stay within context limits)
-        for msg in conversation_history[-10:]:
-            messages.append(msg)
-        
-        # Add current user message
-        messages.append({"role": "user", "content": user_message})
-        
-        # API request payload
-        payload = {
-            "model": "meta-llama/llama-3.2-90b-vision-instruct:free",
-            "messages": messages,
-            "max_tokens": 1000,
-            "temperature": 0.7,
-            "top_p": 0.9,
-            "stream": False
-        }
-        
-        headers = {
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://career-shift-analyzer.streamlit.app",
-            "X-Title": "Career Shift Analyzer Pro"
-        }
-        
-        # Make API request
-        response = requests.post(
-            OPENROUTER_API_URL,
-            headers=headers,
-            json=payload,
-            timeout=30
-        )
-        
-        if response.status_code == 200:
-            response_data = response.json()
-            return response_data["choices"][0]["message"]["content"]
-        else:
-            error_msg = f"API Error {response.status_code}: {response.text}"
-            return f"⚠️ **Service Temporarily Unavailable**: {error_msg[:100]}... Please try again in a moment."
-            
-    except requests.RequestException as e:
-        return f"🔗 **Connection Error**: Unable to reach AI service. Please check your internet connection and try again."
+        cached = get_cached_response(user_message, conversation_history)
+        if cached is not None:
+            return cached
+        if answered_locally(local, conversation_history):
+            return local.text + OFFLINE_NOTE
+        messages = build_prompt(user_message, conversation_history)
+        response = get_chat_gateway().complete(messages, OPENROUTER_API_KEY, OPENROUTER_API_URL)
+    except Exception as e:
+        return local_fallback(local, _error_message(e))
+    
+    store_response(user_message, conversation_history, response)
+    return response
+
+def get_ai_response_stream(user_message: str, conversation_history: List[Dict]) -> Iterator[str]:
+    """
+    Stream the response from OpenRouter token by token
+    
+    Yields content deltas as they arrive over SSE, for st.write_stream. Errors
+    are yielded as the same messages get_ai_response returns, appended to any
+    partial answer already shown. Opening questions are answered from the
+    response cache when possible, and complete answers are stored in it.
+    
+    Routing uses the local knowledge base's confidence score. A confident
+    match answers an opening question without a network call, and a weaker
+    match still replaces an error when the key is missing or the service fails.
+    """
+    
+    local = answer_locally(user_message)
+    if not OPENROUTER_API_KEY:
+        yield local_fallback(local, MISSING_KEY_MESSAGE)
+        return
+    
+    tokens = []
+    try:
+        cached = get_cached_response(user_message, conversation_history)
+        if cached is not None:
+            yield cached
+            return
+        if answered_locally(local, conversation_history):
+            yield local.text + OFFLINE_NOTE
+            return
+        messages = build_prompt(user_message, conversation_history)
+        # Sessions asking the same thing at the same time share one upstream call
+        for token in get_chat_gateway().stream(messages, OPENROUTER_API_KEY, OPENROUTER_API_URL):
+            tokens.append(token)
+            yield token
     except Exception as e:
-        return f"🤖 **AI Service Error**: {str(e)[:100]}... Please try again or contact support."
+        if tokens:
+            yield "\n\n" + _error_message(e)
+        else:
+            yield local_fallback(local, _error_message(e))
+        return
+    
+    store_response(user_message, conversation_history, "".join(tokens))
+
+def answer_pending_message():
+    """Stream a reply to the last user message if it has not been answered yet"""
+    session_id = st.session_state.chat_session_id
+    last_message = get_chat_store().last(session_id) if session_id else None
+    if not last_message or last_message["role"] != "user":
+        return
+    
+    # The full history is only read when a question needs answering, not on every rerun
+    conversation_history = get_chat_store().history(session_id)[:-1]
+    timestamp = datetime.now().strftime("%H:%M")
+    
+    with st.container():
+        st.markdown(
+            f'<strong>🤖 AI Career Advisor</strong> <small style="opacity: 0.8;">({timestamp})</small>',
+            unsafe_allow_html=True
+        )
+        ai_response = st.write_stream(get_ai_response_stream(last_message["content"], conversation_history))
+    
+    if not isinstance(ai_response, str):
+        ai_response = "".join(str(part) for part in ai_response)
+    
+    add_message("assistant", ai_response, timestamp)
+    st.rerun()
+
+def chat_owner() -> Optional[str]:
+    """Signed-in user allowed to resume their stored chats; None without st.login authentication"""
+    user = getattr(st, "user", None)
+    try:
+        if user is None or not user.is_logged_in:
+            return None
+        return user.get("email") or user.get("sub")
+    except (AttributeError, KeyError):
+        return None
 
 def initialize_chat_session():
-    """Initialize chat session state"""
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    """Initialize chat session state, resuming the owner's conversation from the ?chat= URL parameter"""
+    if "chat_session_id" not in st.session_state:
+        session_id = st.query_params.get("chat")
+        # The id alone is not enough: only the signed-in user who started the chat may reopen it
+        if session_id and not get_chat_store().is_owner(session_id, chat_owner()):
+            session_id = None
+        st.session_state.chat_session_id = session_id
+    
+    if "visible_messages" not in st.session_state:
+        st.session_state.visible_messages = MESSAGES_PER_PAGE
     
     if "conversation_started" not in st.session_state:
-        st.session_state.conversation_started = False
+        st.session_state.conversation_started = st.session_state.chat_session_id is not None
+
+def add_message(role: str, content: str, timestamp: Optional[str] = None):
+    """Append a message to the stored conversation, creating the session on the first message"""
+    store = get_chat_store()
+    if st.session_state.chat_session_id is None:
+        owner = chat_owner()
+        st.session_state.chat_session_id = store.create_session(owner)
+        if owner:
+            st.query_params["chat"] = st.session_state.chat_session_id
+    store.append(st.session_state.chat_session_id, role, content, timestamp or datetime.now().strftime("%H:%M"))
+
+def display_conversation():
+    """Render the latest page of messages; older ones load on demand"""
+    session_id = st.session_state.chat_session_id
+    if session_id is None:
+        return
+    
+    store = get_chat_store()
+    total = store.counts(session_id)["messages"]
+    visible = st.session_state.visible_messages
+    if total > visible:
+        if st.button(f"⬆️ Show earlier messages ({total - visible} more)", use_container_width=True):
+            st.session_state.visible_messages += MESSAGES_PER_PAGE
+            st.rerun()
+    
+    for message in store.tail(session_id, visible):
+        display_message(message["role"], message["content"], message["timestamp"])
 
 def display_message(role: str, content: str, timestamp: Optional[str] = None):
     """Display a chat message with proper styling"""
@@ -600,11 +418,7 @@ def main():
         
         if selected_prompt:
             st.session_state.conversation_started = True
-            st.session_state.messages.append({
-                "role": "user", 
-                "content": selected_prompt,
-                "timestamp": datetime.now().strftime("%H:%M")
-            })
+            add_message("user", selected_prompt)
             st.rerun()
     
     else:
@@ -612,13 +426,10 @@ def main():
         st.markdown('<div class="chat-container">', unsafe_allow_html=True)
         
         # Display conversation history
-        if st.session_state.messages:
-            for message in st.session_state.messages:
-                display_message(
-                    message["role"], 
-                    message["content"], 
-                    message.get("timestamp")
-                )
+        display_conversation()
+        
+        # Reply to a new question (typed or picked from the suggestions)
+        answer_pending_message()
         
         # Chat input area
         st.markdown('<div class="chat-input-container">', unsafe_allow_html=True)
@@ -643,20 +454,25 @@ def main():
         
         with col1:
             if st.button("🔄 New Conversation", use_container_width=True):
-                st.session_state.messages = []
+                # Signed-in conversations stay resumable; anonymous ones can never be reopened, so drop them
+                if st.session_state.chat_session_id and chat_owner() is None:
+                    get_chat_store().delete_session(st.session_state.chat_session_id)
+                st.session_state.chat_session_id = None
                 st.session_state.conversation_started = False
+                st.session_state.visible_messages = MESSAGES_PER_PAGE
+                if "chat" in st.query_params:
+                    del st.query_params["chat"]
+                for key in ("history_manager", "last_prompt_report", "prompt_token_totals"):
+                    st.session_state.pop(key, None)
                 st.rerun()
         
         with col2:
             if st.button("💾 Save Chat", use_container_width=True):
-                if st.session_state.messages:
-                    chat_export = {
-                        "timestamp": datetime.now().isoformat(),
-                        "messages": st.session_state.messages
-                    }
+                if st.session_state.chat_session_id:
+                    # Read from the store in batches; download_button takes the finished bytes
                     st.download_button(
                         label="📥 Download Chat History",
-                        data=json.dumps(chat_export, indent=2),
+                        data=get_chat_store().export_bytes(st.session_state.chat_session_id),
                         file_name=f"career_chat_{datetime.now().strftime('%Y%m%d_%H%M')}.json",
                         mime="application/json"
                     )
@@ -679,30 +495,9 @@ def main():
         # Process user input
         if send_button and user_input.strip():
             # Add user message
-            st.session_state.messages.append({
-                "role": "user",
-                "content": user_input.strip(),
-                "timestamp": datetime.now().strftime("%H:%M")
-            })
-            
-            # Show typing indicator
-            with st.spinner("AI is analyzing your question..."):
-                # Get AI response
-                conversation_history = [
-                    {"role": msg["role"], "content": msg["content"]} 
-                    for msg in st.session_state.messages[:-1]
-                ]
-                
-                ai_response = get_ai_response(user_input.strip(), conversation_history)
+            add_message("user", user_input.strip())
             
-            # Add AI response
-            st.session_state.messages.append({
-                "role": "assistant",
-                "content": ai_response,
-                "timestamp": datetime.now().strftime("%H:%M")
-            })
-            
-            # Rerun to show new messages
+            # Rerun to show the question and stream the answer
             st.rerun()
     
     # Sidebar with quick actions and info
@@ -741,14 +536,41 @@ def main():
         st.markdown("---")
         
         # Chat statistics
-        if st.session_state.messages:
-            total_messages = len(st.session_state.messages)
-            user_messages = len([m for m in st.session_state.messages if m["role"] == "user"])
+        if st.session_state.chat_session_id:
+            counts = get_chat_store().counts(st.session_state.chat_session_id)
             
             st.header("📈 Chat Stats")
-            st.metric("Total Messages", total_messages)
-            st.metric("Your Questions", user_messages)
-            st.metric("AI Responses", total_messages - user_messages)
+            st.metric("Total Messages", counts["messages"])
+            st.metric("Your Questions", counts["user"])
+            st.metric("AI Responses", counts["assistant"])
+            
+            report = st.session_state.get("last_prompt_report")
+            if report:
+                st.metric(
+                    "Prompt Tokens (last turn)",
+                    f"{report['prompt_tokens']:,}",
+                    delta=f"{report['prompt_tokens'] - report['baseline_tokens']:+,} vs. last 10 messages",
+                    delta_color="inverse"
+                )
+                totals = st.session_state.prompt_token_totals
+                tokens_saved = max(totals["baseline"] - totals["prompt"], 0)
+                if report["summarized_messages"] and tokens_saved:
+                    st.caption(
+                        f"{report['summarized_messages']} older messages summarized • "
+                        f"{tokens_saved:,} tokens saved this chat"
+                    )
+            
+            # Latency to the LLM across all sessions in this process (none until a request has run)
+            gateway = peek_gateway()
+            stats = gateway.stats() if gateway else {}
+            latency = stats.get("stream")
+            if latency:
+                counters = stats["counters"]
+                st.caption(
+                    f"LLM latency p50 {latency['p50']:.1f}s • p95 {latency['p95']:.1f}s "
+                    f"({counters.get('upstream_calls', 0)} calls, {counters.get('coalesced', 0)} shared, "
+                    f"circuit {stats['circuit']})"
+                )
 
 if __name__ == "__main__":
     main()
@@ -4,10 +4,17 @@ Indonesian Career Analyzer Page
 Dedicated page for Indonesian market with localized data and features
 """
 
+from __future__ import annotations
+
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
 from indonesia_career_data import *
+from utils.catalog import start_catalog_watcher
+from utils.figure_cache import cached_figure
+from utils.fragments import render_styles
+from utils.lazy_imports import lazy_import
+
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
 
 def main():
     """Main Indonesian Career Analyzer function"""
@@ -18,31 +25,16 @@ def main():
         page_icon="🇮🇩",
         layout="wide"
     )
+    start_catalog_watcher()
+    
+    # Catalog-backed market data, read from the live snapshot on each run
+    from indonesia_career_data import (
+        GOVERNMENT_PROGRAMS, INDONESIA_COMPANIES, INDONESIA_SALARY_DATA,
+        INDONESIA_SUCCESS_STORIES, INDONESIA_TECH_CITIES
+    )
     
     # Custom CSS for Indonesian theme
-    st.markdown("""
-    <style>
-    .indonesia-header {
-        background: linear-gradient(90deg, #FF0000 0%, #FFFFFF 50%, #FF0000 100%);
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-        margin-bottom: 2rem;
-    }
-    .metric-card {
-        background: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #dc3545;
-    }
-    .success-story {
-        background: #e8f5e8;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    render_styles("indonesia")
     
     # Header
     st.markdown("""
@@ -108,13 +100,14 @@ def main():
                 )
         
         # Display salary chart
-        fig = create_indonesia_salary_chart(career_field, city)
+        fig = cached_figure(create_indonesia_salary_chart, career_field, city)
         st.plotly_chart(fig, use_container_width=True)
         
-        # Current salary details
-        if career_field in INDONESIA_SALARY_DATA and experience in INDONESIA_SALARY_DATA[career_field]:
-            salary_range = get_adjusted_salary(INDONESIA_SALARY_DATA[career_field][experience], city)
-            avg_salary = (salary_range["min"] + salary_range["max"]) / 2
+        # Current salary details: one slice of the precomputed field × level × city cube
+        salary_point = get_salary_cube().get(career_field, experience, city)
+        if salary_point is not None:
+            salary_range = salary_point
+            avg_salary = salary_point["avg"]
             
             col1, col2, col3, col4 = st.columns(4)
             
@@ -151,8 +144,8 @@ def main():
                 st.subheader("🧮 PPh 21 Tax Calculator")
                 st.write("Annual income tax simulation:")
             
-            annual_salary = avg_salary * 12
-            tax_calc = indonesia_pph21_calculator(annual_salary)
+            annual_salary = salary_point["annual_gross"]
+            tax_calc = salary_point
             
             col1, col2, col3, col4 = st.columns(4)
             with col1:
@@ -184,7 +177,7 @@ def main():
             st.header("🌆 Indonesian Tech Cities Comparison")
         
         # City comparison chart
-        fig = create_city_comparison_chart()
+        fig = cached_figure(create_city_comparison_chart)
         st.plotly_chart(fig, use_container_width=True)
         
         # City details
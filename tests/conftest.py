@@ -0,0 +1,6 @@
+# tests/conftest.py - Make the app's top-level packages importable from the tests
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
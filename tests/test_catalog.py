@@ -0,0 +1,62 @@
+# tests/test_catalog.py - Catalog reloads with index builders that read the catalog
+import json
+import shutil
+import threading
+
+import pytest
+
+from utils import catalog
+from utils.catalog import CATALOG_PATH, CatalogError, CatalogService
+
+@pytest.fixture
+def service(tmp_path):
+    path = tmp_path / "catalog.json"
+    shutil.copy(CATALOG_PATH, path)
+    return CatalogService(str(path), cache_dir=str(tmp_path / "cache"))
+
+def bump_version(service: CatalogService, version: str):
+    with open(service.path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["version"] = version
+    with open(service.path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+def run_with_timeout(target, timeout: float = 10.0):
+    result = {}
+
+    def call():
+        try:
+            result["value"] = target()
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=call, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "reload deadlocked"
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+def test_builder_reading_the_live_snapshot_does_not_deadlock(service, monkeypatch):
+    service.snapshot
+    seen = []
+    monkeypatch.setitem(catalog._INDEX_BUILDERS, "reads_live",
+                        lambda data: seen.append(service.snapshot.version) or data["version"])
+
+    bump_version(service, "2099.1")
+    assert run_with_timeout(lambda: service.reload(force=True)) is True
+    assert service.snapshot.index("reads_live") == "2099.1"
+    # On a reload the live snapshot is still the previous version
+    assert seen and not seen[0].startswith("2099.1")
+
+def test_builder_reading_the_snapshot_on_first_load_fails_fast(service, monkeypatch):
+    monkeypatch.setitem(catalog._INDEX_BUILDERS, "reads_live", lambda data: service.snapshot)
+    with pytest.raises(CatalogError):
+        run_with_timeout(lambda: service.snapshot)
+
+def test_cache_round_trip(service):
+    first = service.snapshot
+    again = CatalogService(service.path, cache_dir=service.cache_dir).snapshot
+    assert again.sha256 == first.sha256
+    assert again.section("job_mapping") == first.section("job_mapping")
@@ -0,0 +1,70 @@
+# tests/test_chat_gateway.py - Circuit breaker bookkeeping in the async chat gateway
+import httpx
+import pytest
+
+from utils import chat_gateway
+from utils.chat_gateway import ChatGateway
+from utils.http_client import CircuitBreaker
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def half_open_gateway(handler) -> ChatGateway:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10.0, clock=clock)
+    breaker.record_failure()
+    clock.now = 10.0
+    assert breaker.state == "half-open"
+
+    gateway = ChatGateway(max_retries=0, breaker=breaker)
+    gateway.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return gateway
+
+def ask(gateway: ChatGateway) -> str:
+    return gateway.complete([{"role": "user", "content": "hi"}], "key", "http://upstream.test/chat")
+
+def test_unexpected_error_releases_the_trial_and_reopens():
+    def handler(request):
+        raise RuntimeError("boom")
+
+    gateway = half_open_gateway(handler)
+    try:
+        with pytest.raises(RuntimeError):
+            ask(gateway)
+        assert gateway.breaker.trial_in_flight is False
+        assert gateway.breaker.state == "open"
+    finally:
+        gateway.close()
+
+def test_successful_trial_closes_the_circuit():
+    def handler(request):
+        return httpx.Response(200, text='data: {"choices": [{"delta": {"content": "ok"}}]}\n\ndata: [DONE]\n\n')
+
+    gateway = half_open_gateway(handler)
+    try:
+        assert ask(gateway) == "ok"
+        assert gateway.breaker.trial_in_flight is False
+        assert gateway.breaker.state == "closed"
+    finally:
+        gateway.close()
+
+def test_client_error_counts_as_a_healthy_upstream():
+    def handler(request):
+        return httpx.Response(401, text="bad key")
+
+    gateway = half_open_gateway(handler)
+    try:
+        with pytest.raises(Exception, match="401"):
+            ask(gateway)
+        assert gateway.breaker.state == "closed"
+    finally:
+        gateway.close()
+
+def test_peek_gateway_does_not_create_the_gateway(monkeypatch):
+    monkeypatch.setattr(chat_gateway, "_gateway", None)
+    assert chat_gateway.peek_gateway() is None
+    assert chat_gateway._gateway is None
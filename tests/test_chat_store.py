@@ -0,0 +1,65 @@
+# tests/test_chat_store.py - Ownership, retention and export for stored chat sessions
+import json
+import time
+from contextlib import closing
+
+from utils.chat_store import ChatStore
+
+def make_store(tmp_path, **kwargs) -> ChatStore:
+    return ChatStore(str(tmp_path / "chats.sqlite3"), **kwargs)
+
+def test_only_the_owner_can_resume(tmp_path):
+    store = make_store(tmp_path)
+    session_id = store.create_session("ana@example.com")
+    store.append(session_id, "user", "hello")
+
+    assert store.is_owner(session_id, "ana@example.com")
+    assert not store.is_owner(session_id, "bob@example.com")
+    assert not store.is_owner(session_id, None)
+    assert not store.is_owner("0" * 32, "ana@example.com")
+
+def test_anonymous_sessions_cannot_be_resumed(tmp_path):
+    store = make_store(tmp_path)
+    session_id = store.create_session()
+    assert store.session_exists(session_id)
+    assert not store.is_owner(session_id, "ana@example.com")
+
+def test_purge_removes_idle_sessions_and_their_messages(tmp_path):
+    store = make_store(tmp_path, retention_days=1)
+    old = store.create_session("ana@example.com")
+    store.append(old, "user", "old question")
+    fresh = store.create_session("ana@example.com")
+
+    later = time.time() + 2 * 86400
+    store.append(fresh, "user", "new question")
+    with closing(store._connect()) as conn:
+        conn.execute("UPDATE chat_sessions SET updated = ? WHERE session_id = ?", (later, fresh))
+
+    assert store.purge_expired(later) == 1
+    assert not store.session_exists(old)
+    assert store.page(old, 0, 10) == []
+    assert store.history(fresh) == [{"role": "user", "content": "new question"}]
+
+def test_expired_session_is_not_resumable_before_the_purge_runs(tmp_path):
+    store = make_store(tmp_path, retention_days=0)
+    session_id = store.create_session("ana@example.com")
+    time.sleep(0.01)
+    assert not store.is_owner(session_id, "ana@example.com")
+
+def test_export_bytes_is_the_streamed_json(tmp_path):
+    store = make_store(tmp_path)
+    session_id = store.create_session()
+    store.append(session_id, "user", "Gaji data scientist?", "10:00")
+    store.append(session_id, "assistant", "Rp 15-35 juta", "10:01")
+
+    exported = json.loads(store.export_bytes(session_id).decode("utf-8"))
+    assert [m["content"] for m in exported["messages"]] == ["Gaji data scientist?", "Rp 15-35 juta"]
+
+def test_anonymous_sessions_are_purged_sooner(tmp_path):
+    store = make_store(tmp_path, retention_days=30, anonymous_retention_hours=2)
+    anonymous = store.create_session()
+    owned = store.create_session("ana@example.com")
+
+    assert store.purge_expired(time.time() + 3 * 3600) == 1
+    assert not store.session_exists(anonymous)
+    assert store.session_exists(owned)
@@ -0,0 +1,60 @@
+# tests/test_future_readiness.py - ReadinessEngine agrees with calculate_advanced_readiness_score
+import pytest
+
+from utils.future_readiness import (
+    SKILL_CATEGORIES,
+    ReadinessEngine,
+    calculate_advanced_readiness_score,
+    get_enhanced_skill_weights,
+)
+
+PROFILES = [
+    {"core_skills": ["Python", "Machine Learning", "statistics"], "tools": ["PyTorch", "pandas", "Excel"],
+     "soft_skills": ["communication"], "certifications": ["AWS ML"],
+     "years_experience": 4, "weekly_learning_hours": 15, "career_urgency": "3-6 months",
+     "current_role": "Data Analyst"},
+    {"core_skills": ["solidity", "cryptography", "python"], "tools": ["git"],
+     "years_experience": 1, "weekly_learning_hours": 30, "career_urgency": "1-2 years",
+     "current_role": "Backend Developer"},
+    # Empty skills in every category
+    {"core_skills": [], "tools": [], "soft_skills": [], "certifications": [],
+     "years_experience": 0, "weekly_learning_hours": 5},
+    # No categories at all, an unknown category and an unknown urgency
+    {"languages": ["Bahasa Indonesia", "English"], "years_experience": 12,
+     "weekly_learning_hours": 8, "career_urgency": "someday"},
+    # Partial matches ("learning" inside "machine learning") and repeated skills
+    {"core_skills": ["learning", "learning", "security"], "soft_skills": ["research", "Research"],
+     "years_experience": 7, "current_role": "Security Engineer"},
+]
+TARGETS = ["Artificial Intelligence", "Blockchain", "Cybersecurity", "Underwater Basket Weaving"]
+
+def _legacy(profile):
+    skills = {category: profile[category] for category in SKILL_CATEGORIES if category in profile}
+    return calculate_advanced_readiness_score(
+        skills, TARGETS,
+        years_experience=profile.get("years_experience", 0),
+        weekly_learning_hours=profile.get("weekly_learning_hours", 10),
+        career_urgency=profile.get("career_urgency", "6-12 months"),
+        current_role=profile.get("current_role", ""),
+    )
+
+def test_engine_matches_legacy_scores():
+    columns = ReadinessEngine(get_enhanced_skill_weights()).score_profiles(PROFILES, TARGETS)
+    legacy = [_legacy(profile) for profile in PROFILES]
+
+    assert sorted(set(columns["field"])) == sorted(legacy[0])
+    assert len(columns["field"]) == len(PROFILES) * len(legacy[0])
+    close = pytest.approx
+    for row, (profile, field) in enumerate(zip(columns["profile"], columns["field"])):
+        expected = legacy[profile][field]
+        assert columns["overall_score"][row] == close(expected["overall_score"], abs=0.051)
+        assert columns["base_score"][row] == close(expected["base_score"], abs=0.051)
+        for category in SKILL_CATEGORIES:
+            assert columns[f"{category}_score"][row] == close(expected["category_scores"][category], abs=0.051)
+        assert columns["experience_bonus"][row] == close(expected["experience_bonus"], abs=0.051)
+        assert columns["role_relevance_bonus"][row] == expected["role_relevance_bonus"]
+        assert columns["learning_factor"][row] == close(expected["learning_factor"], abs=0.0051)
+        assert columns["readiness_level"][row] == expected["readiness_level"]
+        assert columns["estimated_timeline_months"][row] == close(expected["estimated_timeline_months"], abs=0.051)
+        assert columns["skills_acquired"][row] == expected["skills_acquired"]
+        assert columns["completion_percentage"][row] == close(expected["completion_percentage"], abs=0.051)
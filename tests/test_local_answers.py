@@ -0,0 +1,57 @@
+# tests/test_local_answers.py - Fast-path routing for the chat assistant's offline answers
+import ast
+import os
+
+import pytest
+
+pytest.importorskip("sklearn")
+
+from utils.catalog import CatalogService
+from utils.local_answers import FALLBACK_CONFIDENCE, FAST_PATH_CONFIDENCE, answer_locally
+
+CHAT_PAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "pages", "3_Career_Chat_Assistant.py")
+
+def suggested_prompts():
+    """The `prompts` list in the chat page's show_suggested_prompts, read without running the page"""
+    with open(CHAT_PAGE, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    function = next(node for node in tree.body
+                    if isinstance(node, ast.FunctionDef) and node.name == "show_suggested_prompts")
+    assignment = next(node for node in function.body
+                      if isinstance(node, ast.Assign) and node.targets[0].id == "prompts")
+    return ast.literal_eval(assignment.value)
+
+EXPECTED_SOURCES = {
+    "How do I transition into AI/ML from my current role?": "roadmap:AI Transition",
+    "What skills are most in-demand for cybersecurity jobs?": "skills:Cybersecurity",
+    "Should I learn blockchain development in 2025?": "roadmap:Blockchain Developer",
+    "How much can I earn as a data scientist?": "salary:Artificial Intelligence",
+    "What's the best path to become a cloud architect?": "skills:Cloud Computing",
+    "How do I prepare for technical interviews?": "advice:Technical interviews",
+    "Which programming language should I learn first?": "advice:First programming language",
+    "What are the pros and cons of remote work in tech?": "advice:Remote work in tech",
+}
+
+@pytest.mark.parametrize("prompt", suggested_prompts())
+def test_suggested_prompts_take_the_fast_path(prompt):
+    answer = answer_locally(prompt)
+    assert answer is not None
+    assert answer.confidence >= FAST_PATH_CONFIDENCE
+    assert answer.source == EXPECTED_SOURCES[prompt]
+
+@pytest.mark.parametrize("prompt", [
+    "What is the weather in Paris?",
+    "Explain quantum physics to me",
+    "How do I negotiate a raise with my manager?",
+    "What does a product manager do?",
+])
+def test_off_topic_questions_go_to_the_llm(prompt):
+    answer = answer_locally(prompt)
+    assert answer is None or answer.confidence < FALLBACK_CONFIDENCE
+
+def test_engine_is_built_on_first_use(tmp_path):
+    snapshot = CatalogService(cache_dir=str(tmp_path)).snapshot
+    assert "local_answers" not in snapshot._indexes
+    engine = snapshot.index("local_answers")
+    assert engine is not None and snapshot.index("local_answers") is engine
@@ -0,0 +1,33 @@
+# tests/test_monte_carlo.py - Seeding, shape and percentile order of the Monte Carlo bands
+import math
+
+import pytest
+
+from utils.simulation import get_scenarios, monte_carlo_simulation
+
+NAME = next(iter(get_scenarios()))
+PARAMS = {"current_salary": 50000, "experience_level": 2, "time_commitment": 1.0}
+METRICS = {"months", "total_cost", "payback_months", "roi", "final_salary"}
+
+def run(seed, n_trajectories=2000):
+    return monte_carlo_simulation(get_scenarios()[NAME], PARAMS, n_trajectories, seed=seed)
+
+def test_same_seed_gives_identical_results():
+    assert run(7) == run(7)
+
+def test_different_seeds_give_different_bands():
+    first, second = run(7), run(8)
+    assert first["bands"] != second["bands"]
+    assert first["bands"]["total_cost"] != second["bands"]["total_cost"]
+
+@pytest.mark.parametrize("seed", [0, 1, 42])
+def test_bands_have_every_metric_in_percentile_order(seed):
+    result = run(seed)
+    assert result["trajectories"] == 2000
+    assert 0.0 <= result["success_probability"] <= 1.0
+    assert 0.0 <= result["payback_reached"] <= 1.0
+    assert set(result["bands"]) == METRICS
+    for metric, band in result["bands"].items():
+        assert list(band) == ["p10", "p50", "p90"], metric
+        assert band["p10"] <= band["p50"] <= band["p90"], metric
+        assert not any(math.isnan(value) for value in band.values()), metric
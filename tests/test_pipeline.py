@@ -0,0 +1,36 @@
+# tests/test_pipeline.py - Input formats and list parsing for the batch scoring pipeline
+import io
+import json
+
+import pytest
+
+from utils.pipeline import file_format, read_records, split_list, write_rows
+
+PROFILES = [{"id": 1, "skills": ["Python", "SQL"]}, {"id": 2, "skills": "Solidity; Rust"}]
+
+def test_json_file_is_read_as_an_array(tmp_path):
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(PROFILES, indent=2), encoding="utf-8")
+    assert list(read_records(str(path))) == PROFILES
+
+def test_json_file_must_hold_an_array(tmp_path):
+    path = tmp_path / "profiles.json"
+    path.write_text(json.dumps(PROFILES[0]), encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(read_records(str(path)))
+
+def test_jsonl_file_is_read_line_by_line(tmp_path):
+    path = tmp_path / "profiles.jsonl"
+    path.write_text("".join(json.dumps(p) + "\n" for p in PROFILES) + "\n", encoding="utf-8")
+    assert list(read_records(str(path))) == PROFILES
+
+@pytest.mark.parametrize("rows", [[], [{"id": 1, "field": "AI"}, {"id": 1, "field": "Blockchain"}]])
+def test_json_output_is_one_array(rows):
+    out = io.StringIO()
+    assert write_rows([(1, rows)], out, file_format("results.json")) == 1
+    assert json.loads(out.getvalue()) == rows
+
+def test_split_list_accepts_json_and_separated_text():
+    assert split_list('["Python", "SQL"]') == ["Python", "SQL"]
+    assert split_list("Solidity; Rust, Go") == ["Solidity", "Rust", "Go"]
+    assert split_list(None) == []
@@ -0,0 +1,31 @@
+# tests/test_recommender.py - Batch scoring agrees with the per-profile recommender
+import pytest
+
+from utils.recommender import advanced_recommender, advanced_recommender_batch
+
+PROFILES = [
+    {"id": 1, "skills": "Python, Machine Learning, SQL", "years_experience": 3,
+     "interest_fields": "Artificial Intelligence, Blockchain"},
+    {"id": 2, "skills": "Solidity; Smart Contracts ; Rust", "years_experience": 0,
+     "interest_fields": "Blockchain; Cybersecurity"},
+    {"id": 3, "skills": " Data Analysis ,Statistics, Python ", "years_experience": 6,
+     "interest_fields": " Data Science , Artificial Intelligence"},
+]
+
+def _split(value):
+    return [part.strip() for part in value.replace(";", ",").split(",") if part.strip()]
+
+@pytest.mark.parametrize("profile", PROFILES, ids=lambda p: str(p["id"]))
+def test_batch_matches_scalar_on_separated_strings(profile):
+    batch = advanced_recommender_batch([profile])
+    scalar = advanced_recommender(_split(profile["skills"]), _split(profile["interest_fields"]),
+                                  profile["years_experience"])
+
+    assert scalar
+    assert sorted(batch["field"]) == sorted(scalar)
+    for row in batch.itertuples():
+        expected = scalar[row.field]
+        assert row.skill_match_score == expected["skill_match_score"]
+        assert row.experience_level == expected["experience_level"]
+        assert row.transition_difficulty == expected["transition_difficulty"]
+        assert row.estimated_timeline == expected["estimated_timeline"]
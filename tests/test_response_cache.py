@@ -0,0 +1,41 @@
+# tests/test_response_cache.py - Exact and similarity lookups in utils/response_cache.py
+import pytest
+
+from utils.response_cache import ResponseCache, SQLiteBackend
+
+pytest.importorskip("sklearn")
+
+def test_stop_word_only_prompt_is_a_miss_not_an_error():
+    cache = ResponseCache()
+    cache.set("Why?", "because")
+    assert cache.get("How do I learn python?") is None
+    assert cache.get("why") == ("because", "exact")
+
+def test_stop_word_only_prompt_in_shared_backend(tmp_path):
+    cache = ResponseCache(SQLiteBackend(str(tmp_path / "cache.sqlite3")))
+    cache.set("Why?", "because")
+    assert cache.get("How do I learn python?") is None
+    cache.set("How do I learn Python?", "Start with the basics")
+    assert cache.get("how can I learn python") == ("Start with the basics", "similar")
+
+def test_similar_prompt_hits_and_different_topic_misses():
+    cache = ResponseCache()
+    cache.set("How do I transition into AI/ML from my current role?", "roadmap")
+    assert cache.get("how can I transition to AI/ML from my current role") == ("roadmap", "similar")
+    assert cache.get("How do I transition into cybersecurity from my current role?") is None
+
+@pytest.mark.parametrize("cached, asked", [
+    ("Should I learn blockchain development in 2025?", "Should I not learn blockchain development in 2025?"),
+    ("Which programming language should I learn first?", "Which programming language should I never learn?"),
+    ("Which programming language should I learn first?", "Which programming language should I learn last?"),
+    ("What are the pros and cons of remote work in tech?", "What are the cons of remote work in tech?"),
+])
+def test_negated_or_reordered_question_is_a_miss(cached, asked):
+    cache = ResponseCache()
+    cache.set(cached, "cached answer")
+    assert cache.get(asked) is None
+
+def test_same_polarity_paraphrase_still_hits():
+    cache = ResponseCache()
+    cache.set("Which programming language should I learn first?", "Python")
+    assert cache.get("which programming language would I learn first") == ("Python", "similar")
@@ -0,0 +1,25 @@
+# tests/test_simulation_sweep.py - Sensitivity sweep axes for the Career Simulation page
+import pytest
+
+from utils.simulation import SweepGrid, get_scenarios, get_sweep_grid
+
+@pytest.mark.parametrize("name", list(get_scenarios()))
+def test_every_swept_axis_moves_risk_adjusted_roi(name):
+    grid = get_sweep_grid(name)
+    swings = grid.sensitivity("risk_adjusted_roi", 50000, 0)
+    assert set(swings) == set(SweepGrid.AXES)
+    for low, high in swings.values():
+        assert high > low
+
+def test_sweep_reuses_the_snapshot_scenarios():
+    name = next(iter(get_scenarios()))
+    grid = get_sweep_grid(name)
+    assert grid.scenario is get_scenarios()[name]
+    assert get_sweep_grid(name) is grid
+
+def test_lookup_matches_the_nearest_grid_point():
+    name = next(iter(get_scenarios()))
+    grid = get_sweep_grid(name)
+    point = grid.lookup(52000, 2)
+    assert point["success_rate"] == min(95, get_scenarios()[name].success_rate + 20)
+    assert point["risk_adjusted_roi"] == pytest.approx(point["roi"] * point["success_rate"] / 100)
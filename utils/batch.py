@@ -0,0 +1,64 @@
+# utils/batch.py - Bulk scoring CLI for workforce exports
+"""
+Score a CSV, JSONL or JSON-array file of profiles with the recommender and
+readiness engines outside Streamlit, spread across a process pool.
+
+Usage:
+    python -m utils.batch profiles.csv results.csv --workers 8 --chunk-size 5000
+
+Input columns (CSV headers or JSON keys):
+    id, skills, interest_fields, years_experience, core_skills, tools,
+    soft_skills, certifications, weekly_learning_hours, career_urgency,
+    current_role
+List columns accept JSON arrays or comma/semicolon separated strings. When no
+category columns are given, 'skills' is scored as core skills.
+
+Output has one row per (profile, field), written as chunks finish. The
+streaming stages live in utils/pipeline.py.
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List
+
+from utils.pipeline import ProgressReporter, run_pipeline, split_list
+
+def run(input_path: str, output_path: str, workers: int = None, chunk_size: int = 5000,
+        fields: List[str] = None, quiet: bool = False) -> int:
+    """Score input_path into output_path; returns the number of profiles processed"""
+    workers = workers or os.cpu_count() or 1
+    progress = None if quiet else ProgressReporter(sys.stderr)
+
+    if workers == 1:
+        return run_pipeline(input_path, output_path, chunk_size, fields, progress=progress)
+
+    # Keep a bounded number of chunks in flight so memory stays flat on huge files
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return run_pipeline(input_path, output_path, chunk_size, fields,
+                            executor=pool, max_in_flight=workers * 2, progress=progress)
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m utils.batch",
+        description="Score a CSV/JSONL/JSON file of profiles with the recommender and readiness engines."
+    )
+    parser.add_argument("input", help="Input .csv, .jsonl or .json (array) file of profiles")
+    parser.add_argument("output", help="Output .csv, .jsonl or .json file")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count; 1 scores in-process)")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Profiles per chunk")
+    parser.add_argument("--fields", default=None, help="Comma-separated fields to score (default: all)")
+    parser.add_argument("--quiet", action="store_true", help="Do not report progress")
+    args = parser.parse_args(argv)
+
+    fields = split_list(args.fields) or None
+    started = time.perf_counter()
+    count = run(args.input, args.output, args.workers, args.chunk_size, fields, args.quiet)
+    elapsed = time.perf_counter() - started
+    print(f"Scored {count:,} profiles in {elapsed:.1f}s -> {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
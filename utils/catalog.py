@@ -0,0 +1,359 @@
+# utils/catalog.py - Versioned data catalog with a compiled binary cache
+"""
+Loads data/catalog.json, the single source for the industry, job, skill,
+simulation and Indonesia data used across the app. CatalogService keeps the
+live version in an immutable snapshot and, once start_catalog_watcher() is
+called, hot-swaps it when the file changes.
+
+The JSON is parsed and validated once per content hash and compiled to a pickle
+under data/.cache/. Later processes (Streamlit reruns, batch workers) hash the
+JSON and unpickle the matching cache file without re-parsing or re-validating.
+Compile ahead of time with:
+
+    python -m utils.catalog
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+import time
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Set, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CATALOG_PATH = os.path.join(ROOT, "data", "catalog.json")
+CACHE_DIR = os.path.join(ROOT, "data", ".cache")
+
+# Bump when the compiled layout changes so stale caches are rebuilt
+CACHE_FORMAT = 1
+
+REQUIRED_SECTIONS = (
+    "industry_data", "job_mapping", "learning_paths", "skill_weights", "learning_resources",
+    "practice_projects", "simulation", "skill_database", "indonesia"
+)
+
+class CatalogError(ValueError):
+    """Raised when the catalog file is missing sections or malformed"""
+
+def freeze(value):
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def thaw(value):
+    """Deep plain-dict/list copy of a frozen value (for st.cache_data, json, pandas)"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+def validate_catalog(data: Dict) -> None:
+    """Check the top-level layout and the shapes the scoring code relies on"""
+    if not isinstance(data, dict):
+        raise CatalogError("catalog root must be an object")
+    if not isinstance(data.get("version"), str):
+        raise CatalogError("catalog 'version' must be a string")
+
+    missing = [name for name in REQUIRED_SECTIONS if not isinstance(data.get(name), dict)]
+    if missing:
+        raise CatalogError(f"catalog sections missing or not objects: {', '.join(missing)}")
+
+    for field, entry in data["job_mapping"].items():
+        for key in ("skills", "entry_jobs", "mid_jobs", "senior_jobs", "salary_ranges"):
+            if key not in entry:
+                raise CatalogError(f"job_mapping['{field}'] is missing '{key}'")
+    for field, entry in data["skill_weights"].items():
+        if "weight_multipliers" not in entry:
+            raise CatalogError(f"skill_weights['{field}'] is missing 'weight_multipliers'")
+    for name, scenario in data["simulation"].get("scenarios", {}).items():
+        if not scenario.get("steps") or not scenario.get("salary_progression"):
+            raise CatalogError(f"simulation scenario '{name}' needs steps and salary_progression")
+
+def _cache_path(digest: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, f"catalog-{digest[:16]}.pickle")
+
+def _read_cache(cache_path: str, digest: str):
+    """Unpickle a compiled catalog; None if absent, stale or corrupt"""
+    try:
+        with open(cache_path, "rb") as handle:
+            payload = pickle.load(handle)
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        return None
+    if not isinstance(payload, dict) or payload.get("format") != CACHE_FORMAT or payload.get("sha256") != digest:
+        return None
+    return payload["catalog"]
+
+def _write_cache(cache_path: str, digest: str, data: Dict) -> None:
+    """Write atomically so concurrent workers never see a partial file"""
+    cache_dir = os.path.dirname(cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump({"format": CACHE_FORMAT, "sha256": digest, "catalog": data}, handle,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+def read_catalog(path: str = CATALOG_PATH, cache_dir: str = CACHE_DIR) -> Dict:
+    """
+    Load the catalog as plain dicts, using the compiled cache when it matches
+
+    Args:
+        path: Catalog JSON file
+        cache_dir: Directory for compiled snapshots; a read-only location just
+            means every process parses the JSON itself
+    """
+    with open(path, "rb") as handle:
+        raw = handle.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    cache_path = _cache_path(digest, cache_dir)
+    data = _read_cache(cache_path, digest)
+    if data is not None:
+        return data
+
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise CatalogError(f"{path} is not valid JSON: {e}") from e
+    validate_catalog(data)
+    data["sha256"] = digest
+
+    try:
+        _write_cache(cache_path, digest, data)
+    except OSError:
+        pass
+    return data
+
+# Derived structures (skill indexes, scoring engines) rebuilt alongside each snapshot
+_INDEX_BUILDERS: Dict[str, Callable[[Mapping], object]] = {}
+# Indexes built on first use instead of before the swap
+_LAZY_INDEXES: Set[str] = set()
+
+def register_index(name: str, builder: Callable[[Mapping], object], lazy: bool = False) -> None:
+    """
+    Register builder(catalog) -> index
+
+    Args:
+        name: Key for CatalogSnapshot.index
+        builder: Called once per snapshot; by default before the snapshot is swapped in.
+            It must read the catalog it is given: during the first load there is
+            no live snapshot yet, and on a reload the live one is the old version
+        lazy: Build on the first CatalogSnapshot.index call instead, for indexes
+            that are slow to build and not needed by every page
+    """
+    _INDEX_BUILDERS[name] = builder
+    if lazy:
+        _LAZY_INDEXES.add(name)
+    else:
+        _LAZY_INDEXES.discard(name)
+
+class CatalogSnapshot:
+    """One immutable catalog version plus the indexes derived from it
+
+    Readers grab a snapshot once and use it for the whole request, so a reload
+    that lands mid-request never mixes data from two versions.
+    """
+
+    def __init__(self, data: Mapping, indexes: Dict[str, object]):
+        self.data = data
+        self.sha256 = data["sha256"]
+        self.version = f"{data['version']}+{self.sha256[:8]}"
+        self.loaded_at = time.time()
+        self._indexes = dict(indexes)
+        self._plain = {}
+        # Reentrant: a lazy builder may read other indexes of the same snapshot
+        self._index_lock = threading.RLock()
+
+    def section(self, name: str) -> Mapping:
+        return self.data[name]
+
+    def plain(self, name: str) -> Dict:
+        """Plain-dict copy of a section, made once per snapshot"""
+        if name not in self._plain:
+            self._plain[name] = thaw(self.data[name])
+        return self._plain[name]
+
+    def index(self, name: str):
+        """A registered index; lazy ones and builders registered after the swap are built on first use"""
+        if name not in self._indexes:
+            with self._index_lock:
+                if name not in self._indexes:
+                    self._indexes[name] = _INDEX_BUILDERS[name](self.data)
+        return self._indexes[name]
+
+class CatalogService:
+    """Watches the catalog file and swaps in new snapshots without restarting the app
+
+    A background thread polls the file's mtime and size. On change it loads,
+    validates and indexes the new version off to the side, then publishes it with
+    a single reference assignment. A bad edit is logged in `last_error` and the
+    previous snapshot stays live. Index builders run outside the service lock,
+    so a builder that reads the catalog cannot deadlock a reload.
+    """
+
+    def __init__(self, path: str = CATALOG_PATH, cache_dir: str = CACHE_DIR, poll_interval: float = 2.0):
+        self.path = path
+        self.cache_dir = cache_dir
+        self.poll_interval = poll_interval
+        self.last_error = None
+        self.reloads = 0
+        self._snapshot = None
+        self._stamp = None
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._first_load = threading.Lock()
+        self._building = threading.local()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        if self._snapshot is None:
+            if getattr(self._building, "active", False):
+                raise CatalogError("Index builders must use the catalog passed to them; no snapshot is live yet")
+            # Concurrent first readers wait for one load instead of each building the indexes
+            with self._first_load:
+                if self._snapshot is None:
+                    self.reload(force=True)
+        return self._snapshot
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload(self, force: bool = False) -> bool:
+        """Load the file if it changed; returns True when a new snapshot was swapped in"""
+        with self._lock:
+            stamp = self._file_stamp()
+            if not force and stamp == self._stamp:
+                return False
+            self._stamp = stamp
+            try:
+                data = freeze(read_catalog(self.path, self.cache_dir))
+            except Exception as e:
+                self.last_error = e
+                if self._snapshot is None:
+                    raise
+                return False
+            if self._snapshot is not None and data["sha256"] == self._snapshot.sha256:
+                return False
+            self._generation += 1
+            generation = self._generation
+
+        self._building.active = True
+        try:
+            indexes = {name: builder(data) for name, builder in list(_INDEX_BUILDERS.items())
+                       if name not in _LAZY_INDEXES}
+        except Exception as e:
+            self.last_error = e
+            if self._snapshot is None:
+                raise
+            return False
+        finally:
+            self._building.active = False
+
+        with self._lock:
+            # A reload that read the file later wins, even if its indexes finished first
+            if generation != self._generation:
+                return False
+            self._snapshot = CatalogSnapshot(data, indexes)
+            self.last_error = None
+            self.reloads += 1
+            return True
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except OSError as e:
+                self.last_error = e
+
+    def start(self) -> "CatalogService":
+        """Start the polling thread (idempotent)"""
+        if self._thread is None or not self._thread.is_alive():
+            if self._snapshot is None:
+                self.reload(force=True)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="catalog-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_catalog_service() -> CatalogService:
+    """Process-wide catalog service (not polling until start_catalog_watcher)"""
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = CatalogService()
+    return _service
+
+def start_catalog_watcher(poll_interval: float = None) -> CatalogService:
+    """Enable hot reload for this process; CATALOG_POLL_SECONDS overrides the interval"""
+    service = get_catalog_service()
+    interval = poll_interval or float(os.getenv("CATALOG_POLL_SECONDS", service.poll_interval))
+    service.poll_interval = interval
+    return service.start()
+
+def current_snapshot() -> CatalogSnapshot:
+    """The live snapshot; hold on to it for the duration of one request"""
+    return get_catalog_service().snapshot
+
+def load_catalog() -> Mapping:
+    """Shared read-only catalog (the live snapshot's data)"""
+    return current_snapshot().data
+
+def get_section(name: str) -> Mapping:
+    """One read-only top-level section, e.g. get_section('job_mapping')"""
+    return current_snapshot().section(name)
+
+def catalog_version() -> str:
+    """Human version plus content hash, e.g. '2025.1+3f2a9c1d'"""
+    return current_snapshot().version
+
+def main():
+    data = read_catalog()
+    print(f"catalog {data['version']} ({data['sha256'][:16]}) -> {_cache_path(data['sha256'], CACHE_DIR)}",
+          file=sys.stderr)
+
+# Export functions
+__all__ = [
+    'load_catalog',
+    'read_catalog',
+    'get_section',
+    'catalog_version',
+    'current_snapshot',
+    'get_catalog_service',
+    'start_catalog_watcher',
+    'register_index',
+    'CatalogService',
+    'CatalogSnapshot',
+    'validate_catalog',
+    'freeze',
+    'thaw',
+    'CatalogError',
+    'CATALOG_PATH'
+]
+
+if __name__ == "__main__":
+    main()
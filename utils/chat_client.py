@@ -0,0 +1,114 @@
+# utils/chat_client.py - OpenRouter chat completions payloads and SSE parsing
+"""
+Request building and server-sent event parsing for the OpenAI-compatible chat
+completions endpoint used by the Career Chat Assistant. The HTTP side lives in
+utils/chat_gateway.py, which streams content deltas through these helpers so
+the page can render tokens as they arrive.
+
+The endpoint is configurable (OPENROUTER_API_URL), which lets
+benchmarks/fake_openrouter.py stand in for the real service locally.
+"""
+
+import json
+from typing import Dict, Iterable, Iterator, List
+
+DEFAULT_API_URL = "https://openrouter.ai/api/v1/chat/completions"
+DEFAULT_MODEL = "meta-llama/llama-3.2-90b-vision-instruct:free"
+
+APP_HEADERS = {
+    "HTTP-Referer": "https://career-shift-analyzer.streamlit.app",
+    "X-Title": "Career Shift Analyzer Pro"
+}
+
+class ChatClientError(Exception):
+    """Raised for non-200 responses and error events inside a stream"""
+
+    def __init__(self, message: str, status_code: int = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+def build_messages(system_prompt: str, user_message: str, conversation_history: List[Dict],
+                   max_history: int = 10) -> List[Dict]:
+    """System prompt, the last `max_history` turns and the new user message"""
+    messages = [{"role": "system", "content": system_prompt}]
+    messages.extend(conversation_history[-max_history:])
+    messages.append({"role": "user", "content": user_message})
+    return messages
+
+def build_payload(messages: List[Dict], model: str = DEFAULT_MODEL, stream: bool = True) -> Dict:
+    return {
+        "model": model,
+        "messages": messages,
+        "max_tokens": 1000,
+        "temperature": 0.7,
+        "top_p": 0.9,
+        "stream": stream
+    }
+
+def build_headers(api_key: str) -> Dict:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        **APP_HEADERS
+    }
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the data payload of each server-sent event
+
+    Handles multi-line data fields, skips comment keep-alives (': OPENROUTER
+    PROCESSING') and stops at the '[DONE]' sentinel.
+    """
+    buffer = []
+    for line in lines:
+        if line is None:
+            continue
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.rstrip("\r")
+
+        if not line:
+            if buffer:
+                data = "\n".join(buffer)
+                buffer = []
+                if data == "[DONE]":
+                    return
+                yield data
+            continue
+        if line.startswith(":"):
+            continue
+        if line.startswith("data:"):
+            buffer.append(line[5:].lstrip(" "))
+
+    if buffer:
+        data = "\n".join(buffer)
+        if data != "[DONE]":
+            yield data
+
+def iter_content_deltas(events: Iterable[str]) -> Iterator[str]:
+    """Turn chat.completion.chunk events into content strings"""
+    for data in events:
+        try:
+            chunk = json.loads(data)
+        except ValueError:
+            continue
+        if "error" in chunk:
+            error = chunk["error"]
+            message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+            raise ChatClientError(message, error.get("code") if isinstance(error, dict) else None)
+        for choice in chunk.get("choices", []):
+            content = (choice.get("delta") or {}).get("content")
+            if content:
+                yield content
+
+# Export functions
+__all__ = [
+    'build_messages',
+    'build_payload',
+    'iter_sse_data',
+    'iter_content_deltas',
+    'build_headers',
+    'ChatClientError',
+    'DEFAULT_API_URL',
+    'DEFAULT_MODEL'
+]
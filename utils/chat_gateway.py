@@ -0,0 +1,293 @@
+# utils/chat_gateway.py - Async chat gateway with single-flight request coalescing
+"""
+One asyncio event loop, on a background thread, serves every Streamlit
+session in the process.
+
+- Identical in-flight requests are coalesced. The key is a hash of the URL,
+  model and full message list (system prompt and history included). Only the
+  first request goes upstream; every caller gets the same token stream,
+  including callers that join half-way through.
+- An asyncio.Semaphore caps outstanding upstream calls, so a burst of clicks
+  queues here instead of tripping OpenRouter rate limits.
+- httpx.AsyncClient keeps pooled keep-alive connections. Retryable statuses
+  are retried with jittered backoff before the first token, and the circuit
+  breaker from utils.http_client is shared.
+
+Streamlit script threads consume the stream through a plain blocking
+iterator (ChatGateway.stream), so pages do not need to be async.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from utils.chat_client import (
+    DEFAULT_API_URL,
+    DEFAULT_MODEL,
+    ChatClientError,
+    build_headers,
+    build_payload,
+    iter_content_deltas,
+    iter_sse_data
+)
+from utils.http_client import RETRY_STATUSES, CircuitBreaker, LatencyTracker, backoff_delay
+from utils.lazy_imports import lazy_import
+
+# Loaded when the gateway starts, not when the chat page is imported
+httpx = lazy_import("httpx")
+
+_DONE = object()
+
+def flight_key(messages: List[Dict], model: str, api_url: str) -> str:
+    """Hash identifying an upstream request; equal keys get the same answer"""
+    canonical = json.dumps([api_url, model, messages], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class Flight:
+    """
+    One upstream request and the callers waiting on it
+
+    Tokens are appended from the event loop thread and pushed to each
+    subscriber's queue; late subscribers first receive a replay of the
+    tokens so far.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.tokens: List[str] = []
+        self.subscribers: List[queue.Queue] = []
+        self.error: Optional[BaseException] = None
+        self.done = False
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        inbox = queue.Queue()
+        with self._lock:
+            for token in self.tokens:
+                inbox.put(token)
+            if self.done:
+                inbox.put(_DONE)
+            else:
+                self.subscribers.append(inbox)
+        return inbox
+
+    def unsubscribe(self, inbox: queue.Queue):
+        with self._lock:
+            if inbox in self.subscribers:
+                self.subscribers.remove(inbox)
+
+    def publish(self, token: str):
+        with self._lock:
+            self.tokens.append(token)
+            for inbox in self.subscribers:
+                inbox.put(token)
+
+    def finish(self, error: BaseException = None):
+        with self._lock:
+            self.error = error
+            self.done = True
+            for inbox in self.subscribers:
+                inbox.put(_DONE)
+            self.subscribers = []
+
+class ChatGateway:
+    """
+    Async, coalescing front end for the chat completions endpoint
+
+    Args:
+        max_upstream: Upstream calls allowed in flight at once
+        max_retries: Retries for 429/5xx and connection errors before the first token
+        backoff_base: First backoff ceiling in seconds; doubles per attempt
+        backoff_max: Upper bound for one backoff sleep
+        read_timeout: Seconds allowed between streamed chunks
+        breaker: Shared CircuitBreaker; a default one is created when None
+    """
+
+    def __init__(self, max_upstream: int = 4, max_retries: int = 3, backoff_base: float = 0.5,
+                 backoff_max: float = 8.0, read_timeout: float = 30.0, breaker: CircuitBreaker = None):
+        self.max_upstream = max_upstream
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.read_timeout = read_timeout
+        self.breaker = breaker or CircuitBreaker()
+        self.metrics = LatencyTracker()
+        self.inflight: Dict[str, Flight] = {}
+        self._lock = threading.Lock()
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="chat-gateway", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._setup(), self.loop).result()
+
+    async def _setup(self):
+        # Both must be created on the loop that uses them
+        self.semaphore = asyncio.Semaphore(self.max_upstream)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.read_timeout, connect=5.0),
+            limits=httpx.Limits(max_connections=self.max_upstream, max_keepalive_connections=self.max_upstream)
+        )
+
+    def stream(self, messages: List[Dict], api_key: str, api_url: str = DEFAULT_API_URL,
+               model: str = DEFAULT_MODEL) -> Iterator[str]:
+        """
+        Blocking iterator over the answer's content deltas
+
+        Joins an identical in-flight request when there is one, otherwise
+        starts a new upstream call on the gateway loop.
+
+        Raises:
+            ChatClientError: Non-200 status (after retries) or an error event in the stream
+            HTTPClientError: Circuit open
+            httpx.HTTPError: Connection problems (after retries)
+        """
+        key = flight_key(messages, model, api_url)
+        with self._lock:
+            flight = self.inflight.get(key)
+            if flight is None:
+                flight = self.inflight[key] = Flight(key)
+                self.metrics.increment("upstream_calls")
+                asyncio.run_coroutine_threadsafe(self._run(flight, messages, api_key, api_url, model), self.loop)
+            else:
+                self.metrics.increment("coalesced")
+            inbox = flight.subscribe()
+
+        try:
+            while True:
+                item = inbox.get(timeout=self.read_timeout * (self.max_retries + 2))
+                if item is _DONE:
+                    break
+                yield item
+        except queue.Empty:
+            raise ChatClientError("Timed out waiting for the chat gateway")
+        finally:
+            flight.unsubscribe(inbox)
+
+        if flight.error is not None:
+            raise flight.error
+
+    def complete(self, messages: List[Dict], api_key: str, api_url: str = DEFAULT_API_URL,
+                 model: str = DEFAULT_MODEL) -> str:
+        """Whole answer; coalesces with streaming callers of the same request"""
+        return "".join(self.stream(messages, api_key, api_url, model))
+
+    async def _run(self, flight: Flight, messages: List[Dict], api_key: str, api_url: str, model: str):
+        queued = time.perf_counter()
+        try:
+            self.breaker.before_request()
+            failed = True
+            try:
+                async with self.semaphore:
+                    self.metrics.observe("queue_wait", time.perf_counter() - queued)
+                    await self._call_upstream(flight, messages, api_key, api_url, model)
+                failed = False
+            except ChatClientError as error:
+                # A 4xx answer means the upstream is up; errors inside the stream carry no status
+                failed = error.status_code is None or error.status_code in RETRY_STATUSES
+                raise
+            finally:
+                # Exactly one outcome per admitted request, so a half-open trial is always released
+                if failed:
+                    self.breaker.record_failure()
+                else:
+                    self.breaker.record_success()
+            flight.finish()
+        except BaseException as error:
+            flight.finish(error)
+        finally:
+            with self._lock:
+                self.inflight.pop(flight.key, None)
+            self.metrics.observe("stream", time.perf_counter() - queued)
+
+    async def _call_upstream(self, flight: Flight, messages: List[Dict], api_key: str, api_url: str,
+                             model: str):
+        request = self.client.build_request(
+            "POST", api_url, headers=build_headers(api_key), json=build_payload(messages, model, stream=True)
+        )
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = await self.client.send(request, stream=True)
+            except httpx.TransportError:
+                self.metrics.increment("connection_errors")
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max))
+                attempt += 1
+                self.metrics.increment("retries")
+                continue
+
+            self.metrics.observe("response_headers", time.perf_counter() - start)
+            if response.status_code == 200:
+                break
+
+            body = (await response.aread()).decode("utf-8", "replace")
+            await response.aclose()
+            if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                raise ChatClientError(f"API Error {response.status_code}: {body}", response.status_code)
+            await asyncio.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max,
+                                              response.headers.get("Retry-After")))
+            attempt += 1
+            self.metrics.increment("retries")
+
+        try:
+            event = []
+            async for line in response.aiter_lines():
+                event.append(line)
+                if line:
+                    continue
+                # A blank line ends an SSE event; reuse the sync parser on it
+                for token in iter_content_deltas(iter_sse_data(event)):
+                    if not flight.tokens:
+                        self.metrics.observe("first_token", time.perf_counter() - start)
+                    flight.publish(token)
+                event = []
+            for token in iter_content_deltas(iter_sse_data(event)):
+                flight.publish(token)
+        finally:
+            await response.aclose()
+
+    def stats(self) -> Dict:
+        """Latency percentiles, coalescing counters and breaker state"""
+        summary = self.metrics.summary()
+        summary["circuit"] = self.breaker.state
+        summary["inflight"] = len(self.inflight)
+        return summary
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.client.aclose(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+_gateway: Optional[ChatGateway] = None
+_gateway_lock = threading.Lock()
+
+def get_chat_gateway() -> ChatGateway:
+    """Process-wide gateway (CHAT_MAX_UPSTREAM / LLM_MAX_RETRIES override defaults)"""
+    global _gateway
+    if _gateway is None:
+        with _gateway_lock:
+            if _gateway is None:
+                _gateway = ChatGateway(
+                    max_upstream=int(os.getenv("CHAT_MAX_UPSTREAM", 4)),
+                    max_retries=int(os.getenv("LLM_MAX_RETRIES", 3))
+                )
+    return _gateway
+
+def peek_gateway() -> Optional[ChatGateway]:
+    """The process-wide gateway if a request has created it, else None (never starts the loop)"""
+    return _gateway
+
+# Export functions
+__all__ = [
+    'ChatGateway',
+    'Flight',
+    'flight_key',
+    'get_chat_gateway',
+    'peek_gateway'
+]
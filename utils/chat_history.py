@@ -0,0 +1,182 @@
+# utils/chat_history.py - Token-budgeted conversation history for the chat assistant
+"""
+Fits chat history into a prompt token budget instead of a fixed message count.
+
+The newest messages are sent verbatim for as long as they fit. Older messages
+are folded into a rolling extractive summary: the highest-scoring sentences by
+term frequency, kept in conversation order. The summary is sent as one extra
+system message. Token counts come from a local approximation, so no tokenizer
+download is needed.
+"""
+
+import math
+import os
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+DEFAULT_TOKEN_BUDGET = 2000
+DEFAULT_SUMMARY_SHARE = 0.3
+MESSAGE_OVERHEAD = 4  # role and separator tokens per chat message
+SUMMARY_HEADER = "Summary of the earlier conversation (older messages condensed):"
+
+_PIECES = re.compile(r"\w+|[^\w\s]")
+_SENTENCES = re.compile(r"(?<=[.!?])\s+|\n+")
+_MARKDOWN = re.compile(r"^[\s#>*\-\d.)]+|[*_`]+")
+_WORDS = re.compile(r"[a-z][a-z0-9+#/-]+")
+
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further get had has have having he her here
+hers him his how i if in into is it its just me more most my no nor not now of off on once only or other our
+out over own same she should so some such than that the their them then there these they this those through
+to too under until up very was we were what when where which while who whom why will with would you your
+""".split())
+
+def count_tokens(text: str) -> int:
+    """
+    Approximate BPE token count
+
+    Words up to four characters count as one token and longer words as one
+    token per four characters. Each punctuation mark counts as one token.
+    This is within about 10% of Llama/GPT tokenizers on English prose.
+    """
+    return sum(math.ceil(len(piece) / 4) for piece in _PIECES.findall(text))
+
+def count_message_tokens(messages: List[Dict]) -> int:
+    return sum(count_tokens(message["content"]) + MESSAGE_OVERHEAD for message in messages)
+
+def split_sentences(text: str) -> List[str]:
+    """Sentences with list markers, headings and emphasis stripped"""
+    sentences = []
+    for part in _SENTENCES.split(text):
+        sentence = _MARKDOWN.sub("", part).strip()
+        if len(sentence) > 3:
+            sentences.append(sentence)
+    return sentences
+
+class HistoryManager:
+    """
+    Builds the message list for one chat turn within a token budget
+
+    Keep one manager per conversation (e.g. in st.session_state); it remembers
+    which messages are already summarized so the summary rolls forward instead
+    of being rebuilt from scratch each turn.
+
+    Args:
+        token_budget: Maximum prompt tokens (system prompt, summary, history and new message)
+        summary_share: Fraction of the budget left for history that the summary may use
+    """
+
+    def __init__(self, token_budget: int = DEFAULT_TOKEN_BUDGET, summary_share: float = DEFAULT_SUMMARY_SHARE):
+        self.token_budget = token_budget
+        self.summary_share = summary_share
+        self.reset()
+
+    def reset(self):
+        self.summarized = 0          # messages from the start already folded into the summary
+        self.summary_sentences = []  # (order, role, sentence) kept so far
+
+    def _summary_text(self) -> str:
+        lines = [f"- {'User' if role == 'user' else 'Advisor'}: {sentence}"
+                 for _, role, sentence in self.summary_sentences]
+        return SUMMARY_HEADER + "\n" + "\n".join(lines) if lines else ""
+
+    def _fold(self, messages: List[Dict], start: int, budget: int):
+        """Merge newly evicted messages into the summary, keeping the best sentences within `budget`"""
+        candidates = list(self.summary_sentences)
+        for offset, message in enumerate(messages):
+            for sentence in split_sentences(message["content"]):
+                candidates.append((start + offset, message["role"], sentence))
+
+        frequencies = Counter(
+            word for _, _, sentence in candidates for word in _WORDS.findall(sentence.lower())
+            if word not in STOP_WORDS
+        )
+
+        def score(candidate):
+            _, role, sentence = candidate
+            words = [w for w in _WORDS.findall(sentence.lower()) if w not in STOP_WORDS]
+            if not words:
+                return 0.0
+            value = sum(frequencies[w] for w in words) / math.sqrt(len(words))
+            # What the user asked carries more context than how it was answered
+            return value * (1.5 if role == "user" else 1.0)
+
+        kept, seen, used = [], set(), count_tokens(SUMMARY_HEADER) + MESSAGE_OVERHEAD
+        for candidate in sorted(candidates, key=score, reverse=True):
+            text = candidate[2].lower()
+            cost = count_tokens(candidate[2]) + 4  # "- Advisor: " prefix and newline
+            if text not in seen and used + cost <= budget:
+                kept.append(candidate)
+                seen.add(text)
+                used += cost
+        self.summary_sentences = sorted(kept, key=lambda candidate: candidate[0])
+
+    def build(self, system_prompt: str, history: List[Dict], user_message: str) -> Tuple[List[Dict], Dict]:
+        """
+        Messages to send for this turn and a token report
+
+        Args:
+            system_prompt: System prompt, always sent
+            history: Whole conversation so far as {"role", "content"} dicts
+            user_message: The new question
+
+        Returns:
+            (messages, report) where report has prompt_tokens, verbatim_messages,
+            summarized_messages and summary_tokens
+        """
+        if len(history) < self.summarized:
+            self.reset()  # conversation was cleared or replaced
+
+        fixed = count_tokens(system_prompt) + count_tokens(user_message) + 2 * MESSAGE_OVERHEAD
+        available = max(self.token_budget - fixed, 0)
+        summary_budget = int(available * self.summary_share)
+
+        def fit(limit: int) -> int:
+            """Index of the oldest message kept when filling `limit` tokens newest-first"""
+            cut, used = len(history), 0
+            while cut > self.summarized:
+                cost = count_tokens(history[cut - 1]["content"]) + MESSAGE_OVERHEAD
+                if used + cost > limit:
+                    break
+                used += cost
+                cut -= 1
+            return cut
+
+        summary_cost = count_tokens(self._summary_text()) + MESSAGE_OVERHEAD if self.summary_sentences else 0
+        cut = fit(available - summary_cost)
+        if cut > self.summarized:
+            # Something has to go: leave room for a full-size summary and fold the overflow into it
+            cut = fit(available - summary_budget)
+            self._fold(history[self.summarized:cut], self.summarized, summary_budget)
+            self.summarized = cut
+
+        messages = [{"role": "system", "content": system_prompt}]
+        summary = self._summary_text()
+        if summary:
+            messages.append({"role": "system", "content": summary})
+        messages.extend({"role": m["role"], "content": m["content"]} for m in history[cut:])
+        messages.append({"role": "user", "content": user_message})
+
+        report = {
+            "prompt_tokens": count_message_tokens(messages),
+            "verbatim_messages": len(history) - cut,
+            "summarized_messages": cut,
+            "summary_tokens": count_tokens(summary) + MESSAGE_OVERHEAD if summary else 0
+        }
+        return messages, report
+
+def history_token_budget() -> int:
+    """Prompt token budget from CHAT_TOKEN_BUDGET, defaulting to DEFAULT_TOKEN_BUDGET"""
+    return int(os.getenv("CHAT_TOKEN_BUDGET", DEFAULT_TOKEN_BUDGET))
+
+# Export functions
+__all__ = [
+    'HistoryManager',
+    'count_tokens',
+    'count_message_tokens',
+    'split_sentences',
+    'history_token_budget',
+    'DEFAULT_TOKEN_BUDGET'
+]
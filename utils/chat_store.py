@@ -0,0 +1,290 @@
+# utils/chat_store.py - Append-only SQLite store for chat assistant conversations
+"""
+Chat messages are appended to a SQLite database in WAL mode, keyed by session
+id, instead of living in st.session_state.
+
+- Each append is one short transaction; stored messages are never rewritten.
+- Pages are read by sequence number through the primary key, so showing the
+  latest 20 messages costs the same at turn 10 and at turn 1000.
+- Exports are generated in batches and written chunk by chunk.
+- A session records a hash of its owner's identity, and is_owner() checks it
+  before a conversation is resumed from a link.
+- Sessions idle for longer than the retention period are purged. Anonymous
+  sessions (no owner) can never be resumed, so they are kept only for a short
+  anonymous retention period.
+
+The database path defaults to data/chat_sessions.sqlite3 and can be overridden
+with CHAT_STORE_PATH; CHAT_RETENTION_DAYS sets the retention (default 30) and
+CHAT_ANONYMOUS_RETENTION_HOURS the anonymous retention (default 2).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, TextIO
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                  "data", "chat_sessions.sqlite3")
+
+DEFAULT_RETENTION_DAYS = 30.0
+DEFAULT_ANONYMOUS_RETENTION_HOURS = 2.0
+# Purges run from create_session, at most this often
+PURGE_INTERVAL = 3600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_sessions (
+    session_id TEXT PRIMARY KEY,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    user_count INTEGER NOT NULL DEFAULT 0,
+    owner_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS chat_sessions_updated ON chat_sessions (updated);
+CREATE TABLE IF NOT EXISTS chat_messages (
+    session_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT,
+    created REAL NOT NULL,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+"""
+
+def owner_hash(owner: str) -> str:
+    return hashlib.sha256(owner.encode("utf-8")).hexdigest()
+
+class ChatStore:
+    """
+    Per-session, append-only message log
+
+    Every call opens and closes its own connection. Streamlit runs scripts on
+    many short-lived threads, SQLite connections must not be shared between
+    threads, and per-thread connections would never be closed.
+
+    Args:
+        path: SQLite database file
+        retention_days: Sessions not updated for this long are purged
+        anonymous_retention_hours: Same, for sessions created without an owner
+    """
+
+    def __init__(self, path: str = DEFAULT_STORE_PATH, retention_days: float = DEFAULT_RETENTION_DAYS,
+                 anonymous_retention_hours: float = DEFAULT_ANONYMOUS_RETENTION_HOURS):
+        self.path = path
+        self.retention = retention_days * 86400
+        self.anonymous_retention = min(anonymous_retention_hours * 3600, self.retention)
+        self._last_purge = 0.0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with closing(self._connect()) as conn:
+            # WAL is a property of the database file, so setting it once is enough
+            conn.execute("PRAGMA journal_mode=WAL")
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(chat_sessions)")}
+            if columns and "owner_hash" not in columns:
+                conn.execute("ALTER TABLE chat_sessions ADD COLUMN owner_hash TEXT")
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def create_session(self, owner: str = None) -> str:
+        """
+        New empty session
+
+        Args:
+            owner: Identity allowed to resume the session later; None makes it unresumable
+        """
+        session_id = uuid.uuid4().hex
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO chat_sessions (session_id, created, updated, owner_hash) VALUES (?, ?, ?, ?)",
+                (session_id, now, now, owner_hash(owner) if owner else None)
+            )
+        if now - self._last_purge >= PURGE_INTERVAL:
+            self._last_purge = now
+            self.purge_expired(now)
+        return session_id
+
+    def _session_row(self, session_id: str) -> Optional[sqlite3.Row]:
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT updated, owner_hash FROM chat_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+
+    def session_exists(self, session_id: str) -> bool:
+        return self._session_row(session_id) is not None
+
+    def is_owner(self, session_id: str, owner: Optional[str]) -> bool:
+        """True when `owner` created the session and it has not expired"""
+        row = self._session_row(session_id)
+        if row is None or not owner or row["owner_hash"] is None:
+            return False
+        if time.time() - row["updated"] > self.retention:
+            return False
+        return row["owner_hash"] == owner_hash(owner)
+
+    def purge_expired(self, now: float = None) -> int:
+        """Delete sessions idle for longer than their retention period; returns sessions deleted"""
+        now = now or time.time()
+        expired = "updated < ? OR (owner_hash IS NULL AND updated < ?)"
+        cutoffs = (now - self.retention, now - self.anonymous_retention)
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "DELETE FROM chat_messages WHERE session_id IN "
+                    f"(SELECT session_id FROM chat_sessions WHERE {expired})", cutoffs
+                )
+                deleted = conn.execute(f"DELETE FROM chat_sessions WHERE {expired}", cutoffs).rowcount
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return deleted
+
+    def append(self, session_id: str, role: str, content: str, timestamp: str = None) -> int:
+        """Append one message and return its sequence number (0-based)"""
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT message_count FROM chat_sessions WHERE session_id = ?", (session_id,)
+                ).fetchone()
+                if row is None:
+                    raise KeyError(f"Unknown chat session: {session_id}")
+                seq = row[0]
+                conn.execute(
+                    "UPDATE chat_sessions SET message_count = message_count + 1, "
+                    "user_count = user_count + ?, updated = ? WHERE session_id = ?",
+                    (1 if role == "user" else 0, now, session_id)
+                )
+                conn.execute(
+                    "INSERT INTO chat_messages (session_id, seq, role, content, timestamp, created) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (session_id, seq, role, content, timestamp, now)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return seq
+
+    def counts(self, session_id: str) -> Dict[str, int]:
+        """{"messages": n, "user": n, "assistant": n} from the session row, without scanning messages"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT message_count, user_count FROM chat_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        total, users = (row[0], row[1]) if row else (0, 0)
+        return {"messages": total, "user": users, "assistant": total - users}
+
+    def _rows(self, query: str, params: tuple) -> List[Dict]:
+        with closing(self._connect()) as conn:
+            return [dict(row) for row in conn.execute(query, params)]
+
+    def page(self, session_id: str, start: int, limit: int) -> List[Dict]:
+        """Messages with start <= seq < start + limit, oldest first"""
+        return self._rows(
+            "SELECT seq, role, content, timestamp FROM chat_messages "
+            "WHERE session_id = ? AND seq >= ? AND seq < ? ORDER BY seq",
+            (session_id, start, start + limit)
+        )
+
+    def tail(self, session_id: str, limit: int) -> List[Dict]:
+        """The last `limit` messages, oldest first"""
+        total = self.counts(session_id)["messages"]
+        start = max(total - limit, 0)
+        return self.page(session_id, start, total - start)
+
+    def last(self, session_id: str) -> Optional[Dict]:
+        rows = self.tail(session_id, 1)
+        return rows[0] if rows else None
+
+    def history(self, session_id: str, start: int = 0) -> List[Dict]:
+        """{"role", "content"} dicts from seq `start` on, for building LLM prompts"""
+        return self._rows(
+            "SELECT role, content FROM chat_messages WHERE session_id = ? AND seq >= ? ORDER BY seq",
+            (session_id, start)
+        )
+
+    def iter_messages(self, session_id: str, batch_size: int = 500) -> Iterator[Dict]:
+        """Every message in order, read `batch_size` rows at a time"""
+        start = 0
+        while True:
+            rows = self.page(session_id, start, batch_size)
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            start += batch_size
+
+    def iter_export_json(self, session_id: str, batch_size: int = 500) -> Iterator[str]:
+        """
+        JSON export as text chunks
+
+        Produces the same document shape as the old in-memory export,
+        {"timestamp", "messages": [...]}, without building it in memory.
+        """
+        yield '{"timestamp": ' + json.dumps(datetime.now().isoformat()) + ', "messages": ['
+        for index, message in enumerate(self.iter_messages(session_id, batch_size)):
+            yield ("," if index else "") + "\n" + json.dumps({
+                "role": message["role"],
+                "content": message["content"],
+                "timestamp": message["timestamp"]
+            }, ensure_ascii=False)
+        yield "\n]}\n"
+
+    def export_bytes(self, session_id: str) -> bytes:
+        """The whole JSON export as UTF-8, for st.download_button"""
+        return "".join(self.iter_export_json(session_id)).encode("utf-8")
+
+    def export_json(self, session_id: str, out: TextIO) -> int:
+        """Write the JSON export to `out`; returns characters written"""
+        written = 0
+        for chunk in self.iter_export_json(session_id):
+            out.write(chunk)
+            written += len(chunk)
+        return written
+
+    def delete_session(self, session_id: str):
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM chat_messages WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM chat_sessions WHERE session_id = ?", (session_id,))
+            conn.execute("COMMIT")
+
+_store: Optional[ChatStore] = None
+_store_lock = threading.Lock()
+
+def get_chat_store() -> ChatStore:
+    """Process-wide store at CHAT_STORE_PATH (default data/chat_sessions.sqlite3)"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ChatStore(
+                    os.getenv("CHAT_STORE_PATH", DEFAULT_STORE_PATH),
+                    float(os.getenv("CHAT_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)),
+                    float(os.getenv("CHAT_ANONYMOUS_RETENTION_HOURS", DEFAULT_ANONYMOUS_RETENTION_HOURS))
+                )
+    return _store
+
+# Export functions
+__all__ = [
+    'ChatStore',
+    'get_chat_store',
+    'owner_hash',
+    'DEFAULT_STORE_PATH',
+    'DEFAULT_RETENTION_DAYS',
+    'DEFAULT_ANONYMOUS_RETENTION_HOURS'
+]
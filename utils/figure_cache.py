@@ -0,0 +1,172 @@
+# utils/figure_cache.py - LRU cache of built Plotly figures keyed by builder, arguments and catalog version
+"""
+Chart builders take a handful of inputs from small, fixed sets (a career
+field and a city, a scenario and a time commitment), yet every rerun rebuilt
+the figure. Building and validating a go.Figure takes a few milliseconds per
+chart.
+
+    fig = cached_figure(create_indonesia_salary_chart, career_field, city)
+    st.plotly_chart(fig, use_container_width=True)
+
+The first call builds the figure and stores its plain dict (the form
+st.plotly_chart serializes). Later calls return a CachedFigure whose to_dict()
+hands back that stored dict, so the rerun skips construction, validation and
+the deep copy in to_dict(). figure_json() returns the serialized JSON,
+memoized too, for exports and snapshots.
+
+Keys are (builder, arguments, catalog version), so a catalog reload starts
+fresh. Builders whose arguments are not hashable (DataFrames, Scenario views)
+pass an explicit cache_key describing what the figure depends on. Entries are
+shared across sessions; treat returned figures as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional
+
+from utils.catalog import catalog_version
+from utils.lazy_imports import lazy_import
+
+go = lazy_import("plotly.graph_objects")
+pio = lazy_import("plotly.io")
+
+DEFAULT_MAX_ENTRIES = 256
+
+_figure_class = None
+
+def _cached_figure_class():
+    """CachedFigure is defined on first use so importing this module does not import plotly"""
+    global _figure_class
+    if _figure_class is None:
+        class CachedFigure(go.Figure):
+            """Figure rebuilt without validation whose to_dict() returns the cached dict"""
+
+            def to_dict(self):
+                return self._cached_dict
+
+        _figure_class = CachedFigure
+    return _figure_class
+
+class FigureEntry:
+    """One cached figure: the plain dict, plus the render figure and JSON built on demand"""
+
+    __slots__ = ("spec", "_figure", "_json")
+
+    def __init__(self, spec: Dict):
+        self.spec = spec
+        self._figure = None
+        self._json = None
+
+    @property
+    def figure(self):
+        if self._figure is None:
+            figure = _cached_figure_class()(self.spec, _validate=False)
+            figure._cached_dict = self.spec
+            self._figure = figure
+        return self._figure
+
+    @property
+    def json(self) -> str:
+        if self._json is None:
+            self._json = pio.to_json(self.spec, validate=False)
+        return self._json
+
+class FigureCache:
+    """
+    Thread-safe LRU of FigureEntry objects
+
+    Args:
+        max_entries: Entries kept before the least recently used one is evicted
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, FigureEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.uncacheable = 0
+
+    @staticmethod
+    def make_key(builder: Callable, args: tuple, kwargs: Dict, cache_key: Optional[Hashable]) -> tuple:
+        identity = cache_key if cache_key is not None else (args, tuple(sorted(kwargs.items())))
+        return (builder.__module__, builder.__qualname__, identity, catalog_version())
+
+    def entry(self, builder: Callable, *args, cache_key: Optional[Hashable] = None, **kwargs) -> FigureEntry:
+        """Cached entry for builder(*args, **kwargs), building it on a miss"""
+        key = self.make_key(builder, args, kwargs, cache_key)
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable arguments without a cache_key: build every time rather than fail
+            with self._lock:
+                self.uncacheable += 1
+            return FigureEntry(builder(*args, **kwargs).to_dict())
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # Build outside the lock; two sessions racing on the same key both build, one copy is kept
+        entry = FigureEntry(builder(*args, **kwargs).to_dict())
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable
+            }
+
+_cache: Optional[FigureCache] = None
+_cache_lock = threading.Lock()
+
+def get_figure_cache() -> FigureCache:
+    """Process-wide figure cache (FIGURE_CACHE_SIZE overrides the entry limit)"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = FigureCache(int(os.getenv("FIGURE_CACHE_SIZE", DEFAULT_MAX_ENTRIES)))
+    return _cache
+
+def cached_figure(builder: Callable, *args, cache_key: Optional[Hashable] = None, **kwargs):
+    """
+    Figure from builder(*args, **kwargs), built once per key and catalog version
+
+    Args:
+        builder: Function returning a go.Figure
+        cache_key: Hashable stand-in for the arguments when they are not hashable
+            themselves; it must capture everything the figure depends on
+    """
+    return get_figure_cache().entry(builder, *args, cache_key=cache_key, **kwargs).figure
+
+def figure_json(builder: Callable, *args, cache_key: Optional[Hashable] = None, **kwargs) -> str:
+    """Serialized Plotly JSON for builder(*args, **kwargs), memoized like cached_figure"""
+    return get_figure_cache().entry(builder, *args, cache_key=cache_key, **kwargs).json
+
+# Export functions
+__all__ = [
+    'FigureCache',
+    'FigureEntry',
+    'cached_figure',
+    'figure_json',
+    'get_figure_cache',
+    'DEFAULT_MAX_ENTRIES'
+]
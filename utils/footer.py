@@ -3,6 +3,9 @@ import streamlit as st
 from datetime import datetime
 import os
 
+from utils.catalog import catalog_version
+from utils.fragments import render_styles
+
 def get_app_version():
     """Get application version"""
     try:
@@ -20,242 +23,10 @@ def render_universal_footer():
     current_year = datetime.now().year
     last_updated = datetime.now().strftime("%B %d, %Y")
     version = get_app_version()
+    data_version = catalog_version()
     
-    # Footer CSS with dark purple neon theme
-    st.markdown("""
-    <style>
-        .universal-footer {
-            background: linear-gradient(135deg, rgba(13, 13, 13, 0.95), rgba(26, 14, 46, 0.95));
-            border: 2px solid #8b45ff;
-            color: #e0e0ff;
-            padding: 4rem 2rem;
-            border-radius: 25px;
-            margin-top: 4rem;
-            box-shadow: 
-                0 0 40px rgba(139, 69, 255, 0.4),
-                inset 0 0 40px rgba(139, 69, 255, 0.1);
-            backdrop-filter: blur(20px);
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .universal-footer::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: 
-                radial-gradient(circle at 20% 50%, rgba(139, 69, 255, 0.05) 0%, transparent 50%),
-                radial-gradient(circle at 80% 20%, rgba(255, 69, 255, 0.05) 0%, transparent 50%);
-            animation: footerGlow 8s ease-in-out infinite;
-            pointer-events: none;
-        }
-        
-        @keyframes footerGlow {
-            0%, 100% { opacity: 0.5; }
-            50% { opacity: 1; }
-        }
-        
-        .footer-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 3rem;
-            margin-bottom: 3rem;
-            position: relative;
-            z-index: 1;
-        }
-        
-        .footer-section {
-            position: relative;
-            z-index: 1;
-        }
-        
-        .footer-section h4 {
-            color: #ff45ff;
-            margin-bottom: 1.5rem;
-            font-size: 1.2em;
-            font-family: 'Orbitron', monospace;
-            text-shadow: 0 0 10px #ff45ff;
-            border-bottom: 2px solid rgba(255, 69, 255, 0.3);
-            padding-bottom: 0.5rem;
-        }
-        
-        .disclaimer-box {
-            background: rgba(139, 69, 255, 0.1);
-            border: 1px solid rgba(139, 69, 255, 0.3);
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin: 1rem 0;
-            font-size: 0.9em;
-            backdrop-filter: blur(10px);
-            transition: all 0.3s ease;
-        }
-        
-        .disclaimer-box:hover {
-            background: rgba(139, 69, 255, 0.15);
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(139, 69, 255, 0.2);
-        }
-        
-        .team-section {
-            background: rgba(139, 69, 255, 0.1);
-            border: 2px solid #8b45ff;
-            border-radius: 20px;
-            padding: 2.5rem;
-            margin: 2rem 0;
-            backdrop-filter: blur(15px);
-            transition: all 0.4s ease;
-        }
-        
-        .team-section:hover {
-            border-color: #ff45ff;
-            transform: translateY(-5px);
-            box-shadow: 0 15px 30px rgba(255, 69, 255, 0.3);
-        }
-        
-        .team-members {
-            display: flex;
-            justify-content: center;
-            gap: 2rem;
-            margin: 1.5rem 0;
-            flex-wrap: wrap;
-        }
-        
-        .team-member {
-            background: rgba(255, 69, 255, 0.1);
-            padding: 1.5rem 2rem;
-            border-radius: 25px;
-            border: 2px solid #ff45ff;
-            transition: all 0.4s cubic-bezier(0.25, 0.8, 0.25, 1);
-            backdrop-filter: blur(10px);
-            text-align: center;
-            min-width: 160px;
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .team-member::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255, 69, 255, 0.2), transparent);
-            transition: left 0.6s;
-        }
-        
-        .team-member:hover::before {
-            left: 100%;
-        }
-        
-        .team-member:hover {
-            transform: translateY(-8px) scale(1.05);
-            border-color: #8b45ff;
-            box-shadow: 0 15px 30px rgba(255, 69, 255, 0.4);
-            background: rgba(255, 69, 255, 0.15);
-        }
-        
-        .team-member strong {
-            color: #ff45ff;
-            font-size: 1.1em;
-            display: block;
-            margin-bottom: 0.5rem;
-            text-shadow: 0 0 5px #ff45ff;
-            font-family: 'Orbitron', monospace;
-        }
-        
-        .footer-bottom {
-            border-top: 2px solid rgba(139, 69, 255, 0.3);
-            padding-top: 2rem;
-            text-align: center;
-            font-size: 0.9em;
-            color: #e0e0ff;
-            position: relative;
-            z-index: 1;
-        }
-        
-        .status-indicator {
-            display: inline-block;
-            width: 10px;
-            height: 10px;
-            background: #00ff88;
-            border-radius: 50%;
-            margin-right: 0.8rem;
-            animation: pulse 2s infinite;
-            box-shadow: 0 0 10px #00ff88;
-        }
-        
-        @keyframes pulse {
-            0% { opacity: 1; transform: scale(1); }
-            50% { opacity: 0.5; transform: scale(1.2); }
-            100% { opacity: 1; transform: scale(1); }
-        }
-        
-        .footer-link {
-            color: #ff45ff;
-            text-decoration: none;
-            transition: all 0.3s ease;
-            padding: 0.2rem 0.5rem;
-            border-radius: 5px;
-        }
-        
-        .footer-link:hover {
-            color: #8b45ff;
-            background: rgba(255, 69, 255, 0.1);
-            text-shadow: 0 0 10px #ff45ff;
-            transform: translateY(-1px);
-        }
-        
-        .warning-box {
-            background: rgba(255, 193, 7, 0.1);
-            border: 2px solid rgba(255, 193, 7, 0.3);
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin: 1rem 0;
-            color: #ffcc00;
-        }
-        
-        .danger-box {
-            background: rgba(255, 69, 69, 0.1);
-            border: 2px solid rgba(255, 69, 69, 0.3);
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin: 1rem 0;
-            color: #ff4545;
-        }
-        
-        .info-box {
-            background: rgba(0, 255, 136, 0.1);
-            border: 2px solid rgba(0, 255, 136, 0.3);
-            border-radius: 12px;
-            padding: 1.5rem;
-            margin: 1rem 0;
-            color: #00ff88;
-        }
-        
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .universal-footer {
-                padding: 3rem 1rem;
-                border-radius: 15px;
-            }
-            .footer-grid {
-                grid-template-columns: 1fr;
-                gap: 2rem;
-            }
-            .team-members {
-                flex-direction: column;
-                align-items: center;
-            }
-            .team-member {
-                min-width: 200px;
-            }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Footer CSS with dark purple neon theme (styles/footer.css)
+    render_styles("footer")
     
     # Footer HTML content
     footer_html = f"""
@@ -266,6 +37,7 @@ def render_universal_footer():
                 <h4>🚀 Career Shift Analyzer Pro</h4>
                 <p><span class="status-indicator"></span><strong>Status:</strong> Online & Active</p>
                 <p><strong>Version:</strong> v{version}</p>
+                <p><strong>Data Catalog:</strong> {data_version}</p>
                 <p><strong>Last Updated:</strong> {last_updated}</p>
                 <p><strong>Platform:</strong> Streamlit Cloud</p>
                 <p><strong>AI Model:</strong> Meta Llama 3.2</p>
@@ -323,12 +95,12 @@ def render_universal_footer():
                     <p style="margin-bottom: 1rem;"><strong>🛡️ Your Data Security & Privacy:</strong></p>
                     <ul style="list-style: none; padding: 0; font-size: 0.85em; line-height: 1.6;">
                         <li>• <strong>NO PERMANENT STORAGE:</strong> Personal data is not permanently stored on our servers</li>
-                        <li>• <strong>SESSION-BASED:</strong> Chat conversations and assessments are temporary and session-based only</li>
+                        <li>• <strong>CHAT HISTORY:</strong> Chat conversations are stored on our server so they survive page reloads; assessments are session-based only</li>
                         <li>• <strong>LOCAL PROCESSING:</strong> Skill assessments processed locally in your browser when possible</li>
                         <li>• <strong>THIRD-PARTY APIs:</strong> AI features use external APIs governed by separate privacy policies</li>
-                        <li>• <strong>AUTO-CLEAR:</strong> All session data automatically cleared when browser is closed</li>
+                        <li>• <strong>AUTO-CLEAR:</strong> Anonymous conversations are deleted on "New Conversation" or after 2 hours of inactivity</li>
                         <li>• <strong>NO TRACKING:</strong> We do not use tracking cookies or collect analytics beyond basic usage</li>
-                        <li>• <strong>DATA RETENTION:</strong> No conversation history retained after session ends</li>
+                        <li>• <strong>DATA RETENTION:</strong> Conversations of signed-in users can be resumed for 30 days, then are deleted</li>
                         <li>• <strong>ENCRYPTION:</strong> All data transmission is encrypted using industry-standard protocols</li>
                     </ul>
                 </div>
@@ -0,0 +1,273 @@
+# utils/fragments.py - Minified, hashed CSS bundles and a versioned cache of rendered HTML fragments
+"""
+Every page used to inject its own multi-kilobyte <style> block on each rerun,
+and repeated the dark theme rules it shares with the other pages. The
+stylesheets now live in styles/*.css:
+
+- base.css: keyframes and typography used by the landing page, simulation and chat
+- neon.css: the purple neon theme shared by the simulation and chat pages
+- one sheet per page (main, simulation, skill_gap, chat, indonesia, footer)
+
+STYLE_BUNDLES lists the sheets each page needs. A bundle is read and minified
+once, then served from memory until a source file changes:
+
+    render_styles("simulation")
+
+STYLE_DELIVERY=static serves each sheet as /app/static/css/<sheet>.<hash>.css
+instead of inlining it. The browser then caches the shared sheets across pages
+and reruns, and the rerun only carries the <link> tags. This needs
+server.enableStaticServing and the files written by `python -m utils.fragments`;
+without either, the bundle is inlined.
+
+cached_fragment() memoizes HTML built from catalog data (the landing page cards)
+per builder, arguments and catalog version, like utils.figure_cache does for
+charts.
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+import streamlit as st
+
+from utils.catalog import catalog_version
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STYLES_DIR = os.path.join(BASE_DIR, "styles")
+# Streamlit serves <app dir>/static at app/static when static serving is on
+STATIC_DIR = os.path.join(BASE_DIR, "static", "css")
+STATIC_URL = "app/static/css"
+
+STYLE_BUNDLES = {
+    "main": ("base", "main"),
+    "simulation": ("base", "neon", "simulation"),
+    "skill_gap": ("skill_gap",),
+    "chat": ("base", "neon", "chat"),
+    "indonesia": ("indonesia",),
+    "footer": ("footer",)
+}
+
+DEFAULT_MAX_FRAGMENTS = 128
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_STRINGS = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+_IMPORTS = re.compile(r"""@import(?:"[^"]*"|'[^']*'|[^;"'])*;""")
+
+def minify_css(css: str) -> str:
+    """Strip comments and redundant whitespace; quoted strings are left untouched"""
+    parts = _STRINGS.split(_COMMENTS.sub("", css))
+    for i in range(0, len(parts), 2):
+        text = " ".join(parts[i].split())
+        text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+        parts[i] = re.sub(r":\s+", ":", text).replace(";}", "}")
+    return "".join(parts).strip()
+
+def hoist_imports(css: str) -> str:
+    """Move @import rules to the front; browsers ignore them anywhere else"""
+    imports = _IMPORTS.findall(css)
+    return "".join(imports) + _IMPORTS.sub("", css)
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+class Stylesheet(NamedTuple):
+    name: str
+    css: str
+    digest: str
+
+    @property
+    def filename(self) -> str:
+        return f"{self.name}.{self.digest}.css"
+
+class StyleBundle(NamedTuple):
+    name: str
+    sheets: Tuple[Stylesheet, ...]
+    css: str
+    digest: str
+    source_bytes: int
+
+class StyleRegistry:
+    """
+    Minified stylesheets and bundles, rebuilt only when a source file changes
+
+    Args:
+        styles_dir: Directory holding <sheet>.css sources
+        bundles: Bundle name -> sheet names in cascade order
+    """
+
+    def __init__(self, styles_dir: str = STYLES_DIR, bundles: Dict[str, Tuple[str, ...]] = None):
+        self.styles_dir = styles_dir
+        self.bundles = dict(bundles or STYLE_BUNDLES)
+        self._sheets: Dict[str, tuple] = {}
+        self._built: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, sheet: str) -> str:
+        return os.path.join(self.styles_dir, f"{sheet}.css")
+
+    def _signature(self, sheets: Tuple[str, ...]) -> tuple:
+        return tuple(os.stat(self._path(sheet)).st_mtime_ns for sheet in sheets)
+
+    def sheet(self, name: str) -> Stylesheet:
+        mtime = os.stat(self._path(name)).st_mtime_ns
+        cached = self._sheets.get(name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with open(self._path(name), encoding="utf-8") as f:
+            source = f.read()
+        css = minify_css(source)
+        sheet = Stylesheet(name, css, _digest(css))
+        with self._lock:
+            self._sheets[name] = (mtime, sheet, len(source.encode("utf-8")))
+        return sheet
+
+    def bundle(self, name: str) -> StyleBundle:
+        """Sheets of bundle `name` concatenated in order; KeyError for unknown bundles"""
+        sheet_names = self.bundles[name]
+        signature = self._signature(sheet_names)
+        cached = self._built.get(name)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        sheets = tuple(self.sheet(sheet) for sheet in sheet_names)
+        css = hoist_imports("".join(sheet.css for sheet in sheets))
+        source_bytes = sum(self._sheets[sheet][2] for sheet in sheet_names)
+        bundle = StyleBundle(name, sheets, css, _digest(css), source_bytes)
+        with self._lock:
+            self._built[name] = (signature, bundle)
+        return bundle
+
+    def write_static(self, out_dir: str = STATIC_DIR) -> Dict[str, str]:
+        """Write every sheet as <sheet>.<hash>.css; returns sheet name -> file path"""
+        os.makedirs(out_dir, exist_ok=True)
+        written = {}
+        for name in sorted({sheet for sheets in self.bundles.values() for sheet in sheets}):
+            sheet = self.sheet(name)
+            path = os.path.join(out_dir, sheet.filename)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(sheet.css)
+            written[name] = path
+        return written
+
+_registry: Optional[StyleRegistry] = None
+_registry_lock = threading.Lock()
+
+def get_style_registry() -> StyleRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = StyleRegistry()
+    return _registry
+
+def _static_delivery(bundle: StyleBundle) -> bool:
+    if os.getenv("STYLE_DELIVERY", "inline") != "static":
+        return False
+    if not st.get_option("server.enableStaticServing"):
+        return False
+    return all(os.path.exists(os.path.join(STATIC_DIR, sheet.filename)) for sheet in bundle.sheets)
+
+def style_html(name: str) -> str:
+    """Markup for bundle `name`: one <style> tag, or <link> tags to the hashed static sheets"""
+    bundle = get_style_registry().bundle(name)
+    if _static_delivery(bundle):
+        return "".join(f'<link rel="stylesheet" href="{STATIC_URL}/{sheet.filename}">' for sheet in bundle.sheets)
+    return f'<style data-bundle="{bundle.name}.{bundle.digest}">{bundle.css}</style>'
+
+def render_styles(name: str):
+    """Inject the stylesheet bundle for a page"""
+    st.markdown(style_html(name), unsafe_allow_html=True)
+
+class FragmentCache:
+    """
+    Thread-safe LRU of rendered HTML keyed by builder, arguments and catalog version
+
+    Args:
+        max_entries: Entries kept before the least recently used one is evicted
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_FRAGMENTS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, object]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, builder: Callable, *args, cache_key: Optional[Hashable] = None):
+        key = (builder.__module__, builder.__qualname__,
+               cache_key if cache_key is not None else args, catalog_version())
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = builder(*args)
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+_fragments: Optional[FragmentCache] = None
+_fragments_lock = threading.Lock()
+
+def get_fragment_cache() -> FragmentCache:
+    """Process-wide fragment cache (FRAGMENT_CACHE_SIZE overrides the entry limit)"""
+    global _fragments
+    if _fragments is None:
+        with _fragments_lock:
+            if _fragments is None:
+                _fragments = FragmentCache(int(os.getenv("FRAGMENT_CACHE_SIZE", DEFAULT_MAX_FRAGMENTS)))
+    return _fragments
+
+def cached_fragment(builder: Callable, *args, cache_key: Optional[Hashable] = None):
+    """
+    builder(*args), built once per arguments and catalog version
+
+    Args:
+        builder: Function returning HTML (a string or a tuple of strings)
+        cache_key: Hashable stand-in for the arguments when they are not hashable
+    """
+    return get_fragment_cache().get(builder, *args, cache_key=cache_key)
+
+def main():
+    parser = argparse.ArgumentParser(description="Write minified, hashed stylesheets for static serving")
+    parser.add_argument("--out", default=STATIC_DIR, help="Output directory (default static/css)")
+    args = parser.parse_args()
+
+    registry = get_style_registry()
+    for name, path in registry.write_static(args.out).items():
+        print(f"{name:<12} {os.path.getsize(path):>7} bytes  {os.path.relpath(path, BASE_DIR)}")
+    for name in registry.bundles:
+        bundle = registry.bundle(name)
+        print(f"bundle {name:<12} {bundle.source_bytes:>7} -> {len(bundle.css.encode('utf-8')):>7} bytes")
+
+# Export functions
+__all__ = [
+    'StyleRegistry',
+    'StyleBundle',
+    'Stylesheet',
+    'FragmentCache',
+    'minify_css',
+    'style_html',
+    'render_styles',
+    'cached_fragment',
+    'get_fragment_cache',
+    'get_style_registry',
+    'STYLE_BUNDLES'
+]
+
+if __name__ == "__main__":
+    main()
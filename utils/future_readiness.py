@@ -3,53 +3,54 @@
 import math
 from typing import List, Dict, Tuple
 from datetime import datetime
+import numpy as np
+from scipy import sparse
+
+from utils.catalog import current_snapshot, get_section, register_index
+
+SKILL_CATEGORIES = ['core_skills', 'tools', 'soft_skills', 'certifications']
+
+# Share of each category in the overall readiness score
+CATEGORY_WEIGHTS = {
+    'core_skills': 0.4,
+    'tools': 0.25,
+    'soft_skills': 0.15,
+    'certifications': 0.2
+}
+
+DIFFICULTY_MULTIPLIERS = {
+    "Easy": 1.0,
+    "Medium": 1.2,
+    "Hard": 1.5,
+    "Very Hard": 2.0
+}
+
+URGENCY_FACTORS = {
+    "No Rush": 0.8,
+    "6-12 months": 1.0,
+    "3-6 months": 1.2,
+    "ASAP": 1.5
+}
+
+URGENCY_TIMELINE_ADJUSTMENTS = {
+    "ASAP": 0.7,
+    "3-6 months": 0.8,
+    "6-12 months": 1.0,
+    "No Rush": 1.3
+}
+
+ROLE_KEYWORDS = {
+    "Artificial Intelligence": ["data", "analyst", "research", "scientist", "engineer"],
+    "Blockchain": ["developer", "fintech", "crypto", "finance"],
+    "Cybersecurity": ["security", "it", "network", "systems"],
+    "Renewable Energy": ["energy", "engineer", "sustainability", "environmental"],
+    "Biotechnology": ["lab", "research", "biology", "medical", "pharma"],
+    "Space Exploration": ["engineer", "aerospace", "physics", "research"]
+}
 
 def get_enhanced_skill_weights():
     """Enhanced skill weights with more comprehensive mapping"""
-    return {
-        "Artificial Intelligence": {
-            "core_skills": ["python", "machine learning", "statistics", "data science", "deep learning"],
-            "tools": ["tensorflow", "pytorch", "scikit-learn", "jupyter", "pandas"],
-            "soft_skills": ["problem solving", "critical thinking", "research", "communication"],
-            "certifications": ["google ai", "aws ml", "tensorflow developer"],
-            "weight_multipliers": {"core_skills": 1.0, "tools": 0.8, "soft_skills": 0.6, "certifications": 0.9}
-        },
-        "Blockchain": {
-            "core_skills": ["solidity", "smart contracts", "cryptography", "web3", "defi"],
-            "tools": ["remix", "hardhat", "metamask", "web3.js", "truffle"],
-            "soft_skills": ["security mindset", "attention to detail", "innovation", "risk assessment"],
-            "certifications": ["certified bitcoin professional", "ethereum developer"],
-            "weight_multipliers": {"core_skills": 1.0, "tools": 0.8, "soft_skills": 0.5, "certifications": 1.0}
-        },
-        "Renewable Energy": {
-            "core_skills": ["solar", "sustainability", "electrical engineering", "grid systems"],
-            "tools": ["autocad", "matlab", "pvsyst", "homer"],
-            "soft_skills": ["environmental awareness", "project management", "communication"],
-            "certifications": ["nabcep", "leed", "pmp"],
-            "weight_multipliers": {"core_skills": 1.0, "tools": 0.7, "soft_skills": 0.6, "certifications": 0.8}
-        },
-        "Biotechnology": {
-            "core_skills": ["bioinformatics", "genetics", "molecular biology", "lab skills"],
-            "tools": ["r", "python", "blast", "clustal", "laboratory equipment"],
-            "soft_skills": ["attention to detail", "analytical thinking", "research", "ethics"],
-            "certifications": ["clinical research", "biotech certifications"],
-            "weight_multipliers": {"core_skills": 1.0, "tools": 0.8, "soft_skills": 0.6, "certifications": 0.7}
-        },
-        "Space Exploration": {
-            "core_skills": ["physics", "aerospace engineering", "navigation", "satellite systems"],
-            "tools": ["matlab", "labview", "stk", "ansys"],
-            "soft_skills": ["precision", "problem solving", "teamwork", "stress management"],
-            "certifications": ["faa", "nasa certifications", "aerospace engineering"],
-            "weight_multipliers": {"core_skills": 1.0, "tools": 0.8, "soft_skills": 0.6, "certifications": 0.9}
-        },
-        "Cybersecurity": {
-            "core_skills": ["network security", "penetration testing", "incident response", "risk assessment"],
-            "tools": ["wireshark", "metasploit", "nmap", "burp suite", "siem"],
-            "soft_skills": ["ethical mindset", "attention to detail", "communication", "continuous learning"],
-            "certifications": ["cissp", "ceh", "security+", "oscp"],
-            "weight_multipliers": {"core_skills": 1.0, "tools": 0.8, "soft_skills": 0.6, "certifications": 1.0}
-        }
-    }
+    return get_section("skill_weights")
 
 def calculate_skill_category_score(user_skills: List[str], required_skills: List[str], weight: float = 1.0) -> Tuple[float, List[str], List[str]]:
     """Calculate score for a specific skill category"""
@@ -66,47 +67,36 @@ def calculate_skill_category_score(user_skills: List[str], required_skills: List
             matched_skills.append(req_skill)
     
     # Partial matches (for compound skills)
+    matched_lower = {m.lower() for m in matched_skills}
     partial_matches = []
     for user_skill in user_skills_normalized:
+        if user_skill in matched_lower:
+            continue
         for req_skill in required_skills_normalized:
-            if (user_skill not in [m.lower() for m in matched_skills] and 
-                req_skill not in [m.lower() for m in matched_skills] and
+            if (req_skill not in matched_lower and
                 (user_skill in req_skill or req_skill in user_skill)):
                 partial_matches.append(req_skill)
     
     total_matched = len(matched_skills) + (len(partial_matches) * 0.5)
     category_score = (total_matched / len(required_skills)) * 100 * weight
     
+    covered_lower = matched_lower | {p.lower() for p in partial_matches}
     missing_skills = [skill for skill in required_skills 
-                     if skill.lower() not in [m.lower() for m in matched_skills + partial_matches]]
+                     if skill.lower() not in covered_lower]
     
     return min(category_score, 100), matched_skills + partial_matches, missing_skills
 
 def calculate_experience_bonus(years_experience: int, field_difficulty: str) -> float:
     """Calculate experience bonus based on years and field difficulty"""
-    difficulty_multipliers = {
-        "Easy": 1.0,
-        "Medium": 1.2,
-        "Hard": 1.5,
-        "Very Hard": 2.0
-    }
-    
     base_bonus = min(years_experience * 3, 20)  # Max 20 points from experience
-    multiplier = difficulty_multipliers.get(field_difficulty, 1.0)
+    multiplier = DIFFICULTY_MULTIPLIERS.get(field_difficulty, 1.0)
     
     return base_bonus / multiplier
 
 def calculate_learning_commitment_factor(weekly_hours: int, urgency: str) -> float:
     """Calculate learning commitment impact on readiness"""
-    urgency_factors = {
-        "No Rush": 0.8,
-        "6-12 months": 1.0,
-        "3-6 months": 1.2,
-        "ASAP": 1.5
-    }
-    
     hours_factor = min(weekly_hours / 20, 1.5)  # 20 hours/week baseline, max 1.5x
-    urgency_factor = urgency_factors.get(urgency, 1.0)
+    urgency_factor = URGENCY_FACTORS.get(urgency, 1.0)
     
     return hours_factor * urgency_factor
 
@@ -157,7 +147,7 @@ def calculate_advanced_readiness_score(
         matched_skills = {}
         missing_skills = {}
         
-        for category in ['core_skills', 'tools', 'soft_skills', 'certifications']:
+        for category in SKILL_CATEGORIES:
             if category in user_skills_by_category and category in field_data:
                 user_cat_skills = user_skills_by_category[category]
                 required_cat_skills = field_data[category]
@@ -173,17 +163,10 @@ def calculate_advanced_readiness_score(
             else:
                 category_scores[category] = 0
                 matched_skills[category] = []
-                missing_skills[category] = field_data.get(category, [])
+                missing_skills[category] = list(field_data.get(category, []))
         
         # Calculate weighted overall score
-        weights = {
-            'core_skills': 0.4,
-            'tools': 0.25, 
-            'soft_skills': 0.15,
-            'certifications': 0.2
-        }
-        
-        base_score = sum(category_scores[cat] * weights[cat] for cat in weights.keys())
+        base_score = sum(category_scores[cat] * CATEGORY_WEIGHTS[cat] for cat in CATEGORY_WEIGHTS)
         
         # Apply bonuses and penalties
         experience_bonus = calculate_experience_bonus(years_experience, field_difficulty)
@@ -192,16 +175,7 @@ def calculate_advanced_readiness_score(
         # Role relevance bonus
         role_bonus = 0
         if current_role:
-            role_keywords = {
-                "Artificial Intelligence": ["data", "analyst", "research", "scientist", "engineer"],
-                "Blockchain": ["developer", "fintech", "crypto", "finance"],
-                "Cybersecurity": ["security", "it", "network", "systems"],
-                "Renewable Energy": ["energy", "engineer", "sustainability", "environmental"],
-                "Biotechnology": ["lab", "research", "biology", "medical", "pharma"],
-                "Space Exploration": ["engineer", "aerospace", "physics", "research"]
-            }
-            
-            field_keywords = role_keywords.get(field, [])
+            field_keywords = ROLE_KEYWORDS.get(field, [])
             current_role_lower = current_role.lower()
             
             if any(keyword in current_role_lower for keyword in field_keywords):
@@ -230,14 +204,7 @@ def calculate_advanced_readiness_score(
         base_months = max(3, skill_gap / 15)  # 15 points per month baseline
         timeline_months = base_months / learning_factor
         
-        urgency_adjustments = {
-            "ASAP": 0.7,
-            "3-6 months": 0.8,
-            "6-12 months": 1.0,
-            "No Rush": 1.3
-        }
-        
-        final_timeline = timeline_months * urgency_adjustments.get(career_urgency, 1.0)
+        final_timeline = timeline_months * URGENCY_TIMELINE_ADJUSTMENTS.get(career_urgency, 1.0)
         
         results[field] = {
             "overall_score": round(final_score, 1),
@@ -260,6 +227,231 @@ def calculate_advanced_readiness_score(
     
     return results
 
+class ReadinessEngine:
+    """
+    NumPy-backed version of calculate_advanced_readiness_score for many profiles
+    
+    Every field's required skills are encoded once as per-category "slots"
+    (one slot per required skill, tagged with its field). A batch of profiles is
+    then scored with sparse profile x skill matrices: equality and substring
+    relations between user skills and slots give direct and partial hits, which
+    are summed per field and run through the same bonus, level and timeline
+    rules as the scalar function. Numeric outputs are left unrounded.
+    """
+
+    READINESS_LEVELS = ["Ready", "Almost Ready", "Developing", "Beginner"]
+
+    def __init__(self, skill_weights: Dict = None):
+        skill_weights = skill_weights or get_enhanced_skill_weights()
+        self.fields = list(skill_weights.keys())
+        n_fields = len(self.fields)
+
+        self.difficulties = [get_field_difficulty_rating(field) for field in self.fields]
+        difficulty_multiplier = np.array(
+            [DIFFICULTY_MULTIPLIERS.get(d, 1.0) for d in self.difficulties]
+        )
+        self._difficulty_multiplier = difficulty_multiplier
+        self.total_skills_needed = np.array([
+            sum(len(skill_weights[field][cat]) for cat in SKILL_CATEGORIES) for field in self.fields
+        ])
+
+        self._categories = {}
+        for category in SKILL_CATEGORIES:
+            slot_tokens, slot_fields = [], []
+            sizes = np.zeros(n_fields)
+            weights = np.zeros(n_fields)
+            required_sets = []
+            for f, field in enumerate(self.fields):
+                required = skill_weights[field].get(category, [])
+                slot_tokens.extend(skill.lower().strip() for skill in required)
+                slot_fields.extend([f] * len(required))
+                sizes[f] = len(required)
+                weights[f] = skill_weights[field]['weight_multipliers'].get(category, 0.0) if required else 0.0
+                required_sets.append({skill.lower().strip() for skill in required})
+
+            slot_fields = np.array(slot_fields, dtype=np.int64)
+            # Slot -> field one-hot, used to sum slot hits per field
+            slot_to_field = np.zeros((len(slot_tokens), n_fields))
+            slot_to_field[np.arange(len(slot_tokens)), slot_fields] = 1.0
+
+            fragments: Dict[str, List[int]] = {}
+            exact: Dict[str, List[int]] = {}
+            for slot, token in enumerate(slot_tokens):
+                exact.setdefault(token, []).append(slot)
+                for fragment in {token[i:j] for i in range(len(token) + 1) for j in range(i, len(token) + 1)}:
+                    fragments.setdefault(fragment, []).append(slot)
+
+            self._categories[category] = {
+                "slot_tokens": slot_tokens,
+                "slot_fields": slot_fields,
+                "slot_to_field": slot_to_field,
+                "sizes": sizes,
+                "weights": weights,
+                "required_sets": required_sets,
+                "exact": exact,
+                "fragments": fragments,
+                "relations": {},
+            }
+
+    def _relations(self, category: str, token: str) -> Tuple[List[int], List[int]]:
+        """Slots equal to a user skill, and slots it partially matches"""
+        encoded = self._categories[category]
+        cached = encoded["relations"].get(token)
+        if cached is not None:
+            return cached
+
+        equal = encoded["exact"].get(token, [])
+        related = set(encoded["fragments"].get(token, []))
+        for i in range(len(token) + 1):
+            for j in range(i, len(token) + 1):
+                related.update(encoded["exact"].get(token[i:j], []))
+        partial = [
+            slot for slot in related
+            if encoded["slot_tokens"][slot] != token
+            and token not in encoded["required_sets"][encoded["slot_fields"][slot]]
+        ]
+        encoded["relations"][token] = (equal, partial)
+        return equal, partial
+
+    def _category_hits(self, category: str, skill_lists: List) -> Tuple[np.ndarray, np.ndarray]:
+        """Direct and partial hit counts per (profile, field) for one category"""
+        encoded = self._categories[category]
+        n_slots = len(encoded["slot_tokens"])
+        vocabulary: Dict[str, int] = {}
+        rows, cols = [], []
+        for row, skills in enumerate(skill_lists):
+            for skill in skills or []:
+                if not skill:
+                    continue
+                token = skill.lower().strip()
+                rows.append(row)
+                cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(skill_lists), len(vocabulary))
+        )
+        presence = counts.copy()
+        presence.data[:] = 1.0
+
+        eq_rows, eq_cols, sub_rows, sub_cols = [], [], [], []
+        for token, column in vocabulary.items():
+            equal, partial = self._relations(category, token)
+            eq_rows.extend([column] * len(equal))
+            eq_cols.extend(equal)
+            sub_rows.extend([column] * len(partial))
+            sub_cols.extend(partial)
+        shape = (len(vocabulary), n_slots)
+        equality = sparse.csr_matrix((np.ones(len(eq_rows)), (eq_rows, eq_cols)), shape=shape)
+        substring = sparse.csr_matrix((np.ones(len(sub_rows)), (sub_rows, sub_cols)), shape=shape)
+
+        direct_slots = np.asarray((presence @ equality).todense()) > 0
+        partial_slots = np.asarray((counts @ substring).todense()) * ~direct_slots
+
+        slot_to_field = encoded["slot_to_field"]
+        return direct_slots @ slot_to_field, partial_slots @ slot_to_field
+
+    def score_profiles(self, profiles: List[Dict], target_fields: List[str] = None) -> Dict[str, np.ndarray]:
+        """
+        Score profiles against target fields in one pass
+        
+        Args:
+            profiles: Dicts with optional category keys ('core_skills', 'tools',
+                'soft_skills', 'certifications') plus 'years_experience',
+                'weekly_learning_hours', 'career_urgency' and 'current_role',
+                mirroring the arguments of calculate_advanced_readiness_score
+            target_fields: Fields to score; defaults to every known field
+        
+        Returns:
+            Long-format columns (one entry per profile x field): 'profile' index,
+            'field', 'overall_score', 'base_score', one '<category>_score' column
+            per category, bonuses, 'learning_factor', 'readiness_level',
+            'estimated_timeline_months', 'skills_acquired' and
+            'completion_percentage'
+        """
+        field_ids = [self.fields.index(f) for f in (target_fields or self.fields) if f in self.fields]
+        n_profiles, n_fields = len(profiles), len(field_ids)
+
+        years = np.array([p.get('years_experience', 0) or 0 for p in profiles], dtype=float)
+        hours = np.array([p.get('weekly_learning_hours', 10) for p in profiles], dtype=float)
+        urgencies = [p.get('career_urgency', "6-12 months") for p in profiles]
+        urgency_factor = np.array([URGENCY_FACTORS.get(u, 1.0) for u in urgencies])
+        timeline_adjustment = np.array([URGENCY_TIMELINE_ADJUSTMENTS.get(u, 1.0) for u in urgencies])
+
+        base_score = np.zeros((n_profiles, n_fields))
+        skills_acquired = np.zeros((n_profiles, n_fields))
+        category_scores = {}
+        for category in SKILL_CATEGORIES:
+            encoded = self._categories[category]
+            provided = np.array([category in p for p in profiles])
+            direct, partial = self._category_hits(category, [p.get(category) for p in profiles])
+            direct, partial = direct[:, field_ids], partial[:, field_ids]
+
+            sizes = encoded["sizes"][field_ids]
+            weights = encoded["weights"][field_ids]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                score = np.where(sizes > 0, (direct + 0.5 * partial) / sizes * 100 * weights, 0.0)
+            score = np.minimum(score, 100) * provided[:, None]
+
+            category_scores[category] = score
+            base_score += score * CATEGORY_WEIGHTS[category]
+            skills_acquired += (direct + partial) * provided[:, None]
+
+        experience_bonus = np.minimum(years * 3, 20)[:, None] / self._difficulty_multiplier[field_ids]
+        learning_factor = np.minimum(hours / 20, 1.5) * urgency_factor
+
+        role_bonus = np.zeros((n_profiles, n_fields))
+        role_cache: Dict[str, np.ndarray] = {}
+        for row, profile in enumerate(profiles):
+            role = profile.get('current_role') or ""
+            if not role:
+                continue
+            if role not in role_cache:
+                role_lower = role.lower()
+                role_cache[role] = np.array([
+                    10.0 if any(k in role_lower for k in ROLE_KEYWORDS.get(self.fields[f], [])) else 0.0
+                    for f in field_ids
+                ])
+            role_bonus[row] = role_cache[role]
+
+        adjusted = base_score + experience_bonus + role_bonus
+        overall = np.minimum(adjusted * learning_factor[:, None], 100)
+        levels = np.select(
+            [overall >= 80, overall >= 60, overall >= 40], self.READINESS_LEVELS[:3],
+            default=self.READINESS_LEVELS[3]
+        )
+
+        base_months = np.maximum(3, (100 - base_score) / 15)
+        with np.errstate(divide="ignore"):
+            timeline = base_months / learning_factor[:, None] * timeline_adjustment[:, None]
+
+        total_needed = self.total_skills_needed[field_ids]
+        columns = {
+            "profile": np.repeat(np.arange(n_profiles), n_fields),
+            "field": np.tile(np.array([self.fields[f] for f in field_ids], dtype=object), n_profiles),
+            "overall_score": overall.ravel(),
+            "base_score": base_score.ravel(),
+        }
+        for category in SKILL_CATEGORIES:
+            columns[f"{category}_score"] = category_scores[category].ravel()
+        columns.update({
+            "experience_bonus": np.broadcast_to(experience_bonus, (n_profiles, n_fields)).ravel(),
+            "role_relevance_bonus": role_bonus.ravel(),
+            "learning_factor": np.repeat(learning_factor, n_fields),
+            "readiness_level": levels.ravel(),
+            "estimated_timeline_months": timeline.ravel(),
+            "field_difficulty": np.tile(np.array([self.difficulties[f] for f in field_ids], dtype=object), n_profiles),
+            "total_skills_needed": np.tile(total_needed, n_profiles),
+            "skills_acquired": skills_acquired.ravel(),
+            "completion_percentage": (skills_acquired / total_needed * 100).ravel(),
+        })
+        return columns
+
+register_index("readiness_engine", lambda catalog: ReadinessEngine(catalog["skill_weights"]))
+
+def get_readiness_engine() -> ReadinessEngine:
+    """ReadinessEngine for the live catalog snapshot, rebuilt on catalog reloads"""
+    return current_snapshot().index("readiness_engine")
+
 def calculate_readiness_score(user_skills: List[str], interest_fields: List[str], waktu_belajar: int = 10) -> int:
     """
     Simplified version for backward compatibility
@@ -321,33 +513,24 @@ def get_learning_resources(skill: str, field: str) -> List[str]:
     """Get learning resources for specific skills"""
     skill_lower = skill.lower()
     
-    resource_map = {
-        "python": ["Python.org Tutorial", "Codecademy Python", "automate the Boring Stuff"],
-        "machine learning": ["Coursera ML Course", "Kaggle Learn", "scikit-learn docs"],
-        "solidity": ["Solidity Documentation", "CryptoZombies", "Hardhat Tutorial"],
-        "network security": ["Cisco Networking Academy", "CompTIA Security+", "Cybrary"],
-        "bioinformatics": ["Rosalind Problems", "Coursera Bioinformatics", "NCBI Tutorials"]
-    }
+    resource_map = get_section("learning_resources")
     
-    return resource_map.get(skill_lower, ["General online courses", "YouTube tutorials", "Official documentation"])
+    return list(resource_map.get(skill_lower, ["General online courses", "YouTube tutorials", "Official documentation"]))
 
 def get_practice_projects(skill: str, field: str) -> List[str]:
     """Get practice project ideas for skills"""
     skill_lower = skill.lower()
     
-    project_map = {
-        "python": ["Build a calculator", "Web scraper project", "Data analysis with pandas"],
-        "machine learning": ["Iris classification", "House price prediction", "Customer segmentation"],
-        "solidity": ["Simple token contract", "Voting system", "NFT marketplace"],
-        "network security": ["Home network audit", "Vulnerability assessment", "Security monitoring setup"]
-    }
+    project_map = get_section("practice_projects")
     
-    return project_map.get(skill_lower, ["Research project", "Tutorial follow-along", "Basic implementation"])
+    return list(project_map.get(skill_lower, ["Research project", "Tutorial follow-along", "Basic implementation"]))
 
 # Export functions
 __all__ = [
     'calculate_readiness_score',
     'calculate_advanced_readiness_score',
     'get_skill_recommendations',
-    'calculate_skill_category_score'
+    'calculate_skill_category_score',
+    'ReadinessEngine',
+    'get_readiness_engine'
 ]
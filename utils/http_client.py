@@ -0,0 +1,140 @@
+# utils/http_client.py - Retry backoff, circuit breaker and latency tracking for outbound LLM calls
+"""
+Resilience helpers used by the chat gateway (utils/chat_gateway.py).
+
+Retryable responses (429/5xx) and connection errors are retried with jittered
+exponential backoff. A circuit breaker fails fast while the upstream service
+is down. Latency is recorded per request so p50/p95 can be reported.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+def backoff_delay(attempt: int, base: float, maximum: float, retry_after: str = None) -> float:
+    """Full-jitter exponential delay for `attempt` (0-based), or Retry-After capped at `maximum`"""
+    if retry_after:
+        try:
+            return min(float(retry_after), maximum)
+        except ValueError:
+            pass
+    return random.uniform(0, min(maximum, base * 2 ** attempt))
+
+class HTTPClientError(Exception):
+    """Base class for errors raised by the client itself"""
+
+class CircuitOpenError(HTTPClientError):
+    """Raised without calling upstream while the circuit breaker is open"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"Upstream marked unavailable; retry in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+class CircuitBreaker:
+    """
+    Classic closed -> open -> half-open breaker
+
+    Opens after `failure_threshold` consecutive failures; after `reset_timeout`
+    seconds a single trial request is let through and its outcome closes or
+    re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def before_request(self):
+        """Raise CircuitOpenError unless a request may be sent now"""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return
+            if state == "half-open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return
+            retry_in = max(self.reset_timeout - (self.clock() - self.opened_at), 0.0)
+        raise CircuitOpenError(retry_in)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = self.clock()
+            self.trial_in_flight = False
+
+class LatencyTracker:
+    """Rolling latency samples per series with percentile summaries"""
+
+    def __init__(self, window: int = 500):
+        self.window = window
+        self.samples: Dict[str, deque] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, series: str, seconds: float):
+        with self._lock:
+            self.samples.setdefault(series, deque(maxlen=self.window)).append(seconds)
+
+    def increment(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @staticmethod
+    def _percentile(ordered: list, pct: float) -> float:
+        index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+        return ordered[index]
+
+    def summary(self) -> Dict:
+        """{series: {count, p50, p95, max}} plus the counters"""
+        with self._lock:
+            series = {name: sorted(values) for name, values in self.samples.items()}
+            counters = dict(self.counters)
+        summary = {
+            name: {
+                "count": len(values),
+                "p50": self._percentile(values, 50),
+                "p95": self._percentile(values, 95),
+                "max": values[-1]
+            }
+            for name, values in series.items() if values
+        }
+        summary["counters"] = counters
+        return summary
+
+# Export functions
+__all__ = [
+    'CircuitBreaker',
+    'LatencyTracker',
+    'HTTPClientError',
+    'CircuitOpenError',
+    'backoff_delay',
+    'RETRY_STATUSES'
+]
@@ -0,0 +1,267 @@
+# utils/landing_charts.py - Landing page charts and their pre-rendered snapshots
+"""
+The bubble, radar and salary comparison charts on the landing page depend
+only on the catalog, so they are the same for every visitor.
+
+Build step (run after deploying or editing data/catalog.json):
+
+    python -m utils.landing_charts
+
+This writes data/snapshots/<catalog version>/<chart>.json as compact Plotly
+JSON, plus <chart>.svg when kaleido is installed, and a manifest.json. At
+runtime landing_figure(name) serves the snapshot for the live catalog version
+without assembling the figure. When no snapshot matches (or
+LANDING_SNAPSHOTS=off), it builds the chart once per process through the
+figure cache.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+from typing import Callable, Dict, Mapping, Optional, Tuple
+
+from utils.catalog import catalog_version, get_section
+from utils.figure_cache import FigureEntry, cached_figure, figure_json
+from utils.lazy_imports import lazy_import
+
+pd = lazy_import("pandas")
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+pio = lazy_import("plotly.io")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_DIR = os.path.join(ROOT, "data", "snapshots")
+
+def trend_frame(industries: Mapping) -> pd.DataFrame:
+    """One row per industry with the columns the landing page charts and stats use"""
+    df_data = []
+    for industry, metrics in industries.items():
+        df_data.append({
+            'Industry': industry,
+            'Job Growth (%)': metrics['growth'],
+            'Avg Salary (K)': (metrics['min_salary'] + metrics['max_salary']) / 2,
+            'Market Size (B)': metrics['market_size'],
+            'Difficulty': metrics['difficulty'],
+            'Remote Friendly (%)': metrics['remote_friendly'],
+            'Job Security': metrics['job_security'],
+            'Min Salary': metrics['min_salary'],
+            'Max Salary': metrics['max_salary']
+        })
+    
+    return pd.DataFrame(df_data)
+
+def create_advanced_bubble_chart(df: pd.DataFrame) -> go.Figure:
+    """Create an advanced interactive bubble chart with dark theme"""
+    fig = px.scatter(
+        df, 
+        x='Job Growth (%)', 
+        y='Avg Salary (K)', 
+        size='Market Size (B)', 
+        hover_name='Industry',
+        title='🎯 Industry Growth vs Salary vs Market Size Analysis',
+        color='Remote Friendly (%)',
+        color_continuous_scale='Viridis',
+        size_max=80
+    )
+    
+    fig.update_layout(
+        height=600,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0ff', family="Exo 2"),
+        title_font=dict(size=18, color='#00f0ff', family="Orbitron"),
+        xaxis=dict(gridcolor='rgba(0, 240, 255, 0.2)'),
+        yaxis=dict(gridcolor='rgba(0, 240, 255, 0.2)')
+    )
+    
+    return fig
+
+def create_salary_comparison_chart(df: pd.DataFrame) -> go.Figure:
+    """Create enhanced salary comparison chart with dark theme"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Bar(
+        name='Min Salary',
+        x=df['Industry'],
+        y=df['Min Salary'],
+        marker_color='rgba(0, 240, 255, 0.7)',
+        text=df['Min Salary'],
+        textposition='auto'
+    ))
+    
+    fig.add_trace(go.Bar(
+        name='Max Salary',
+        x=df['Industry'],
+        y=df['Max Salary'],
+        marker_color='rgba(179, 71, 217, 0.7)',
+        text=df['Max Salary'],
+        textposition='auto'
+    ))
+    
+    fig.update_layout(
+        title='💰 Salary Ranges by Industry (2024)',
+        xaxis_title='Industry',
+        yaxis_title='Salary ($K)',
+        barmode='group',
+        height=500,
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0ff', family="Exo 2"),
+        title_font=dict(color='#00f0ff', family="Orbitron"),
+        xaxis=dict(tickangle=45, gridcolor='rgba(0, 240, 255, 0.2)'),
+        yaxis=dict(gridcolor='rgba(0, 240, 255, 0.2)')
+    )
+    
+    return fig
+
+def create_skill_radar_chart() -> go.Figure:
+    """Create enhanced skill requirements radar chart with dark theme"""
+    categories = [
+        'Technical Skills', 'Soft Skills', 'Experience Required', 
+        'Learning Curve', 'Market Demand', 'Salary Potential',
+        'Remote Opportunities', 'Job Security'
+    ]
+    
+    ai_scores = [9, 7, 8, 8, 10, 9, 9, 9]
+    blockchain_scores = [10, 6, 7, 9, 8, 10, 9, 7]
+    cybersec_scores = [8, 8, 7, 7, 9, 8, 8, 9]
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatterpolar(
+        r=ai_scores, theta=categories, fill='toself', name='AI/ML',
+        line_color='rgb(0, 240, 255)', fillcolor='rgba(0, 240, 255, 0.3)'
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=blockchain_scores, theta=categories, fill='toself', name='Blockchain',
+        line_color='rgb(179, 71, 217)', fillcolor='rgba(179, 71, 217, 0.3)'
+    ))
+    
+    fig.add_trace(go.Scatterpolar(
+        r=cybersec_scores, theta=categories, fill='toself', name='Cybersecurity',
+        line_color='rgb(0, 255, 136)', fillcolor='rgba(0, 255, 136, 0.3)'
+    ))
+    
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, 10], gridcolor='rgba(0, 240, 255, 0.2)')),
+        showlegend=True, title="🎯 Industry Skill Requirements Comparison", height=500,
+        plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e0ff', family="Exo 2"),
+        title_font=dict(color='#00f0ff', family="Orbitron")
+    )
+    
+    return fig
+
+# name -> (builder, needs the industry DataFrame)
+LANDING_CHARTS: Dict[str, Tuple[Callable, bool]] = {
+    "bubble": (create_advanced_bubble_chart, True),
+    "radar": (create_skill_radar_chart, False),
+    "salary": (create_salary_comparison_chart, True),
+}
+
+def _chart_call(name: str) -> Tuple[Callable, tuple]:
+    builder, uses_frame = LANDING_CHARTS[name]
+    args = (trend_frame(get_section("industry_data")["industries"]),) if uses_frame else ()
+    return builder, args
+
+def snapshot_path(name: str, version: str = None, extension: str = "json") -> str:
+    return os.path.join(SNAPSHOT_DIR, version or catalog_version(), f"{name}.{extension}")
+
+_snapshots: Dict[Tuple[str, str], FigureEntry] = {}
+_snapshots_lock = threading.Lock()
+
+def load_snapshot(name: str, version: str = None) -> Optional[FigureEntry]:
+    """Pre-rendered chart for `version` (default: live catalog), read from disk once per process"""
+    key = (version or catalog_version(), name)
+    entry = _snapshots.get(key)
+    if entry is None:
+        path = snapshot_path(name, key[0])
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            entry = FigureEntry(json.load(f))
+        with _snapshots_lock:
+            entry = _snapshots.setdefault(key, entry)
+    return entry
+
+def landing_figure(name: str):
+    """
+    Figure for a landing page chart
+
+    Serves the snapshot for the live catalog version when one exists. Otherwise
+    builds the chart once per process and catalog version through the figure
+    cache. Set LANDING_SNAPSHOTS=off to always use the builders.
+    """
+    if os.getenv("LANDING_SNAPSHOTS", "auto") != "off":
+        entry = load_snapshot(name)
+        if entry is not None:
+            return entry.figure
+    builder, args = _chart_call(name)
+    return cached_figure(builder, *args, cache_key=f"landing:{name}")
+
+def build_snapshots(out_dir: str = SNAPSHOT_DIR, images: bool = True) -> Dict:
+    """
+    Render every landing chart for the live catalog version
+
+    Returns the manifest that is also written to <out_dir>/<version>/manifest.json.
+    """
+    # Importing Streamlit selects its "streamlit" Plotly template, as it does in the app;
+    # without it the snapshots would carry Plotly's default template instead
+    import streamlit  # noqa: F401
+
+    version = catalog_version()
+    target = os.path.join(out_dir, version)
+    os.makedirs(target, exist_ok=True)
+    images = images and importlib.util.find_spec("kaleido") is not None
+
+    manifest = {"version": version, "created": datetime.now().isoformat(), "charts": {}}
+    for name in LANDING_CHARTS:
+        builder, args = _chart_call(name)
+        spec = figure_json(builder, *args, cache_key=f"landing:{name}")
+        files = {"json": f"{name}.json"}
+        with open(os.path.join(target, files["json"]), "w", encoding="utf-8") as f:
+            f.write(spec)
+        if images:
+            try:
+                pio.write_image(json.loads(spec), os.path.join(target, f"{name}.svg"))
+                files["svg"] = f"{name}.svg"
+            except Exception as e:  # kaleido needs a browser runtime; JSON alone is enough to serve
+                print(f"{name}: svg skipped ({e})", file=sys.stderr)
+        manifest["charts"][name] = {"files": files, "bytes": len(spec.encode("utf-8"))}
+
+    with open(os.path.join(target, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render landing page charts for the current catalog version")
+    parser.add_argument("--out", default=SNAPSHOT_DIR, help="Snapshot root directory")
+    parser.add_argument("--no-images", action="store_true", help="Skip SVG export even when kaleido is installed")
+    args = parser.parse_args()
+    manifest = build_snapshots(args.out, images=not args.no_images)
+    for name, info in manifest["charts"].items():
+        print(f"{manifest['version']}/{name}: {', '.join(info['files'].values())} ({info['bytes']:,} bytes)")
+
+# Export functions
+__all__ = [
+    'trend_frame',
+    'create_advanced_bubble_chart',
+    'create_salary_comparison_chart',
+    'create_skill_radar_chart',
+    'landing_figure',
+    'load_snapshot',
+    'build_snapshots',
+    'snapshot_path',
+    'LANDING_CHARTS',
+    'SNAPSHOT_DIR'
+]
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# utils/lazy_imports.py - Deferred imports for heavy chart and data libraries
+"""
+Module proxies that import the real module on first attribute access.
+
+    go = lazy_import("plotly.graph_objects")
+    fig = go.Figure()  # plotly is imported here, not at page load
+
+Use with `from __future__ import annotations` so type hints such as
+`-> go.Figure` do not trigger the import when functions are defined.
+"""
+
+import importlib
+import sys
+import types
+
+class LazyModule(types.ModuleType):
+    """Stand-in module that loads `name` the first time an attribute is read"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_name"] = name
+        self.__dict__["_lazy_module"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            module = importlib.import_module(self.__dict__["_lazy_name"])
+            self.__dict__["_lazy_module"] = module
+            # Copy the public namespace so later lookups skip __getattr__ entirely
+            self.__dict__.update({k: v for k, v in module.__dict__.items() if not k.startswith("__")})
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__dict__['_lazy_name']}' ({state})>"
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Return the module if already imported, otherwise a proxy that imports it on first use"""
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+def is_loaded(name: str) -> bool:
+    """Whether `name` has actually been imported in this process"""
+    return name in sys.modules
+
+# Export functions
+__all__ = [
+    'LazyModule',
+    'lazy_import',
+    'is_loaded'
+]
@@ -0,0 +1,282 @@
+# utils/local_answers.py - Offline answers for the chat assistant from the app's own data
+"""
+Retrieval-based responder over the data catalog.
+
+Each catalog entry becomes one short document with a ready-made markdown
+answer:
+
+- job_mapping fields: jobs, salary ranges and demand
+- skill_database: skills, tools and certifications per field
+- simulation scenarios: transition roadmaps
+- learning_resources / practice_projects: how to learn a skill
+- Indonesian bootcamps, universities and communities
+- career_advice: general questions (interviews, first language, remote work)
+
+Questions are matched with TF-IDF cosine similarity. The confidence score
+combines the top score, its margin over the runner-up, and how many of the
+question's words the index knows. The chat page uses it to decide between
+answering locally and calling the LLM. The index is built on the first
+question for each catalog version (register_index with lazy=True), and a
+lookup then takes about a millisecond.
+"""
+
+import math
+import os
+import re
+from typing import List, Mapping, NamedTuple, Optional
+
+from utils.catalog import current_snapshot, register_index
+from utils.lazy_imports import lazy_import
+
+# Calibrated on measured scores: the chat page's suggested questions score 0.30-0.80,
+# off-topic questions ("negotiate a raise", "quantum physics") mostly stay under 0.23.
+# Answer locally without calling the LLM at or above this confidence
+FAST_PATH_CONFIDENCE = float(os.getenv("LOCAL_ANSWER_FAST_PATH", 0.28))
+# Use a local answer instead of an error message at or above this confidence
+FALLBACK_CONFIDENCE = float(os.getenv("LOCAL_ANSWER_FALLBACK", 0.2))
+
+OFFLINE_NOTE = "\n\n_Answered from the Career Shift Analyzer knowledge base._"
+
+# Intent words added to documents so questions phrased in different ways still match
+SALARY_TERMS = "salary salaries earn earning pay income compensation how much money"
+JOB_TERMS = "jobs roles positions titles career entry level mid level senior level remote demand"
+SKILL_TERMS = "skills need required in-demand tools certifications learn what skills"
+ROADMAP_TERMS = "roadmap transition switch best path become plan steps timeline how long months cost"
+LEARN_TERMS = "learn learning study start beginner resources courses tutorials practice projects"
+
+# Other names people use for each field, added to that field's documents
+FIELD_ALIASES = {
+    "Artificial Intelligence": "ai ml machine learning deep learning data scientist",
+    "Blockchain": "web3 crypto cryptocurrency smart contracts",
+    "Blockchain & Web3": "blockchain crypto cryptocurrency smart contracts",
+    "Cybersecurity": "cyber security infosec security analyst",
+    "Cloud Computing": "cloud aws azure gcp devops cloud architect",
+    "Data Science": "data scientist analytics data analyst",
+}
+
+# Words are split on "/" so "AI/ML" matches "ai" and "ml"; "+" and "#" keep C++ and C# intact
+_WORDS = re.compile(r"[a-z0-9][a-z0-9+#.-]*[a-z0-9+#]|[a-z0-9]")
+_NUMBER = re.compile(r"^[0-9.]+$")
+
+class LocalAnswer(NamedTuple):
+    text: str
+    confidence: float
+    source: str
+
+class Document(NamedTuple):
+    doc_id: str
+    title: str
+    text: str
+    answer: str
+
+def _money(value: float) -> str:
+    return f"${value / 1000:,.0f}K"
+
+def _join(items) -> str:
+    return ", ".join(str(item) for item in items)
+
+def _field_documents(job_mapping: Mapping) -> List[Document]:
+    documents = []
+    for field, info in job_mapping.items():
+        ranges = info.get("salary_ranges", {})
+        levels = [("entry", "Entry"), ("mid", "Mid"), ("senior", "Senior")]
+        salary_lines = [
+            f"- **{label}** ({_join(info.get(f'{level}_jobs', [])[:3])}): "
+            f"{_money(ranges[level][0])}-{_money(ranges[level][1])} per year"
+            for level, label in levels if level in ranges
+        ]
+        jobs = " ".join(title for level, _ in levels for title in info.get(f"{level}_jobs", []))
+
+        documents.append(Document(
+            f"salary:{field}", f"{field} salaries",
+            f"{field} {field} {FIELD_ALIASES.get(field, '')} {jobs} {SALARY_TERMS}",
+            f"💰 **{field} salary ranges** (global, USD):\n" + "\n".join(salary_lines) +
+            f"\n\nMarket demand is **{info.get('market_demand', 'n/a')}** and about "
+            f"{info.get('remote_percentage', 0)}% of roles are remote-friendly."
+        ))
+        documents.append(Document(
+            f"jobs:{field}", f"{field} career paths",
+            f"{field} {field} {FIELD_ALIASES.get(field, '')} {jobs} {_join(info.get('skills', []))} {JOB_TERMS}",
+            f"🚀 **Career paths in {field}**\n" +
+            "\n".join(f"- **{label}:** {_join(info.get(f'{level}_jobs', []))}" for level, label in levels) +
+            f"\n\nCore skills: {_join(info.get('skills', []))}. Market demand: **{info.get('market_demand', 'n/a')}**."
+        ))
+    return documents
+
+def _skill_documents(skill_database: Mapping) -> List[Document]:
+    documents = []
+    for field, info in skill_database.items():
+        skills = list(info.get("core_skills", [])) + list(info.get("tools", []))
+        documents.append(Document(
+            f"skills:{field}", f"{field} skills",
+            f"{field} {field} {FIELD_ALIASES.get(field, '')} {_join(skills)} {_join(info.get('certifications', []))} "
+            f"{SKILL_TERMS}",
+            f"🎯 **Most in-demand skills for {field}**\n"
+            f"- **Core skills:** {_join(info.get('core_skills', []))}\n"
+            f"- **Tools:** {_join(info.get('tools', []))}\n"
+            f"- **Soft skills:** {_join(info.get('soft_skills', []))}\n"
+            f"- **Certifications:** {_join(info.get('certifications', []))}\n\n"
+            f"Growth rate {info.get('growth_rate', 'n/a')}% • difficulty {info.get('difficulty', 'n/a')} • "
+            f"typical salary {info.get('salary_range', 'n/a')}."
+        ))
+    return documents
+
+def _scenario_documents(simulation: Mapping) -> List[Document]:
+    documents = []
+    for name, scenario in simulation.get("scenarios", {}).items():
+        steps = scenario.get("steps", [])
+        step_lines = [f"{step['month']}. {step['activity']} (~{step['time_hours']}h)" for step in steps]
+        documents.append(Document(
+            f"roadmap:{name}", f"{name} roadmap",
+            f"{name} {name} {scenario.get('description', '')} {_join(scenario.get('skills_gained', []))} "
+            f"{' '.join(step['activity'] for step in steps)} {ROADMAP_TERMS}",
+            f"🛣️ **{name} roadmap**: {scenario.get('description', '')}\n\n"
+            f"Duration **{scenario.get('duration', 'n/a')}**, difficulty {scenario.get('difficulty', 'n/a')}, "
+            f"investment {scenario.get('investment', 'n/a')}, success rate {scenario.get('success_rate', 'n/a')}%.\n\n"
+            + "\n".join(step_lines) +
+            f"\n\nSkills gained: {_join(scenario.get('skills_gained', []))}."
+        ))
+    return documents
+
+def _learning_documents(resources: Mapping, projects: Mapping) -> List[Document]:
+    documents = []
+    for skill in sorted(set(resources) | set(projects)):
+        answer = f"📚 **How to learn {skill}**\n"
+        if skill in resources:
+            answer += f"- **Resources:** {_join(resources[skill])}\n"
+        if skill in projects:
+            answer += f"- **Practice projects:** {_join(projects[skill])}\n"
+        documents.append(Document(
+            f"learn:{skill}", f"Learning {skill}",
+            f"{skill} {skill} {skill} {_join(resources.get(skill, []))} {_join(projects.get(skill, []))} {LEARN_TERMS}",
+            answer
+        ))
+    return documents
+
+def _indonesia_documents(learning: Mapping) -> List[Document]:
+    documents = []
+    bootcamps = learning.get("Bootcamp", {})
+    if bootcamps:
+        documents.append(Document(
+            "id:bootcamps", "Bootcamps in Indonesia",
+            "bootcamp bootcamps indonesia jakarta kursus " + " ".join(
+                f"{name} {info.get('focus', '')}" for name, info in bootcamps.items()
+            ) + f" {LEARN_TERMS} price biaya",
+            "🇮🇩 **Tech bootcamps in Indonesia**\n" + "\n".join(
+                f"- **{name}:** {info.get('focus', '')} • {info.get('duration', '')} • {info.get('price', '')}"
+                for name, info in bootcamps.items()
+            )
+        ))
+    for key, title, terms in (("Universities", "Universities in Indonesia", "university universitas degree kuliah"),
+                              ("Communities", "Tech communities in Indonesia", "community komunitas meetup network")):
+        if learning.get(key):
+            documents.append(Document(
+                f"id:{key.lower()}", title,
+                f"{terms} indonesia {_join(learning[key])}",
+                f"🇮🇩 **{title}:** {_join(learning[key])}"
+            ))
+    return documents
+
+def _advice_documents(advice: Mapping) -> List[Document]:
+    return [
+        Document(f"advice:{topic}", topic, f"{topic} {topic} {entry.get('keywords', '')}",
+                 f"💡 **{topic}**\n\n{entry.get('answer', '')}")
+        for topic, entry in advice.items()
+    ]
+
+def build_documents(catalog: Mapping) -> List[Document]:
+    """One document per answerable topic in the catalog"""
+    return (
+        _field_documents(catalog["job_mapping"])
+        + _skill_documents(catalog["skill_database"])
+        + _scenario_documents(catalog["simulation"])
+        + _learning_documents(catalog["learning_resources"], catalog["practice_projects"])
+        + _indonesia_documents(catalog["indonesia"]["learning"])
+        + _advice_documents(catalog.get("career_advice", {}))
+    )
+
+class LocalAnswerEngine:
+    """TF-IDF retrieval over catalog documents with a routing confidence"""
+
+    def __init__(self, documents: List[Document]):
+        feature_extraction = lazy_import("sklearn.feature_extraction.text")
+        self.documents = documents
+        self.vectorizer = feature_extraction.TfidfVectorizer(
+            ngram_range=(1, 2), sublinear_tf=True, stop_words="english", token_pattern=_WORDS.pattern
+        )
+        self.matrix = self.vectorizer.fit_transform([doc.text.lower() for doc in documents])
+        self.stop_words = self.vectorizer.get_stop_words()
+        self.vocabulary = self.vectorizer.vocabulary_
+
+    def _coverage(self, question: str) -> float:
+        """Share of the question's content words that appear anywhere in the knowledge base"""
+        # Single letters are mostly contraction leftovers ("what's" -> "s"), not topics
+        words = [word for word in _WORDS.findall(question.lower())
+                 if len(word) > 1 and word not in self.stop_words and not _NUMBER.match(word)]
+        if not words:
+            return 0.0
+        return sum(word in self.vocabulary for word in words) / len(words)
+
+    def search(self, question: str, k: int = 3) -> List[tuple]:
+        """[(document, cosine)] best first"""
+        query = self.vectorizer.transform([question.lower()])
+        if query.nnz == 0:
+            return []
+        scores = (self.matrix @ query.T).toarray().ravel()
+        best = scores.argsort()[::-1][:k]
+        return [(self.documents[i], float(scores[i])) for i in best if scores[i] > 0]
+
+    def confidence(self, question: str, matches: List[tuple]) -> float:
+        """
+        0-1 routing score
+
+        The top cosine is square-rooted, because short questions against longer
+        documents rarely pass 0.5. It is then weighted by the margin over the
+        runner-up (an ambiguous match is a weak match) and by vocabulary
+        coverage (unknown words mean the question is about something the
+        catalog does not hold).
+        """
+        if not matches:
+            return 0.0
+        top = matches[0][1]
+        runner_up = matches[1][1] if len(matches) > 1 else 0.0
+        margin = (top - runner_up) / top if top else 0.0
+        return math.sqrt(top) * (0.6 + 0.4 * margin) * self._coverage(question)
+
+    def answer(self, question: str) -> Optional[LocalAnswer]:
+        """Best local answer and its confidence, or None when nothing matches"""
+        matches = self.search(question)
+        if not matches:
+            return None
+        document = matches[0][0]
+        return LocalAnswer(document.answer, round(self.confidence(question, matches), 3), document.doc_id)
+
+def _build_engine(catalog: Mapping) -> Optional[LocalAnswerEngine]:
+    # A missing optional dependency means no local answers, not a broken chat page
+    try:
+        return LocalAnswerEngine(build_documents(catalog))
+    except ImportError:
+        return None
+
+# Fitting takes over a second; only the chat page needs it
+register_index("local_answers", _build_engine, lazy=True)
+
+def get_local_answer_engine() -> Optional[LocalAnswerEngine]:
+    """Engine for the current catalog snapshot, or None without scikit-learn"""
+    return current_snapshot().index("local_answers")
+
+def answer_locally(question: str) -> Optional[LocalAnswer]:
+    engine = get_local_answer_engine()
+    return engine.answer(question) if engine else None
+
+# Export functions
+__all__ = [
+    'LocalAnswer',
+    'LocalAnswerEngine',
+    'build_documents',
+    'get_local_answer_engine',
+    'answer_locally',
+    'FAST_PATH_CONFIDENCE',
+    'FALLBACK_CONFIDENCE',
+    'OFFLINE_NOTE'
+]
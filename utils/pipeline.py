@@ -0,0 +1,257 @@
+# utils/pipeline.py - Streaming scoring pipeline with constant memory
+"""
+Generator stages for scoring profile exports of any size:
+
+    read_records -> normalize_records -> chunk_profiles -> score_chunks -> write_rows
+
+Each stage pulls from the previous one lazily, so only `chunk_size` profiles
+(times the number of chunks in flight when a process pool is used) are held in
+memory at once, regardless of file size.
+"""
+
+import csv
+import json
+import sys
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, Iterator, List, TextIO
+
+from utils.future_readiness import SKILL_CATEGORIES, get_readiness_engine
+from utils.recommender import advanced_recommender_batch
+
+OUTPUT_COLUMNS = [
+    "id", "field", "skill_match_score", "experience_level", "transition_difficulty",
+    "estimated_timeline", "readiness_score", "readiness_level", "readiness_timeline_months"
+]
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+
+def file_format(path: str) -> str:
+    """Input/output format from the file name: jsonl (.jsonl/.ndjson), json (.json array) or csv"""
+    if path.endswith(JSONL_SUFFIXES):
+        return "jsonl"
+    return "json" if path.endswith(".json") else "csv"
+
+def split_list(value) -> List[str]:
+    """Parse a list column from JSON, CSV text or an actual list"""
+    if value is None or value == "":
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value]
+    text = str(value).strip()
+    if text.startswith("["):
+        try:
+            return [str(item) for item in json.loads(text)]
+        except ValueError:
+            pass
+    return [part.strip() for part in text.replace(";", ",").split(",") if part.strip()]
+
+def _to_number(value, default: float) -> float:
+    try:
+        return float(value) if value not in (None, "") else default
+    except (TypeError, ValueError):
+        return default
+
+# Stage 1: reader
+def read_records(path: str) -> Iterator[Dict]:
+    """
+    Raw records from a .csv, .jsonl/.ndjson or .json file
+
+    CSV and JSONL are streamed one line at a time. A .json file holds one JSON
+    array and is parsed whole; use JSONL for exports that do not fit in memory.
+    """
+    fmt = file_format(path)
+    with open(path, newline="", encoding="utf-8") as handle:
+        if fmt == "jsonl":
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+        elif fmt == "json":
+            records = json.load(handle)
+            if not isinstance(records, list):
+                raise ValueError(f"{path} must contain a JSON array of profiles (use .jsonl for one per line)")
+            yield from records
+        else:
+            yield from csv.DictReader(handle)
+
+# Stage 2: normalizer
+def normalize_profile(raw: Dict, position: int) -> Dict:
+    """Turn one raw input record into recommender and readiness arguments"""
+    categories = {cat: split_list(raw[cat]) for cat in SKILL_CATEGORIES if raw.get(cat) not in (None, "")}
+    skills = split_list(raw.get("skills"))
+    if not categories:
+        categories = {"core_skills": skills}
+
+    if not skills:
+        skills = [skill for cat_skills in categories.values() for skill in cat_skills]
+
+    profile = {
+        "id": raw.get("id") if raw.get("id") not in (None, "") else position,
+        "skills": skills,
+        "interest_fields": split_list(raw.get("interest_fields")) or None,
+        "years_experience": _to_number(raw.get("years_experience"), 0),
+        "weekly_learning_hours": _to_number(raw.get("weekly_learning_hours"), 10),
+        "career_urgency": raw.get("career_urgency") or "6-12 months",
+        "current_role": raw.get("current_role") or "",
+    }
+    profile.update(categories)
+    return profile
+
+def normalize_records(records: Iterable[Dict]) -> Iterator[Dict]:
+    """Normalize raw records lazily, numbering them by input position"""
+    for position, raw in enumerate(records):
+        yield normalize_profile(raw, position)
+
+def chunk_profiles(profiles: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """Group profiles into lists of at most `size`"""
+    chunk = []
+    for profile in profiles:
+        chunk.append(profile)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+# Stage 3: scorer
+def score_chunk(profiles: List[Dict], fields: List[str] = None) -> List[Dict]:
+    """Score one chunk with both vectorized engines; safe to run in a worker process"""
+    # Key both engines by chunk position so duplicate ids in the input stay distinct
+    positioned = [dict(profile, id=position) for position, profile in enumerate(profiles)]
+    recommendations = advanced_recommender_batch(positioned, fields)
+    readiness = get_readiness_engine().score_profiles(profiles, fields)
+
+    readiness_by_key = {
+        (int(position), field): (score, level, months)
+        for position, field, score, level, months in zip(
+            readiness["profile"], readiness["field"], readiness["overall_score"],
+            readiness["readiness_level"], readiness["estimated_timeline_months"]
+        )
+    }
+
+    rows = []
+    for record in recommendations.to_dict("records"):
+        position = record["id"]
+        score, level, months = readiness_by_key[(position, record["field"])]
+        record["id"] = profiles[position]["id"]
+        record["readiness_score"] = round(float(score), 1)
+        record["readiness_level"] = level
+        record["readiness_timeline_months"] = round(float(months), 1)
+        rows.append(record)
+    return rows
+
+def score_chunks(chunks: Iterable[List[Dict]], fields: List[str] = None, executor=None,
+                 max_in_flight: int = 2) -> Iterator[tuple]:
+    """
+    Score chunks in input order, yielding (profile_count, rows) per chunk
+
+    Args:
+        chunks: Iterable of profile lists
+        fields: Fields to score; defaults to every field
+        executor: Optional concurrent.futures executor; scores in-process when None
+        max_in_flight: Chunks submitted ahead of the writer when using an executor
+    """
+    if executor is None:
+        for chunk in chunks:
+            yield len(chunk), score_chunk(chunk, fields)
+        return
+
+    pending = deque()
+    for chunk in chunks:
+        pending.append((len(chunk), executor.submit(score_chunk, chunk, fields)))
+        if len(pending) >= max_in_flight:
+            size, future = pending.popleft()
+            yield size, future.result()
+    while pending:
+        size, future = pending.popleft()
+        yield size, future.result()
+
+# Stage 4: writer
+def write_rows(scored: Iterable[tuple], out: TextIO, fmt: str = "csv",
+               on_chunk: Callable[[int, int], None] = None) -> int:
+    """
+    Write scored chunks to `out`; returns the profile count
+
+    Args:
+        fmt: "csv", "jsonl", or "json" for one JSON array (still written chunk by chunk)
+    """
+    writer = None
+    if fmt == "csv":
+        writer = csv.DictWriter(out, fieldnames=OUTPUT_COLUMNS)
+        writer.writeheader()
+    elif fmt == "json":
+        out.write("[")
+
+    profiles = 0
+    separator = "\n"
+    for size, rows in scored:
+        if writer:
+            writer.writerows(rows)
+        elif fmt == "json":
+            for row in rows:
+                out.write(separator + json.dumps(row))
+                separator = ",\n"
+        else:
+            out.writelines(json.dumps(row) + "\n" for row in rows)
+        profiles += size
+        if on_chunk:
+            on_chunk(size, len(rows))
+    if fmt == "json":
+        out.write("\n]\n")
+    return profiles
+
+class ProgressReporter:
+    """Prints processed profiles and rows/sec to a stream, at most every `interval` seconds"""
+
+    def __init__(self, stream: TextIO = sys.stderr, interval: float = 1.0):
+        self.stream = stream
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.last_report = 0.0
+        self.profiles = 0
+        self.rows = 0
+
+    def __call__(self, profiles: int, rows: int):
+        self.profiles += profiles
+        self.rows += rows
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report(end="")
+
+    @property
+    def rate(self) -> float:
+        return self.profiles / max(time.perf_counter() - self.started, 1e-9)
+
+    def report(self, end: str = "\n"):
+        print(f"\r{self.profiles:,} profiles, {self.rows:,} rows ({self.rate:,.0f} profiles/s)",
+              end=end, file=self.stream)
+
+def run_pipeline(input_path: str, output_path: str, chunk_size: int = 5000, fields: List[str] = None,
+                 executor=None, max_in_flight: int = 2, progress: ProgressReporter = None) -> int:
+    """Stream input_path through every stage into output_path; returns the profile count"""
+    chunks = chunk_profiles(normalize_records(read_records(input_path)), chunk_size)
+    scored = score_chunks(chunks, fields, executor, max_in_flight)
+
+    with open(output_path, "w", newline="", encoding="utf-8") as out:
+        count = write_rows(scored, out, file_format(output_path), progress)
+
+    if progress:
+        progress.report()
+    return count
+
+# Export functions
+__all__ = [
+    'read_records',
+    'file_format',
+    'split_list',
+    'normalize_profile',
+    'normalize_records',
+    'chunk_profiles',
+    'score_chunk',
+    'score_chunks',
+    'write_rows',
+    'ProgressReporter',
+    'run_pipeline',
+    'OUTPUT_COLUMNS'
+]
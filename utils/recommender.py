@@ -1,67 +1,22 @@
 # utils/recommender.py - Enhanced with better logic and AI integration
 
 import pandas as pd
-from typing import Dict, List, Tuple
+import numpy as np
+from scipy import sparse
+from typing import Dict, Iterable, List, Tuple, Union
 import random
 
+from utils.catalog import current_snapshot, get_section, register_index, thaw
+
 def get_enhanced_job_mapping():
-    """Enhanced job mapping with more comprehensive data"""
-    return {
-        "Artificial Intelligence": {
-            "skills": ["python", "machine learning", "data", "sql", "statistics", "deep learning", "tensorflow", "pytorch"],
-            "entry_jobs": ["AI Research Assistant", "Data Analyst", "ML Intern", "Junior Data Scientist"],
-            "mid_jobs": ["Machine Learning Engineer", "Data Scientist", "AI Developer", "Computer Vision Engineer"],
-            "senior_jobs": ["Principal ML Engineer", "AI Research Lead", "Head of Data Science", "AI Architect"],
-            "salary_ranges": {"entry": (60000, 90000), "mid": (90000, 140000), "senior": (140000, 200000)},
-            "remote_percentage": 85,
-            "market_demand": "Very High"
-        },
-        "Blockchain": {
-            "skills": ["solidity", "crypto", "security", "smart contract", "web3", "ethereum", "defi"],
-            "entry_jobs": ["Blockchain Developer Intern", "Smart Contract Auditor Junior", "Crypto Analyst"],
-            "mid_jobs": ["Blockchain Developer", "Smart Contract Developer", "DeFi Engineer", "Web3 Developer"],
-            "senior_jobs": ["Blockchain Architect", "Principal Blockchain Engineer", "Head of Blockchain"],
-            "salary_ranges": {"entry": (70000, 100000), "mid": (100000, 160000), "senior": (160000, 250000)},
-            "remote_percentage": 90,
-            "market_demand": "High"
-        },
-        "Renewable Energy": {
-            "skills": ["solar", "electrical", "sustainability", "engineering", "grid systems", "energy storage"],
-            "entry_jobs": ["Solar Energy Technician", "Renewable Energy Analyst", "Sustainability Coordinator"],
-            "mid_jobs": ["Green Finance Analyst", "Energy Systems Engineer", "Solar Project Manager"],
-            "senior_jobs": ["Director of Sustainability", "Principal Energy Engineer", "Chief Sustainability Officer"],
-            "salary_ranges": {"entry": (45000, 65000), "mid": (65000, 95000), "senior": (95000, 140000)},
-            "remote_percentage": 40,
-            "market_demand": "Medium"
-        },
-        "Biotechnology": {
-            "skills": ["biology", "genetics", "lab", "bioinformatics", "crispr", "molecular biology"],
-            "entry_jobs": ["Lab Research Assistant", "Bioinformatics Analyst", "Quality Control Technician"],
-            "mid_jobs": ["Biotechnology Researcher", "Bioinformatics Scientist", "Clinical Research Associate"],
-            "senior_jobs": ["Principal Scientist", "Director of R&D", "Chief Scientific Officer"],
-            "salary_ranges": {"entry": (50000, 70000), "mid": (70000, 110000), "senior": (110000, 180000)},
-            "remote_percentage": 30,
-            "market_demand": "Medium"
-        },
-        "Space Exploration": {
-            "skills": ["physics", "engineering", "aerospace", "navigation", "satellite", "mission planning"],
-            "entry_jobs": ["Aerospace Data Engineer", "Space Operations Analyst", "Mission Support Specialist"],
-            "mid_jobs": ["Satellite Engineer", "Mission Planner", "Space Systems Engineer"],
-            "senior_jobs": ["Chief Mission Engineer", "Director of Space Operations", "Principal Aerospace Engineer"],
-            "salary_ranges": {"entry": (65000, 85000), "mid": (85000, 130000), "senior": (130000, 200000)},
-            "remote_percentage": 60,
-            "market_demand": "Medium"
-        },
-        "Cybersecurity": {
-            "skills": ["network security", "penetration testing", "siem", "incident response", "ethical hacking"],
-            "entry_jobs": ["Security Analyst", "Junior Penetration Tester", "SOC Analyst"],
-            "mid_jobs": ["Cybersecurity Engineer", "Security Consultant", "Incident Response Specialist"],
-            "senior_jobs": ["CISO", "Principal Security Architect", "Director of Cybersecurity"],
-            "salary_ranges": {"entry": (55000, 75000), "mid": (75000, 120000), "senior": (120000, 180000)},
-            "remote_percentage": 80,
-            "market_demand": "Very High"
-        }
-    }
+    """Enhanced job mapping (shared, read-only catalog - copy before modifying)"""
+    return get_section("job_mapping")
+
+def __getattr__(name: str):
+    # JOB_CATALOG follows the live catalog snapshot so hot reloads are visible
+    if name == "JOB_CATALOG":
+        return get_enhanced_job_mapping()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def calculate_skill_match_score(user_skills: List[str], field_skills: List[str]) -> float:
     """Calculate more sophisticated skill matching score"""
@@ -84,6 +39,106 @@ def calculate_skill_match_score(user_skills: List[str], field_skills: List[str])
     total_matches = direct_matches + partial_matches
     return min((total_matches / len(field_skills)) * 100, 100)
 
+class SkillIndex:
+    """Precompiled lookup over every field's skills for single-pass scoring
+
+    Holds the normalized field skills plus a substring table (every substring of
+    every field skill -> the skills containing it), so one user skill resolves to
+    its direct and partial matches across all fields with a couple of dict hits
+    instead of a nested loop per field.
+    """
+
+    # Free-text skills are unbounded, so the per-skill memo is capped
+    MAX_CACHED_SKILLS = 50000
+
+    def __init__(self, job_mapping: Dict):
+        self.fields = list(job_mapping.keys())
+        self.field_sizes = {field: len(data["skills"]) for field, data in job_mapping.items()}
+
+        # token -> {field: occurrences of that skill in the field}
+        self.tokens: Dict[str, Dict[str, int]] = {}
+        for field, data in job_mapping.items():
+            for skill in data["skills"]:
+                counts = self.tokens.setdefault(skill.lower().strip(), {})
+                counts[field] = counts.get(field, 0) + 1
+
+        # substring -> field skill tokens that contain it
+        self.substrings: Dict[str, List[str]] = {}
+        for token in self.tokens:
+            for fragment in self._fragments(token):
+                self.substrings.setdefault(fragment, []).append(token)
+
+        self._partial_cache: Dict[str, Dict[str, float]] = {}
+
+    @staticmethod
+    def _fragments(text: str) -> set:
+        """All substrings of text, including the empty string"""
+        return {text[i:j] for i in range(len(text) + 1) for j in range(i, len(text) + 1)}
+
+    def partial_matches(self, user_skill: str) -> Dict[str, float]:
+        """Partial-match credit per field for one normalized user skill"""
+        cached = self._partial_cache.get(user_skill)
+        if cached is not None:
+            return cached
+
+        # Field skills containing the user skill, plus field skills contained in it
+        related = set(self.substrings.get(user_skill, []))
+        related.update(fragment for fragment in self._fragments(user_skill) if fragment in self.tokens)
+        related.discard(user_skill)
+
+        credit: Dict[str, float] = {}
+        for token in related:
+            for field, count in self.tokens[token].items():
+                credit[field] = credit.get(field, 0) + 0.5 * count
+
+        if len(self._partial_cache) >= self.MAX_CACHED_SKILLS:
+            self._partial_cache.clear()
+        self._partial_cache[user_skill] = credit
+        return credit
+
+    def score_fields(self, user_skills: List[str], fields: List[str] = None) -> Dict[str, float]:
+        """Score user skills against every field (or the given ones) in one pass
+
+        Matches calculate_skill_match_score: each distinct user skill earns one
+        point per identical field skill, and every user skill earns half a point
+        per field skill it contains or is contained in.
+        """
+        fields = self.fields if fields is None else [f for f in fields if f in self.field_sizes]
+        if not user_skills:
+            return {field: 0.0 for field in fields}
+
+        totals: Dict[str, float] = {}
+        user_skills_lower = [skill.lower().strip() for skill in user_skills]
+
+        for user_skill in set(user_skills_lower):
+            for field, count in self.tokens.get(user_skill, {}).items():
+                totals[field] = totals.get(field, 0) + count
+
+        for user_skill in user_skills_lower:
+            for field, credit in self.partial_matches(user_skill).items():
+                totals[field] = totals.get(field, 0) + credit
+
+        scores = {}
+        for field in fields:
+            size = self.field_sizes[field]
+            scores[field] = min((totals.get(field, 0) / size) * 100, 100) if size else 0.0
+        return scores
+
+register_index("skill_index", lambda catalog: SkillIndex(catalog["job_mapping"]))
+
+def get_skill_index(job_mapping: Dict = None) -> SkillIndex:
+    """
+    Skill index for a job mapping, built once per catalog snapshot
+
+    Args:
+        job_mapping: Mapping the caller already holds; when it is not the live
+            snapshot's (e.g. a reload happened in between) a matching index is built
+    """
+    snapshot = current_snapshot()
+    if job_mapping is None or job_mapping is snapshot.section("job_mapping"):
+        return snapshot.index("skill_index")
+    return SkillIndex(job_mapping)
+
 def determine_experience_level(user_skills: List[str], years_experience: int) -> str:
     """Determine user's experience level based on skills and years"""
     skill_count = len(user_skills)
@@ -97,24 +152,7 @@ def determine_experience_level(user_skills: List[str], years_experience: int) ->
 
 def get_learning_path(missing_skills: List[str], target_field: str) -> Dict:
     """Generate learning path for missing skills"""
-    learning_resources = {
-        "Artificial Intelligence": {
-            "Python": {"time": "2-3 months", "resources": ["Python.org Tutorial", "Codecademy Python"], "priority": "High"},
-            "Machine Learning": {"time": "3-4 months", "resources": ["Coursera ML Course", "Kaggle Learn"], "priority": "High"},
-            "Deep Learning": {"time": "4-6 months", "resources": ["Deep Learning Specialization", "Fast.ai"], "priority": "Medium"},
-            "TensorFlow": {"time": "2-3 months", "resources": ["TensorFlow.org", "Google AI Education"], "priority": "Medium"}
-        },
-        "Blockchain": {
-            "Solidity": {"time": "2-3 months", "resources": ["Solidity Docs", "CryptoZombies"], "priority": "High"},
-            "Smart Contract": {"time": "3-4 months", "resources": ["Ethereum.org", "Hardhat Tutorial"], "priority": "High"},
-            "Web3": {"time": "2-3 months", "resources": ["Web3.js Docs", "Moralis Academy"], "priority": "Medium"}
-        },
-        "Cybersecurity": {
-            "Network Security": {"time": "2-3 months", "resources": ["Cisco Networking", "CompTIA Security+"], "priority": "High"},
-            "Penetration Testing": {"time": "3-4 months", "resources": ["OSCP Course", "Metasploit Unleashed"], "priority": "High"},
-            "SIEM": {"time": "1-2 months", "resources": ["Splunk Fundamentals", "ELK Stack Tutorial"], "priority": "Medium"}
-        }
-    }
+    learning_resources = get_section("learning_paths")
     
     path = {}
     field_resources = learning_resources.get(target_field, {})
@@ -122,7 +160,7 @@ def get_learning_path(missing_skills: List[str], target_field: str) -> Dict:
     for skill in missing_skills:
         skill_key = next((k for k in field_resources.keys() if k.lower() in skill.lower()), None)
         if skill_key:
-            path[skill] = field_resources[skill_key]
+            path[skill] = thaw(field_resources[skill_key])
         else:
             path[skill] = {
                 "time": "1-2 months",
@@ -137,6 +175,9 @@ def advanced_recommender(user_skills: List[str], interest_fields: List[str], yea
     job_mapping = get_enhanced_job_mapping()
     recommendations = {}
     
+    # Score every requested field in one pass over the user's skills
+    match_scores = get_skill_index(job_mapping).score_fields(user_skills, interest_fields)
+    
     for field in interest_fields:
         if field not in job_mapping:
             continue
@@ -144,7 +185,7 @@ def advanced_recommender(user_skills: List[str], interest_fields: List[str], yea
         field_data = job_mapping[field]
         
         # Calculate skill match
-        skill_match_score = calculate_skill_match_score(user_skills, field_data["skills"])
+        skill_match_score = match_scores[field]
         
         # Determine experience level
         exp_level = determine_experience_level(user_skills, years_experience)
@@ -174,7 +215,7 @@ def advanced_recommender(user_skills: List[str], interest_fields: List[str], yea
         
         recommendations[field] = {
             "skill_match_score": round(skill_match_score, 1),
-            "recommended_jobs": jobs,
+            "recommended_jobs": list(jobs),
             "experience_level": exp_level,
             "salary_range": f"${salary_range[0]:,} - ${salary_range[1]:,}",
             "missing_skills": missing_skills[:5],
@@ -188,6 +229,128 @@ def advanced_recommender(user_skills: List[str], interest_fields: List[str], yea
     
     return recommendations
 
+def _parse_skill_list(value) -> List[str]:
+    """Accept a list of skills or a comma/semicolon separated string"""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    if isinstance(value, str):
+        return [part.strip() for part in value.replace(";", ",").split(",") if part.strip()]
+    return list(value)
+
+def _profile_columns(profiles: Union[pd.DataFrame, Iterable[Dict]]) -> Tuple[List, List[List[str]], np.ndarray, List]:
+    """Split profiles into ids, skill lists, years of experience and field filters"""
+    if isinstance(profiles, pd.DataFrame):
+        ids = list(profiles["id"]) if "id" in profiles.columns else list(profiles.index)
+        skills = [_parse_skill_list(value) for value in profiles["skills"].tolist()]
+        if "years_experience" in profiles.columns:
+            years = profiles["years_experience"].fillna(0).to_numpy(dtype=float)
+        else:
+            years = np.zeros(len(profiles))
+        if "interest_fields" in profiles.columns:
+            fields = [_parse_skill_list(value) or None for value in profiles["interest_fields"].tolist()]
+        else:
+            fields = [None] * len(profiles)
+        return ids, skills, years, fields
+
+    ids, skills, years, fields = [], [], [], []
+    for position, profile in enumerate(profiles):
+        ids.append(profile.get("id", position))
+        skills.append(_parse_skill_list(profile.get("skills")))
+        years.append(profile.get("years_experience") or 0)
+        fields.append(_parse_skill_list(profile.get("interest_fields")) or None)
+    return ids, skills, np.asarray(years, dtype=float), fields
+
+def advanced_recommender_batch(
+    profiles: Union[pd.DataFrame, Iterable[Dict]],
+    interest_fields: List[str] = None
+) -> pd.DataFrame:
+    """
+    Score many profiles against every field in one vectorized pass
+    
+    Args:
+        profiles: DataFrame (or iterable of dicts) with a 'skills' column holding
+            lists or comma-separated strings, plus optional 'id',
+            'years_experience' and 'interest_fields' columns
+        interest_fields: Fields to score; defaults to every catalog field.
+            A per-profile 'interest_fields' value narrows this further
+    
+    Returns:
+        Long-format DataFrame with one row per (profile, field): id, field,
+        skill_match_score, experience_level, transition_difficulty and
+        estimated_timeline, using the same rules as advanced_recommender
+    """
+    index = get_skill_index()
+    fields = [f for f in (interest_fields or index.fields) if f in index.field_sizes]
+    ids, skill_lists, years, field_filters = _profile_columns(profiles)
+    n_profiles = len(ids)
+    columns = ["id", "field", "skill_match_score", "experience_level",
+               "transition_difficulty", "estimated_timeline"]
+    if n_profiles == 0 or not fields:
+        return pd.DataFrame(columns=columns)
+
+    # Sparse profile x token counts over the tokens seen in this batch
+    vocabulary: Dict[str, int] = {}
+    rows, cols = [], []
+    for row, skills in enumerate(skill_lists):
+        for skill in skills:
+            token = skill.lower().strip()
+            rows.append(row)
+            cols.append(vocabulary.setdefault(token, len(vocabulary)))
+    counts = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(n_profiles, len(vocabulary))
+    )
+    presence = counts.copy()
+    presence.data[:] = 1.0
+
+    # Token x field weights: direct hits (set semantics) and partial credit (per occurrence)
+    field_position = {field: i for i, field in enumerate(fields)}
+    direct = np.zeros((len(vocabulary), len(fields)))
+    partial = np.zeros((len(vocabulary), len(fields)))
+    for token, column in vocabulary.items():
+        for field, count in index.tokens.get(token, {}).items():
+            if field in field_position:
+                direct[column, field_position[field]] = count
+        for field, credit in index.partial_matches(token).items():
+            if field in field_position:
+                partial[column, field_position[field]] = credit
+
+    totals = presence @ direct + counts @ partial
+    sizes = np.array([index.field_sizes[field] for field in fields], dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scores = np.where(sizes > 0, np.minimum(totals / sizes * 100, 100), 0.0)
+
+    skill_counts = np.array([len(skills) for skills in skill_lists])
+    levels = np.select(
+        [(years >= 5) | (skill_counts >= 8), (years >= 2) | (skill_counts >= 4)],
+        ["senior", "mid"], default="entry"
+    )
+
+    flat_scores = scores.ravel()
+    result = pd.DataFrame({
+        "id": np.repeat(np.asarray(ids, dtype=object), len(fields)),
+        "field": np.tile(np.asarray(fields, dtype=object), n_profiles),
+        "skill_match_score": np.round(flat_scores, 1),
+        "experience_level": np.repeat(levels, len(fields)),
+        "transition_difficulty": np.select(
+            [flat_scores >= 70, flat_scores >= 40], ["Easy", "Medium"], default="Hard"
+        ),
+        "estimated_timeline": np.select(
+            [flat_scores >= 70, flat_scores >= 40], ["3-6 months", "6-12 months"], default="12-18 months"
+        ),
+    }, columns=columns)
+
+    # Drop fields a profile did not ask about
+    if any(selected is not None for selected in field_filters):
+        keep = np.ones(len(result), dtype=bool)
+        for row, selected in enumerate(field_filters):
+            if selected is not None:
+                wanted = set(selected)
+                start = row * len(fields)
+                keep[start:start + len(fields)] = [field in wanted for field in fields]
+        result = result[keep].reset_index(drop=True)
+
+    return result
+
 def generate_next_steps(skill_score: float, missing_skills: List[str], field: str) -> List[str]:
     """Generate personalized next steps"""
     steps = []
@@ -239,10 +402,11 @@ def simple_recommender(user_skills: List[str], interest_fields: List[str]) -> Di
             continue
             
         field_data = job_mapping[field]
-        matched = any(skill.lower() in [s.lower() for s in field_data["skills"]] for skill in user_skills)
+        field_skills_lower = {s.lower() for s in field_data["skills"]}
+        matched = any(skill.lower() in field_skills_lower for skill in user_skills)
         
         if matched:
-            recommendations[field] = field_data["entry_jobs"]
+            recommendations[field] = list(field_data["entry_jobs"])
         else:
             missing_count = len(field_data["skills"])
             recommendations[field] = [f"(Need to learn {missing_count} core skills - significant training required)"]
@@ -263,7 +427,7 @@ def get_market_insights(field: str) -> Dict:
         "market_demand": field_data["market_demand"],
         "entry_salary": f"${field_data['salary_ranges']['entry'][0]:,} - ${field_data['salary_ranges']['entry'][1]:,}",
         "senior_salary": f"${field_data['salary_ranges']['senior'][0]:,} - ${field_data['salary_ranges']['senior'][1]:,}",
-        "key_skills": field_data["skills"][:5],
+        "key_skills": list(field_data["skills"][:5]),
         "career_progression": f"Entry → Mid → Senior level positions available"
     }
 
@@ -271,7 +435,11 @@ def get_market_insights(field: str) -> Dict:
 __all__ = [
     'simple_recommender',
     'advanced_recommender', 
+    'advanced_recommender_batch',
     'get_market_insights',
     'calculate_skill_match_score',
-    'get_learning_path'
+    'get_learning_path',
+    'SkillIndex',
+    'get_skill_index',
+    'JOB_CATALOG'
 ]
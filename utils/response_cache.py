@@ -0,0 +1,413 @@
+# utils/response_cache.py - Exact and similarity cache for chat assistant answers
+"""
+Two-layer cache in front of the LLM:
+
+1. Exact layer: sha256 of the normalized prompt (case, whitespace and
+   trailing punctuation folded) plus a namespace (model + system prompt).
+2. Similarity layer: TF-IDF cosine over the cached prompts of the same
+   namespace (function words dropped), so "How do I transition into AI/ML
+   from my current role?" also answers "how can I transition to AI/ML from my
+   current role". Words the cached prompt does not contain lower the score, so
+   "...into cybersecurity..." does not, and prompts that differ in a negation,
+   ordinal or pros/cons word ("should I not learn...", "...learn last?") never
+   match. scikit-learn is optional; without it only the exact layer is used.
+
+Entries expire after a TTL and the least recently used entries are evicted
+past `max_entries`. Storage is pluggable: MemoryBackend (per process),
+SQLiteBackend (shared on-disk file) or RedisBackend (needs `redis`).
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from utils.lazy_imports import lazy_import
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+DEFAULT_SIMILARITY = 0.85
+DEFAULT_SQLITE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                   "data", ".cache", "response_cache.sqlite3")
+
+_PUNCTUATION = re.compile(r"[^\w\s/+#.-]")
+_WHITESPACE = re.compile(r"\s+")
+
+# Words TF-IDF ignores. Unlike scikit-learn's "english" list this keeps
+# negations, ordinals and comparatives, which change what a question asks
+STOP_WORDS = frozenset("""
+a an the and or of in on at to for from by with into onto about as
+i me my we our us you your he she it its they them their this that these those
+is am are was were be been being do does did doing have has had having
+can could would will shall may might must should
+what which who whom whose how why when where there here
+so if then than just also please
+""".split())
+
+# Words that flip or rank what a prompt asks; a similar hit must share exactly the same ones
+POLARITY_WORDS = frozenset("""
+not no never nor neither none nothing without cannot cant dont don doesn didn
+isn aren wasn weren shouldn wouldn couldn avoid
+first second third last next before after
+pros cons best worst most least more less
+""".split())
+
+def normalize_prompt(prompt: str) -> str:
+    """Lowercase, drop punctuation that does not change meaning and collapse whitespace"""
+    text = _PUNCTUATION.sub(" ", prompt.lower())
+    return _WHITESPACE.sub(" ", text).strip(" .")
+
+def make_namespace(*parts: str) -> str:
+    """Short hash identifying what an answer depends on besides the prompt (model, system prompt)"""
+    return hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()[:16]
+
+def make_key(namespace: str, normalized_prompt: str) -> str:
+    return namespace + ":" + hashlib.sha256(normalized_prompt.encode("utf-8")).hexdigest()
+
+class MemoryBackend:
+    """In-process LRU dict; fastest, but not shared between processes"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry["expires"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def prompts(self, namespace: str) -> List[Tuple[str, str]]:
+        """(key, normalized prompt) for live entries in a namespace"""
+        now = time.time()
+        with self._lock:
+            return [(key, entry["prompt"]) for key, entry in self._entries.items()
+                    if key.startswith(namespace + ":") and entry["expires"] > now]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+class SQLiteBackend:
+    """On-disk cache shared by every process on the host"""
+
+    def __init__(self, path: str = DEFAULT_SQLITE_PATH, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    prompt TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    expires REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict]:
+        conn = self._connect()
+        row = conn.execute("SELECT prompt, response, created, expires FROM responses WHERE key = ?",
+                           (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if row[3] <= now:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        return {"prompt": row[0], "response": row[1], "created": row[2], "expires": row[3]}
+
+    def set(self, key: str, entry: Dict):
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, prompt, response, created, expires, last_access) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (key, entry["prompt"], entry["response"], entry["created"], entry["expires"], now)
+        )
+        conn.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        conn.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_access DESC "
+            "LIMIT -1 OFFSET ?)", (self.max_entries,)
+        )
+
+    def prompts(self, namespace: str) -> List[Tuple[str, str]]:
+        rows = self._connect().execute(
+            "SELECT key, prompt FROM responses WHERE key LIKE ? AND expires > ?",
+            (namespace + ":%", time.time())
+        )
+        return rows.fetchall()
+
+    def clear(self):
+        self._connect().execute("DELETE FROM responses")
+
+class RedisBackend:
+    """
+    Redis-backed cache for multi-host deployments
+
+    TTL uses native key expiry; LRU order is kept in a sorted set per
+    namespace and trimmed to `max_entries`.
+    """
+
+    def __init__(self, url: str = None, max_entries: int = DEFAULT_MAX_ENTRIES, prefix: str = "csa:chat:"):
+        import redis
+
+        self.client = redis.Redis.from_url(url or os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                                           decode_responses=True)
+        self.max_entries = max_entries
+        self.prefix = prefix
+
+    def _lru_key(self, key: str) -> str:
+        return self.prefix + "lru:" + key.split(":", 1)[0]
+
+    def get(self, key: str) -> Optional[Dict]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self.client.zrem(self._lru_key(key), key)
+            return None
+        self.client.zadd(self._lru_key(key), {key: time.time()})
+        return json.loads(raw)
+
+    def set(self, key: str, entry: Dict):
+        ttl = max(int(entry["expires"] - time.time()), 1)
+        lru_key = self._lru_key(key)
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, json.dumps(entry), ex=ttl)
+        pipe.zadd(lru_key, {key: time.time()})
+        pipe.execute()
+
+        overflow = self.client.zcard(lru_key) - self.max_entries
+        if overflow > 0:
+            evicted = self.client.zrange(lru_key, 0, overflow - 1)
+            pipe = self.client.pipeline()
+            pipe.delete(*[self.prefix + k for k in evicted])
+            pipe.zrem(lru_key, *evicted)
+            pipe.execute()
+
+    def prompts(self, namespace: str) -> List[Tuple[str, str]]:
+        keys = self.client.zrange(self.prefix + "lru:" + namespace, 0, -1)
+        if not keys:
+            return []
+        values = self.client.mget([self.prefix + k for k in keys])
+        return [(key, json.loads(raw)["prompt"]) for key, raw in zip(keys, values) if raw is not None]
+
+    def clear(self):
+        keys = list(self.client.scan_iter(self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+def _polarity(normalized_prompt: str) -> frozenset:
+    return POLARITY_WORDS.intersection(normalized_prompt.split())
+
+class SimilarityIndex:
+    """TF-IDF vectors of the cached prompts in one namespace"""
+
+    def __init__(self, keys: List[str], prompts: List[str]):
+        feature_extraction = lazy_import("sklearn.feature_extraction.text")
+        self.keys = keys
+        self.prompts = prompts
+        self.polarities = [_polarity(prompt) for prompt in prompts]
+        self.vectorizer = feature_extraction.TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True,
+                                                             stop_words=sorted(STOP_WORDS))
+        self.matrix = self.vectorizer.fit_transform(prompts)
+        self.analyzer = self.vectorizer.build_analyzer()
+        self.vocabulary = self.vectorizer.vocabulary_
+        self.idf = self.vectorizer.idf_
+        # idf a term would get if it appeared in no cached prompt (smooth_idf=True)
+        self.unseen_idf = math.log(len(prompts) + 1) + 1
+
+    def _coverage(self, terms: List[str]) -> float:
+        """
+        Share of the query's TF-IDF norm made of terms the index knows
+
+        transform() silently drops unseen terms, so "data scientist in jakarta"
+        would score 1.0 against "data scientist". Scaling the cosine by this
+        factor counts the unseen words as a mismatch.
+        """
+        known = unseen = 0.0
+        for term, count in Counter(terms).items():
+            index = self.vocabulary.get(term)
+            idf = self.idf[index] if index is not None else self.unseen_idf
+            weight = ((1 + math.log(count)) * idf) ** 2
+            if index is None:
+                unseen += weight
+            else:
+                known += weight
+        return math.sqrt(known / (known + unseen)) if known else 0.0
+
+    def best_match(self, normalized_prompt: str) -> Tuple[Optional[str], float]:
+        """Key and cosine score of the closest cached prompt"""
+        terms = self.analyzer(normalized_prompt)
+        query = self.vectorizer.transform([normalized_prompt])
+        if query.nnz == 0:
+            return None, 0.0
+        # TfidfVectorizer rows are L2-normalised, so the dot product is the cosine
+        scores = (self.matrix @ query.T).toarray().ravel()
+        polarity = _polarity(normalized_prompt)
+        for position, other in enumerate(self.polarities):
+            if scores[position] and other != polarity:
+                scores[position] = 0.0
+        best = int(scores.argmax())
+        if not scores[best]:
+            return None, 0.0
+        return self.keys[best], float(scores[best]) * self._coverage(terms)
+
+class ResponseCache:
+    """
+    Exact + similarity answer cache over a pluggable backend
+
+    Args:
+        backend: MemoryBackend, SQLiteBackend or RedisBackend
+        ttl: Seconds an answer stays valid
+        similarity_threshold: Minimum TF-IDF cosine for a near-duplicate hit; None disables the layer
+        index_refresh: Seconds before the similarity index re-reads a shared backend
+    """
+
+    def __init__(self, backend=None, ttl: float = DEFAULT_TTL, similarity_threshold: float = DEFAULT_SIMILARITY,
+                 index_refresh: float = 30.0):
+        self.backend = backend or MemoryBackend()
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.index_refresh = index_refresh
+        self.stats = {"exact_hits": 0, "similar_hits": 0, "misses": 0, "stores": 0}
+        self._indexes: Dict[str, Tuple[float, Optional[SimilarityIndex]]] = {}
+        self._lock = threading.Lock()
+
+    def _similarity_available(self) -> bool:
+        if self.similarity_threshold is None:
+            return False
+        try:
+            lazy_import("sklearn.feature_extraction.text").TfidfVectorizer
+        except ImportError:
+            self.similarity_threshold = None
+            return False
+        return True
+
+    def _index(self, namespace: str) -> Optional[SimilarityIndex]:
+        with self._lock:
+            built_at, index = self._indexes.get(namespace, (0.0, None))
+            if time.monotonic() - built_at < self.index_refresh:
+                return index
+        entries = self.backend.prompts(namespace)
+        index = None
+        if entries:
+            try:
+                index = SimilarityIndex(*map(list, zip(*entries)))
+            except ValueError:
+                # Empty vocabulary: every cached prompt is only stop words ("Why?"); nothing to match
+                index = None
+        with self._lock:
+            self._indexes[namespace] = (time.monotonic(), index)
+        return index
+
+    def get(self, prompt: str, namespace: str = "") -> Optional[Tuple[str, str]]:
+        """Return (response, "exact" | "similar") or None on a miss"""
+        normalized = normalize_prompt(prompt)
+        entry = self.backend.get(make_key(namespace, normalized))
+        if entry is not None:
+            self.stats["exact_hits"] += 1
+            return entry["response"], "exact"
+
+        if self._similarity_available():
+            index = self._index(namespace)
+            if index is not None:
+                key, score = index.best_match(normalized)
+                if key is not None and score >= self.similarity_threshold:
+                    entry = self.backend.get(key)
+                    if entry is not None:
+                        self.stats["similar_hits"] += 1
+                        return entry["response"], "similar"
+
+        self.stats["misses"] += 1
+        return None
+
+    def set(self, prompt: str, response: str, namespace: str = ""):
+        normalized = normalize_prompt(prompt)
+        now = time.time()
+        self.backend.set(make_key(namespace, normalized), {
+            "prompt": normalized,
+            "response": response,
+            "created": now,
+            "expires": now + self.ttl
+        })
+        self.stats["stores"] += 1
+        with self._lock:
+            # Rebuild on the next lookup so the new prompt is matchable straight away
+            self._indexes.pop(namespace, None)
+
+    def clear(self):
+        self.backend.clear()
+        with self._lock:
+            self._indexes.clear()
+
+def create_backend(kind: str = None):
+    """Backend from RESPONSE_CACHE_BACKEND (memory | sqlite | redis), defaulting to memory"""
+    kind = (kind or os.getenv("RESPONSE_CACHE_BACKEND", "memory")).lower()
+    max_entries = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    if kind == "sqlite":
+        return SQLiteBackend(os.getenv("RESPONSE_CACHE_PATH", DEFAULT_SQLITE_PATH), max_entries)
+    if kind == "redis":
+        return RedisBackend(os.getenv("REDIS_URL"), max_entries)
+    return MemoryBackend(max_entries)
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide cache configured from RESPONSE_CACHE_* environment variables"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache(
+                    create_backend(),
+                    ttl=float(os.getenv("RESPONSE_CACHE_TTL", DEFAULT_TTL)),
+                    similarity_threshold=float(os.getenv("RESPONSE_CACHE_SIMILARITY", DEFAULT_SIMILARITY))
+                )
+    return _cache
+
+# Export functions
+__all__ = [
+    'ResponseCache',
+    'MemoryBackend',
+    'SQLiteBackend',
+    'RedisBackend',
+    'SimilarityIndex',
+    'normalize_prompt',
+    'make_namespace',
+    'create_backend',
+    'get_response_cache'
+]
@@ -0,0 +1,393 @@
+# utils/simulation.py - Career simulation scenarios and path adjustment
+"""
+Streamlit-free simulation logic shared by pages/1_Career_Simulation.py,
+benchmarks and batch tools.
+
+Scenarios are immutable. Each Scenario keeps its steps in a StepTable of
+read-only NumPy columns, and is built once per catalog snapshot (see
+get_scenarios). Every session shares the same objects without copying.
+Adjustments return new Scenario/StepTable views that reuse the unchanged
+columns, so a cached scenario is never mutated.
+
+simulate_career_path gives the single deterministic plan shown step by step.
+monte_carlo_simulation samples many trajectories around that plan and reports
+percentile bands for time, payback, ROI and final salary.
+"""
+
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from utils.catalog import current_snapshot, get_section, register_index, thaw
+
+DEFAULT_TRAJECTORIES = 100_000
+PERCENTILES = (10, 50, 90)
+
+# Spread of the lognormal noise applied to each sampled quantity
+DURATION_SIGMA = 0.25
+COST_SIGMA = 0.20
+SALARY_SIGMA = 0.12
+
+# Sweep axes, matching the Career Simulation sidebar inputs
+SWEEP_SALARIES = np.arange(30000, 200001, 5000)
+SWEEP_EXPERIENCE = (0, 1, 2)
+
+def _read_only(values: Sequence, dtype) -> np.ndarray:
+    array = np.array(values, dtype=dtype)
+    array.flags.writeable = False
+    return array
+
+def _is_frozen(values) -> bool:
+    return isinstance(values, np.ndarray) and not values.flags.writeable
+
+class StepTable:
+    """
+    Learning steps as read-only columns: months, costs, hours and activities
+
+    Indexing or iterating yields read-only step mappings with the catalog's
+    keys (month, activity, cost, time_hours). Use the columns directly for
+    charts and totals.
+    """
+
+    __slots__ = ("months", "costs", "hours", "activities", "_rescaled")
+
+    def __init__(self, months: Sequence[int], costs: Sequence[int], hours: Sequence[int],
+                 activities: Sequence[str]):
+        for name, values in (("months", months), ("costs", costs), ("hours", hours)):
+            object.__setattr__(self, name, values if _is_frozen(values) else _read_only(values, np.int64))
+        object.__setattr__(self, "activities", tuple(activities))
+        object.__setattr__(self, "_rescaled", {})
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError("StepTable is immutable; use with_months()")
+
+    @classmethod
+    def from_steps(cls, steps: Sequence[Mapping]) -> "StepTable":
+        return cls(
+            [step['month'] for step in steps],
+            [step['cost'] for step in steps],
+            [step['time_hours'] for step in steps],
+            [step['activity'] for step in steps]
+        )
+
+    def with_months(self, months: Sequence[int]) -> "StepTable":
+        """New table with rescheduled months; the other columns are shared"""
+        return StepTable(_read_only(months, np.int64), self.costs, self.hours, self.activities)
+
+    def rescaled(self, factor: float) -> "StepTable":
+        """
+        Months multiplied by `factor` (truncated, at least 1)
+
+        The result is memoized per factor; a table shared across sessions is
+        rescheduled once, not on every simulation.
+        """
+        table = self._rescaled.get(factor)
+        if table is None:
+            table = self._rescaled[factor] = self.with_months(
+                np.maximum(1, (self.months * factor).astype(np.int64))
+            )
+        return table
+
+    def __len__(self) -> int:
+        return len(self.activities)
+
+    def __getitem__(self, index: int) -> Mapping:
+        return MappingProxyType({
+            'month': int(self.months[index]),
+            'activity': self.activities[index],
+            'cost': int(self.costs[index]),
+            'time_hours': int(self.hours[index])
+        })
+
+    def __iter__(self) -> Iterator[Mapping]:
+        return (self[i] for i in range(len(self)))
+
+    def total_cost(self) -> int:
+        return int(self.costs.sum())
+
+    def total_hours(self) -> int:
+        return int(self.hours.sum())
+
+    def records(self) -> List[Dict]:
+        """Plain step dicts (for JSON export)"""
+        return [dict(step) for step in self]
+
+class Scenario:
+    """
+    Immutable career transition scenario
+
+    Read it like the catalog mapping (scenario['success_rate'],
+    scenario.get('skills_gained')) or through attributes. replace() returns a
+    new Scenario that shares every field it does not change.
+    """
+
+    __slots__ = ("_fields",)
+
+    FIELDS = ("name", "description", "duration", "difficulty", "investment", "success_rate",
+              "steps", "salary_progression", "skills_gained")
+
+    def __init__(self, **fields):
+        object.__setattr__(self, "_fields", MappingProxyType(fields))
+
+    @classmethod
+    def from_mapping(cls, data: Mapping, name: str = "") -> "Scenario":
+        """Scenario from a catalog entry (plain or frozen)"""
+        return cls(
+            name=data.get('name', name),
+            description=data.get('description', ""),
+            duration=data.get('duration', ""),
+            difficulty=data.get('difficulty', ""),
+            investment=data.get('investment', ""),
+            success_rate=data['success_rate'],
+            steps=data['steps'] if isinstance(data['steps'], StepTable) else StepTable.from_steps(data['steps']),
+            salary_progression=tuple(data['salary_progression']),
+            skills_gained=tuple(data.get('skills_gained', ()))
+        )
+
+    def replace(self, **changes) -> "Scenario":
+        return Scenario(**{**self._fields, **changes})
+
+    def __getattr__(self, name: str):
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError("Scenario is immutable; use replace()")
+
+    def __getitem__(self, key: str):
+        return self._fields[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default=None):
+        return self._fields.get(key, default)
+
+    def keys(self):
+        return self._fields.keys()
+
+    def items(self):
+        return self._fields.items()
+
+    def values(self):
+        return self._fields.values()
+
+    def __repr__(self) -> str:
+        return f"Scenario({self._fields.get('name')!r}, {len(self.steps)} steps)"
+
+def get_simulation_data() -> Dict:
+    """Get career simulation scenarios and data (plain dict copy of the catalog section)"""
+    return thaw(get_section("simulation"))
+
+def _build_scenarios(catalog: Mapping) -> Mapping:
+    return MappingProxyType({
+        name: Scenario.from_mapping(data, name)
+        for name, data in catalog["simulation"].get("scenarios", {}).items()
+    })
+
+register_index("simulation_scenarios", _build_scenarios)
+
+def get_scenarios() -> Mapping:
+    """Scenario objects for the current catalog snapshot, shared across sessions"""
+    return current_snapshot().index("simulation_scenarios")
+
+def simulate_career_path(scenario_data: Mapping, user_params: Dict) -> Scenario:
+    """
+    Simulate career path with user parameters
+
+    Returns a new Scenario. The input (a Scenario or a catalog mapping) is never
+    modified; only the rescheduled months and success rate are new.
+    """
+    scenario = scenario_data if isinstance(scenario_data, Scenario) else Scenario.from_mapping(scenario_data)
+    time_multiplier = user_params.get('time_commitment', 1.0)
+    experience_bonus = user_params.get('experience_level', 0)
+
+    steps = scenario.steps
+    if time_multiplier < 0.5:
+        steps = steps.rescaled(1.5)
+    elif time_multiplier > 1.5:
+        steps = steps.rescaled(0.7)
+
+    return scenario.replace(
+        steps=steps,
+        success_rate=min(95, scenario.success_rate + experience_bonus * 10)
+    )
+
+def _bands(values: np.ndarray) -> Dict[str, float]:
+    # "nearest" picks real samples, so bands stay finite or inf instead of nan between inf values
+    p10, p50, p90 = np.percentile(values, PERCENTILES, method="nearest")
+    return {"p10": float(p10), "p50": float(p50), "p90": float(p90)}
+
+def monte_carlo_simulation(scenario_data: Dict, user_params: Dict, n_trajectories: int = DEFAULT_TRAJECTORIES,
+                           seed: Optional[int] = None) -> Dict:
+    """
+    Sample career trajectories around the adjusted scenario
+
+    Every step's duration and cost get independent lognormal noise around the
+    plan from simulate_career_path. Each trajectory then succeeds with the
+    adjusted success rate. A successful transition ends at the scenario's
+    final salary, also with noise. A failed one stays at the current salary.
+    Payback and ROI use the page's definitions: total cost over the monthly
+    (or yearly) salary gain. Payback is inf when there is no gain.
+
+    Args:
+        scenario_data: Scenario from get_scenarios() (or a catalog scenario mapping)
+        user_params: Same parameters as simulate_career_path; current_salary
+            defaults to the first salary_progression value
+        n_trajectories: Number of sampled trajectories
+        seed: Seed for numpy's default_rng; equal seeds give equal results
+
+    Returns:
+        {"trajectories", "success_probability", "payback_reached", "bands"}
+        where bands maps months, total_cost, payback_months, roi and
+        final_salary to {"p10", "p50", "p90"}
+    """
+    adjusted = simulate_career_path(scenario_data, user_params)
+    rng = np.random.default_rng(seed)
+
+    # Each step lasts until the next one starts; the last step takes one month
+    step_months = np.diff(adjusted.steps.months, prepend=0).clip(min=1).astype(float)
+    step_costs = adjusted.steps.costs.astype(float)
+    shape = (n_trajectories, len(step_months))
+
+    # mean=-sigma²/2 keeps each lognormal factor's expectation at 1
+    total_months = (step_months * rng.lognormal(-DURATION_SIGMA ** 2 / 2, DURATION_SIGMA, shape)).sum(axis=1)
+    total_cost = (step_costs * rng.lognormal(-COST_SIGMA ** 2 / 2, COST_SIGMA, shape)).sum(axis=1)
+
+    current_salary = float(user_params.get('current_salary', adjusted.salary_progression[0]))
+    target_salary = float(adjusted.salary_progression[-1])
+    succeeded = rng.random(n_trajectories) < adjusted.success_rate / 100
+    final_salary = np.where(
+        succeeded,
+        target_salary * rng.lognormal(-SALARY_SIGMA ** 2 / 2, SALARY_SIGMA, n_trajectories),
+        current_salary
+    )
+
+    gain = final_salary - current_salary
+    with np.errstate(divide='ignore', invalid='ignore'):
+        roi = np.where(total_cost > 0, gain / total_cost, 0.0)
+        payback_months = np.where(gain > 0, total_cost / (gain / 12), np.inf)
+
+    return {
+        "trajectories": n_trajectories,
+        "success_probability": float(succeeded.mean()),
+        "payback_reached": float(np.isfinite(payback_months).mean()),
+        "bands": {
+            "months": _bands(total_months),
+            "total_cost": _bands(total_cost),
+            "payback_months": _bands(payback_months),
+            "roi": _bands(roi),
+            "final_salary": _bands(final_salary),
+        }
+    }
+
+class SweepGrid:
+    """
+    Page outcomes for one scenario over every salary and experience level
+
+    Only the inputs that move the outcome are swept. Time commitment as
+    mapped by the page (0.5/1.0/1.5) never crosses simulate_career_path's
+    rescheduling thresholds, and the learning budget does not enter ROI, so
+    both would be flat axes. Every metric is a read-only array of shape
+    (salary, experience); axes a metric does not depend on are broadcast
+    views, not copies:
+
+    - roi: first-year salary gain over total cost
+    - payback_months: total cost over the monthly gain (inf without a gain)
+    - success_rate: adjusted success rate in percent
+    - risk_adjusted_roi: roi weighted by the success rate
+    - breakeven_month: last learning month plus payback_months
+    """
+
+    METRICS = ("roi", "payback_months", "success_rate", "risk_adjusted_roi", "breakeven_month")
+    AXES = ("salary", "experience")
+
+    def __init__(self, scenario: Scenario):
+        self.scenario = scenario
+        self.salaries = SWEEP_SALARIES
+        self.experience = np.array(SWEEP_EXPERIENCE)
+        shape = (len(self.salaries), len(self.experience))
+
+        # The success rule stays in simulate_career_path; one call per experience level
+        adjusted = [simulate_career_path(scenario, {'experience_level': int(e)}) for e in self.experience]
+        self.total_cost = scenario.steps.total_cost()
+        final_salary = scenario.salary_progression[-1]
+        success = np.array([row.success_rate for row in adjusted], dtype=float)
+        program_months = float(scenario.steps.months.max())
+
+        gain = final_salary - self.salaries.astype(float)
+        roi = gain / self.total_cost if self.total_cost > 0 else np.zeros_like(gain)
+        with np.errstate(divide='ignore'):
+            payback = np.where(gain > 0, self.total_cost / (gain / 12), np.inf)
+
+        # Shape each metric on its own axes, then broadcast to the full grid
+        metrics = {
+            "roi": roi[:, None],
+            "payback_months": payback[:, None],
+            "success_rate": success[None, :],
+            "risk_adjusted_roi": roi[:, None] * success[None, :] / 100,
+            "breakeven_month": payback[:, None] + program_months,
+        }
+        for name, values in metrics.items():
+            setattr(self, name, np.broadcast_to(values, shape))
+
+    def index(self, current_salary: float, experience_level: int) -> tuple:
+        """Grid position nearest to the given inputs"""
+        return tuple(int(np.abs(axis - value).argmin()) for axis, value in (
+            (self.salaries, current_salary), (self.experience, experience_level)
+        ))
+
+    def lookup(self, current_salary: float, experience_level: int) -> Dict[str, float]:
+        """All metrics at the nearest grid point"""
+        position = self.index(current_salary, experience_level)
+        return {name: getattr(self, name)[position].item() for name in self.METRICS}
+
+    def sensitivity(self, metric: str, current_salary: float, experience_level: int) -> Dict[str, tuple]:
+        """
+        (low, high) of `metric` when one input sweeps its whole range and the other stays put
+
+        Keys are salary and experience, for tornado charts.
+        """
+        position = self.index(current_salary, experience_level)
+        values = getattr(self, metric)
+        swings = {}
+        for axis, name in enumerate(self.AXES):
+            line = values[position[:axis] + (slice(None),) + position[axis + 1:]].astype(float)
+            line = line[np.isfinite(line)]
+            swings[name] = (float(line.min()), float(line.max())) if line.size else (np.inf, np.inf)
+        return swings
+
+# Grids are filled in per scenario on first use, from the snapshot's shared Scenario objects
+register_index("simulation_sweeps", lambda catalog: {})
+
+def get_sweep_grid(scenario_name: str) -> SweepGrid:
+    """Sweep for a scenario in the current catalog snapshot, computed once per snapshot"""
+    snapshot = current_snapshot()
+    sweeps = snapshot.index("simulation_sweeps")
+    grid = sweeps.get(scenario_name)
+    if grid is None:
+        scenario = snapshot.index("simulation_scenarios")[scenario_name]
+        grid = sweeps.setdefault(scenario_name, SweepGrid(scenario))
+    return grid
+
+# Export functions
+__all__ = [
+    'Scenario',
+    'StepTable',
+    'get_scenarios',
+    'get_simulation_data',
+    'simulate_career_path',
+    'monte_carlo_simulation',
+    'SweepGrid',
+    'get_sweep_grid',
+    'DEFAULT_TRAJECTORIES'
+]